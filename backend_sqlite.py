@@ -3,7 +3,7 @@ import sqlite3
 import uuid
 from fastapi import FastAPI, Query, UploadFile, File, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import Response
+from fastapi.responses import Response, JSONResponse, ORJSONResponse
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
@@ -12,14 +12,21 @@ import json
 from apscheduler.schedulers.background import BackgroundScheduler
 from typing import Optional
 from datetime import datetime, timedelta
-import pandas as pd
 import io
+import logging
+import shutil
+import sys
+import tempfile
 import pytz
-import time
 import re
 from dateutil import parser
 from contextlib import asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urljoin
+from collections.abc import MutableMapping
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
 import traceback
 
 
@@ -71,6 +78,43 @@ except ImportError:
     GCS_AVAILABLE = False
     print("⚠️ Google Cloud Storage library not available - using local storage")
 
+# BeautifulSoup parser: lxml is several times faster than the stdlib parser on the
+# large events pages, but keep working on deploys where it is not installed
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+# BeautifulSoup is imported once here rather than in each scraper; the scrapers check for
+# None so the API still starts on a deploy without beautifulsoup4
+try:
+    from bs4 import BeautifulSoup, SoupStrainer
+except ImportError:
+    BeautifulSoup = SoupStrainer = None
+
+# orjson parses the large fallback and scraped JSON several times faster than the stdlib;
+# optional like lxml, so deploys without it keep using json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _parse_json(raw):
+    """json.loads for str or bytes, through orjson when it is installed"""
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # orjson is stricter (e.g. NaN, which json.dump writes for missing values), let json decide
+            pass
+    return json.loads(raw)
+
+# One pooled session for the requests-based scrapers, so repeated calls to seniorskingston.ca
+# reuse keep-alive connections instead of paying DNS and TLS setup each time
+SCRAPE_SESSION = requests.Session()
+SCRAPE_SESSION.mount('https://', requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
 # Use environment variable for port, default to 8000 (Render uses PORT env var)
 PORT = int(os.environ.get("PORT", 8000))
 
@@ -78,6 +122,31 @@ PORT = int(os.environ.get("PORT", 8000))
 # On Render, use /tmp for persistent storage, or project root
 DB_PATH = "/tmp/class_cancellations.db" if os.getenv('RENDER') else "class_cancellations.db"
 
+# One long-lived connection per thread for the programs hot paths, so sqlite's page cache and
+# prepared-statement cache survive between calls instead of starting cold on every connect
+_db_local = threading.local()
+
+def _get_db_connection():
+    """This thread's shared connection to DB_PATH. Don't close it; commit or roll back what you start."""
+    conn = getattr(_db_local, "conn", None)
+    if conn is None:
+        conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+        # WAL with synchronous=NORMAL syncs once at commit rather than per journal write, and
+        # the larger in-memory cache keeps the programs pages hot across calls
+        conn.executescript("PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL; PRAGMA temp_store=MEMORY; PRAGMA cache_size=-65536;")
+        _db_local.conn = conn
+    return conn
+
+# Request logging for the event endpoints. Per-request chatter is logged at DEBUG, so it costs
+# nothing unless LOG_LEVEL=DEBUG; messages keep the bare print-style format.
+logger = logging.getLogger(__name__)
+if not logger.handlers:
+    _log_handler = logging.StreamHandler(sys.stdout)
+    _log_handler.setFormatter(logging.Formatter('%(message)s'))
+    logger.addHandler(_log_handler)
+    logger.propagate = False
+logger.setLevel(os.getenv('LOG_LEVEL', 'INFO').upper())
+
 # Set timezone to Kingston, Ontario
 KINGSTON_TZ = pytz.timezone('America/Toronto')
 utc = pytz.UTC
@@ -105,7 +174,6 @@ def get_gcs_client():
         gcs_creds_json = os.getenv('GCS_CREDENTIALS')
         if gcs_creds_json:
             try:
-                import tempfile
                 # Write the JSON to a temp file
                 creds_data = json.loads(gcs_creds_json)
                 
@@ -457,7 +525,6 @@ def calculate_withdrawal(date_range: str, class_cancellation: str) -> str:
             # Try to extract just the month and day if all else fails
             try:
                 # Look for patterns like "Sep 9" or "September 9"
-                import re
                 month_day_match = re.search(r'([A-Za-z]+)\s+(\d+)', start_date_str)
                 if month_day_match:
                     month_str = month_day_match.group(1)
@@ -594,7 +661,6 @@ def calculate_withdrawal(date_range: str, class_cancellation: str) -> str:
         print(f"❌ Error calculating withdrawal: {e}")
         print(f"🔍 Date range: '{date_range}'")
         print(f"🔍 Class cancellation: '{class_cancellation}'")
-        import traceback
         print(f"📋 Full error traceback:")
         traceback.print_exc()
         return "Unknown"
@@ -664,6 +730,8 @@ def ensure_programs_schema():
 def import_excel_data(file_path_or_content):
     """Import data from Excel file into SQLite database"""
     try:
+        import pandas as pd  # Heavy import, only needed when an Excel file is processed
+        
         # Handle both file path (string) and file content (bytes)
         if isinstance(file_path_or_content, str):
             # It's a file path, read directly
@@ -815,7 +883,7 @@ def get_programs_from_db(
     has_cancellation: Optional[bool] = False
 ):
     """Get programs from SQLite database with filters"""
-    conn = sqlite3.connect(DB_PATH)
+    conn = _get_db_connection()
     cursor = conn.cursor()
     
     # Build query
@@ -907,8 +975,6 @@ def get_programs_from_db(
             'session': row[15] if len(row) > 15 else ''  # Added session column
         })
     
-    conn.close()
-    
     # CRITICAL FIX: Auto-load Excel fallback when database is empty
     if not programs or len(programs) == 0:
         print("⚠️ No Excel programs found in database - attempting to restore from fallback...")
@@ -920,7 +986,7 @@ def get_programs_from_db(
             if restore_success:
                 print(f"✅ Restored {len(fallback_programs)} programs from fallback to database")
                 # Re-query database to get restored programs
-                conn = sqlite3.connect(DB_PATH)
+                conn = _get_db_connection()
                 cursor = conn.cursor()
                 cursor.execute("SELECT * FROM programs")
                 rows = cursor.fetchall()
@@ -943,7 +1009,6 @@ def get_programs_from_db(
                         'fee': row[14],
                         'session': row[15] if len(row) > 15 else ''
                     })
-                conn.close()
             else:
                 # If restore failed, at least return fallback data for display
                 print(f"⚠️ Restore to database failed, but returning fallback data for display")
@@ -1025,6 +1090,8 @@ async def lifespan_handler(app: FastAPI):
         scheduler.add_job(scheduled_daily_report, 'cron', hour=9, minute=0)
         # Weekly report every Monday at 10:00 AM  
         scheduler.add_job(scheduled_weekly_report, 'cron', day_of_week=0, hour=10, minute=0)
+        # DISABLED: automatic website sync, to prevent data changes
+        # start_auto_sync(scheduler)
         scheduler.start()
         print("✅ Background scheduler started")
     except Exception as e:
@@ -1041,26 +1108,81 @@ async def lifespan_handler(app: FastAPI):
         except Exception as e:
             print(f"⚠️ Error stopping scheduler: {e}")
 
-# Create FastAPI app with lifespan
-app = FastAPI(title="Program Schedule Update API", lifespan=lifespan_handler)
+# Create FastAPI app with lifespan. Endpoints return large program/event lists, so serialize
+# responses with orjson when it is installed (same JSON, much less CPU than the json module)
+app = FastAPI(
+    title="Program Schedule Update API",
+    lifespan=lifespan_handler,
+    default_response_class=ORJSONResponse if orjson is not None else JSONResponse,
+)
 
 # Add CORS middleware
+# The origin regex covers the Render frontend and local development, so no
+# separate allow_origins list is needed. OPTIONS preflights are handled by the
+# middleware itself, and only the headers the frontend actually sends are allowed.
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[
-        "https://class-cancellation-frontend.onrender.com",
-        "https://class-cancellation-frontend.onrender.com/",
-        "http://localhost:3000",  # For local development
-        "https://localhost:3000"   # For local development
-    ],
     allow_credentials=True,
-    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-    allow_headers=["*"],
-    allow_origin_regex=r"https://.*\.onrender\.com",
+    allow_methods=["GET", "POST", "PUT", "DELETE"],
+    allow_headers=["Accept", "Authorization", "Cache-Control", "Content-Type", "Pragma"],
+    allow_origin_regex=r"^https://([a-z0-9-]+\.)?onrender\.com$|^https?://localhost:3000$",
 )
 
-# In-memory storage for editable events (in production, this would be a database)
-editable_events = {}
+class SqliteDict(MutableMapping):
+    """Dict-like store of JSON-serialisable values kept in a SQLite table.
+
+    Shared by every worker process that points at the same database file, so
+    edits survive restarts and stay consistent behind a load balancer.
+    Values are returned as copies: write them back after mutating.
+    """
+
+    def __init__(self, db_path, table):
+        self._table = table
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(f"CREATE TABLE IF NOT EXISTS {table} (id TEXT PRIMARY KEY, data TEXT NOT NULL)")
+        self._conn.commit()
+
+    def __getitem__(self, key):
+        with self._lock:
+            row = self._conn.execute(f"SELECT data FROM {self._table} WHERE id = ?", (key,)).fetchone()
+        if row is None:
+            raise KeyError(key)
+        return json.loads(row[0])
+
+    def __setitem__(self, key, value):
+        data = json.dumps(value, ensure_ascii=False)
+        with self._lock, self._conn:
+            self._conn.execute(f"INSERT OR REPLACE INTO {self._table} (id, data) VALUES (?, ?)", (key, data))
+
+    def __delitem__(self, key):
+        with self._lock, self._conn:
+            cursor = self._conn.execute(f"DELETE FROM {self._table} WHERE id = ?", (key,))
+        if cursor.rowcount == 0:
+            raise KeyError(key)
+
+    def __contains__(self, key):
+        with self._lock:
+            row = self._conn.execute(f"SELECT 1 FROM {self._table} WHERE id = ?", (key,)).fetchone()
+        return row is not None
+
+    def __iter__(self):
+        with self._lock:
+            keys = [row[0] for row in self._conn.execute(f"SELECT id FROM {self._table}")]
+        return iter(keys)
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM {self._table}").fetchone()[0]
+
+    def values(self):
+        with self._lock:
+            rows = self._conn.execute(f"SELECT data FROM {self._table}").fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+# Editable events persisted in SQLite so edits survive restarts and are shared across workers
+editable_events = SqliteDict(DB_PATH, "editable_events")
 
 def scrape_seniors_kingston_events():
     """Scrape real events from Seniors Kingston website using the WORKING Selenium method"""
@@ -1092,16 +1214,14 @@ def scrape_seniors_kingston_events():
             
     except Exception as e:
         print(f"❌ Error in scraping: {e}")
-        import traceback
         traceback.print_exc()
         return []
 
 def scrape_from_rendered_events_page():
     """Parse events from the server-rendered events listing page."""
     try:
-        import requests
-        from bs4 import BeautifulSoup
-        import re
+        if BeautifulSoup is None:
+            raise ImportError("beautifulsoup4 is not installed")
 
         url = "https://seniorskingston.ca/events?_data=routes/events"
         headers = {
@@ -1109,12 +1229,12 @@ def scrape_from_rendered_events_page():
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
             "Accept-Language": "en-US,en;q=0.9",
         }
-        response = requests.get(url, headers=headers, timeout=30)
+        response = SCRAPE_SESSION.get(url, headers=headers, timeout=30)
         if response.status_code != 200:
             print(f"⚠️ Rendered page request failed: HTTP {response.status_code}")
             return []
 
-        soup = BeautifulSoup(response.content, "html.parser")
+        soup = BeautifulSoup(response.content, HTML_PARSER)
         links = soup.find_all("a", href=True)
         print(f"🔍 Rendered page links found: {len(links)}")
 
@@ -1201,6 +1321,98 @@ def scrape_from_rendered_events_page():
         print(f"❌ Error in rendered page scraping: {e}")
         return []
 
+# Site chrome (navigation, footer, ads) that the Selenium scraper must not treat as event titles
+SKIP_KEYWORDS = [
+    'register today', 'upcoming events', 'list view', 'calendar view',
+    'programs', 'events', 'dining', 'quick links', 'about us',
+    'enhancing the quality', 'funded by', 'close x', 'advertisement',
+    '56 francis st', 'mon - fri', 'kingston', 'latest program guide',
+    'donate', 'volunteer', 'hatter\'s menu'
+]
+SKIP_KEYWORDS_RE = re.compile('|'.join(re.escape(keyword) for keyword in SKIP_KEYWORDS), re.IGNORECASE)
+
+# Patterns used by the Selenium scraper, compiled once instead of on every call inside its loops
+# Month alternation factored on shared prefixes and non-capturing, so findall() returns whole
+# "January 20" matches. (?!\d) stops "January 2025" from reading as "January 20".
+MONTH_DATE_PATTERN = (
+    r'(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|June?|July?|Aug(?:ust)?'
+    r'|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\s+\d{1,2}(?!\d)'
+)
+MONTH_DATE_RE = re.compile(MONTH_DATE_PATTERN, re.IGNORECASE)
+DATE_TIME_PATTERNS = [
+    re.compile(r'([A-Za-z]+\s+\d{1,2},\s+\d{1,2}:\d{2}\s+(?:am|pm|AM|PM))', re.IGNORECASE),  # "November 24, 12:00 pm"
+    re.compile(r'([A-Za-z]+\s+\d{1,2},\s+\d{1,2}:\d{2})', re.IGNORECASE),  # "November 24, 12:00"
+    re.compile(r'([A-Za-z]{3}\s+\d{1,2},\s+\d{1,2}:\d{2}\s+(?:am|pm|AM|PM))', re.IGNORECASE),  # "Nov 24, 12:00 pm"
+]
+DATE_ONLY_PATTERNS = [
+    re.compile(r'([A-Za-z]+\s+\d{1,2}(?:,\s+\d{4})?)', re.IGNORECASE),  # "November 24" or "November 24, 2025"
+    re.compile(r'([A-Za-z]{3}\s+\d{1,2}(?:,\s+\d{4})?)', re.IGNORECASE),  # "Nov 24" or "Nov 24, 2025"
+]
+TIME_RE = re.compile(r'(\d{1,2}):(\d{2})\s*(am|pm)', re.IGNORECASE)
+TIME_PREFIX_RE = re.compile(r'^\d{1,2}:\d{2}')
+# Separator and optional time between a date in page text and the event text that follows it
+DATE_LEAD_RE = re.compile(r'[,\s]+(\d{1,2}:\d{2}\s*(?:am|pm))?[,\s]*', re.IGNORECASE)
+# Word lists checked as plain substrings, each folded into one case-insensitive alternation
+DESCRIPTION_WORDS_RE = re.compile(r'brings|provides|learn|join|register|call|appointment', re.IGNORECASE)
+DESCRIPTION_TITLE_RE = re.compile(r'brings|provides|learn about|join in|register call', re.IGNORECASE)
+NON_EVENT_TITLE_RE = re.compile(r'close|advertisement|register today|upcoming events|click here', re.IGNORECASE)
+EVENT_KEYWORDS_RE = re.compile(
+    r'fresh food market|legal advice|legal clinic|e-resources|500 years|workshop|meeting'
+    r'|class|event|program|seminar|lecture|session',
+    re.IGNORECASE,
+)
+# Elements whose text the Selenium scraper's date passes search
+TEXT_CANDIDATE_TAGS = frozenset(['div', 'article', 'section', 'li', 'p', 'span', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
+# Recurring events whose exact title wins over the surrounding text, in priority order
+KNOWN_EVENT_TITLES = [
+    'Fresh Food Market', 'Legal Advice', 'Legal Clinic', 'E-Resources at the Library',
+    'Cafe Franglish', "Tuesday at Tom's", '500 years'
+]
+KNOWN_EVENT_TITLES_LOWER = [(title.lower(), title) for title in KNOWN_EVENT_TITLES]
+MONTH_NUMBERS = {
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+    'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12,
+}
+
+def _month_day_key(date_str):
+    """Return (month, day) for the first 'Month D' in date_str, or None if it has no such date"""
+    match = MONTH_DATE_RE.search(date_str)
+    if not match:
+        return None
+    month_name, day = match.group(0).split()
+    return (MONTH_NUMBERS[month_name[:3].lower()], int(day))
+
+def _clean_lines(text, limit=None):
+    """Non-empty stripped lines of text, stopping once limit lines are collected"""
+    lines = []
+    for line in text.splitlines():
+        line = line.strip()
+        if line:
+            lines.append(line)
+            if limit and len(lines) >= limit:
+                break
+    return lines
+
+def _bounded_levenshtein(a, b, k):
+    """Edit distance between a and b, or k + 1 as soon as it is known to exceed k"""
+    if len(a) < len(b):
+        a, b = b, a
+    if len(a) - len(b) > k:
+        return k + 1
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char_a != char_b),
+            ))
+        if min(current) > k:
+            return k + 1
+        previous = current
+    return previous[-1] if previous[-1] <= k else k + 1
+
 def scrape_with_working_selenium():
     """The WORKING Selenium method that successfully found 46 events with banners"""
     try:
@@ -1368,15 +1580,15 @@ def scrape_with_working_selenium():
                             continue
                     
                     # Check if new events were loaded
-                    current_page_source = driver.page_source
-                    soup_temp = BeautifulSoup(current_page_source, 'html.parser')
-                    
-                    # Count events more comprehensively
-                    event_containers_temp = soup_temp.select('div[class*="event"], div[class*="card"], article, div[class*="post"], div[class*="item"], div[class*="entry"]')
-                    # Also count by looking for date patterns in text
-                    all_text = soup_temp.get_text()
-                    date_matches = len(re.findall(r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2}', all_text, re.IGNORECASE))
-                    current_event_count = max(len(event_containers_temp), date_matches // 2)  # Use higher count
+                    # Count inside the browser rather than copying page_source out and
+                    # parsing a full DOM in Python on every pagination attempt
+                    container_count, date_matches = driver.execute_script("""
+                        var containers = document.querySelectorAll('div[class*="event"], div[class*="card"], article, div[class*="post"], div[class*="item"], div[class*="entry"]');
+                        var text = document.body ? document.body.textContent : '';
+                        var dates = text.match(/(January|February|March|April|May|June|July|August|September|October|November|December)\\s+\\d{1,2}/gi);
+                        return [containers.length, dates ? dates.length : 0];
+                    """)
+                    current_event_count = max(container_count, date_matches // 2)  # Use higher count
                     
                     if current_event_count > previous_event_count:
                         print(f"   📊 Loaded more events: {previous_event_count} → {current_event_count}")
@@ -1417,7 +1629,7 @@ def scrape_with_working_selenium():
                     print(f"⚠️ Could not save debug file: {e}")
                 
                 # Parse the HTML
-                soup = BeautifulSoup(page_source, 'html.parser')
+                soup = BeautifulSoup(page_source, HTML_PARSER)
                 
                 # Look for event containers
                 print("🔍 Looking for event containers...")
@@ -1448,86 +1660,124 @@ def scrape_with_working_selenium():
                 
                 events_found = []
                 seen_event_keys = set()  # Track seen events to avoid duplicates
+                titles_by_date = {}  # (month, day) -> lowercased titles already found on that date
+                
+                def add_event(event, event_key):
+                    """Record a found event and index its title by date for duplicate checks; event_key is (title_lower, date_str, time_str)"""
+                    events_found.append(event)
+                    seen_event_keys.add(event_key)
+                    date_key = _month_day_key(event['dateStr'])
+                    if date_key:
+                        titles_by_date.setdefault(date_key, []).append(event_key[0])
                 
-                # First pass: Use selectors
-                for selector in event_selectors:
-                    containers = soup.select(selector)
-                    if containers:
-                        print(f"   Found {len(containers)} elements with selector: {selector}")
+                # Stripped text per element for the duration of this scrape. Containers nest, so the
+                # same element is otherwise re-extracted for every container that holds it.
+                stripped_texts = {}
+                
+                def stripped_text(elem):
+                    """elem.get_text(strip=True), computed at most once per element"""
+                    key = id(elem)
+                    if key not in stripped_texts:
+                        stripped_texts[key] = elem.get_text(strip=True)
+                    return stripped_texts[key]
+                
+                # First pass: one union query over all selectors, so the DOM is walked once
+                # and a container matching several selectors is only visited once
+                containers = soup.select(', '.join(event_selectors))
+                if containers:
+                    print(f"   Found {len(containers)} elements matching {len(event_selectors)} event selectors")
                         
-                        # Check ALL containers
-                        for i, container in enumerate(containers):
-                            # Look for images in this container
-                            images = container.find_all('img')
-                            if images:
-                                print(f"      Container {i+1} has {len(images)} images")
+                    # Check ALL containers
+                    for i, container in enumerate(containers):
+                        # Look for images in this container
+                        images = container.find_all('img')
+                        if images:
+                            print(f"      Container {i+1} has {len(images)} images")
                                 
-                                # Look for text content that might be event titles
-                                text_elements = container.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'p', 'span', 'div'])
-                                text_content = []
-                                for elem in text_elements:
-                                    text = elem.get_text(strip=True)
-                                    if text and len(text) > 5 and len(text) < 100:
-                                        text_content.append(text)
+                            # Look for text content that might be event titles
+                            text_elements = container.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'p', 'span', 'div'])
+                            text_content = []
+                            for elem in text_elements:
+                                text = stripped_text(elem)
+                                if text and len(text) > 5 and len(text) < 100:
+                                    text_content.append(text)
                                 
-                                if text_content:
-                                    print(f"         Text content: {text_content[:3]}")  # First 3 text elements
+                            if text_content:
+                                print(f"         Text content: {text_content[:3]}")  # First 3 text elements
                                     
-                                    # Try to extract event information
-                                    for img in images:
-                                        img_src = img.get('src', '')
-                                        img_alt = img.get('alt', '')
+                                # Try to extract event information
+                                for img in images:
+                                    img_src = img.get('src', '')
+                                    img_alt = img.get('alt', '')
                                         
-                                        if img_src:
-                                            # Convert relative URL to absolute
-                                            if img_src.startswith('/'):
-                                                img_src = f"https://seniorskingston.ca{img_src}"
-                                            elif not img_src.startswith('http'):
-                                                img_src = f"https://seniorskingston.ca/{img_src}"
-                                            
-                                            # Use the first text element as title
-                                            title = text_content[0] if text_content else img_alt
+                                    if img_src:
+                                        # Convert relative URL to absolute
+                                        if img_src.startswith('/'):
+                                            img_src = f"https://seniorskingston.ca{img_src}"
+                                        elif not img_src.startswith('http'):
+                                            img_src = f"https://seniorskingston.ca/{img_src}"
                                             
-                                            # Filter out non-event items
-                                            skip_keywords = [
-                                                'register today', 'upcoming events', 'list view', 'calendar view',
-                                                'programs', 'events', 'dining', 'quick links', 'about us',
-                                                'enhancing the quality', 'funded by', 'close x', 'advertisement',
-                                                '56 francis st', 'mon - fri', 'kingston', 'latest program guide',
-                                                'donate', 'volunteer', 'hatter\'s menu'
-                                            ]
+                                        # Use the first text element as title
+                                        title = text_content[0] if text_content else img_alt
                                             
-                                            title_lower = title.lower()
-                                            if any(keyword in title_lower for keyword in skip_keywords):
-                                                continue  # Skip this item, it's not an actual event
+                                        # Filter out non-event items
+                                        if SKIP_KEYWORDS_RE.search(title):
+                                            continue  # Skip this item, it's not an actual event
+                                        if len(title) <= 5:
+                                            continue  # Too short to be a real event title
                                             
-                                            # Parse date and time from text content
-                                            date_str = "TBD"
-                                            time_str = "TBD"
-                                            start_date = datetime.now()
-                                            end_date = datetime.now()
+                                        # Parse date and time from text content
+                                        date_str = "TBD"
+                                        time_str = "TBD"
+                                        start_date = datetime.now()
+                                        end_date = datetime.now()
                                             
-                                            # Look for date/time patterns in text content
+                                        # Look for date/time patterns in text content
                                             
-                                            # Combine all text content to search for date/time
-                                            full_text = ' '.join(text_content)
+                                        # Combine all text content to search for date/time
+                                        full_text = ' '.join(text_content)
                                             
-                                            # Look for date patterns like "November 24, 12:00 pm" or "Nov 24, 12:00 pm"
-                                            date_time_patterns = [
-                                                r'([A-Za-z]+\s+\d{1,2},\s+\d{1,2}:\d{2}\s+(?:am|pm|AM|PM))',  # "November 24, 12:00 pm"
-                                                r'([A-Za-z]+\s+\d{1,2},\s+\d{1,2}:\d{2})',  # "November 24, 12:00"
-                                                r'([A-Za-z]{3}\s+\d{1,2},\s+\d{1,2}:\d{2}\s+(?:am|pm|AM|PM))',  # "Nov 24, 12:00 pm"
-                                            ]
+                                        # Look for date patterns like "November 24, 12:00 pm" or "Nov 24, 12:00 pm"
+                                        for pattern in DATE_TIME_PATTERNS:
+                                            match = pattern.search(full_text)
+                                            if match:
+                                                date_time_str = match.group(1)
+                                                # Try to parse the date/time
+                                                try:
+                                                    # Parse date/time string
+                                                    parsed_dt = parser.parse(date_time_str, fuzzy=True)
+                                                        
+                                                    # Fix year if we're in December and date is in January (year transition)
+                                                    current_date = datetime.now()
+                                                    if current_date.month == 12 and parsed_dt.month == 1:
+                                                        # If we're in December and the parsed date is January, it should be next year
+                                                        if parsed_dt.year == current_date.year:
+                                                            parsed_dt = parsed_dt.replace(year=current_date.year + 1)
+                                                            print(f"         Fixed year: {current_date.year} → {parsed_dt.year} (January event)")
+                                                        
+                                                    start_date = parsed_dt
+                                                    end_date = parsed_dt + timedelta(hours=1)
+                                                        
+                                                    # Extract date and time strings
+                                                    date_str = parsed_dt.strftime('%B %d, %Y')
+                                                    time_str = parsed_dt.strftime('%I:%M %p').lstrip('0')
+                                                        
+                                                    print(f"         Parsed date/time: {date_str} {time_str}")
+                                                    break
+                                                except Exception as e:
+                                                    print(f"         Could not parse date/time: {e}")
+                                                    continue
                                             
-                                            for pattern in date_time_patterns:
-                                                match = re.search(pattern, full_text, re.IGNORECASE)
+                                        # If no date/time found, try to extract just date or time separately
+                                        if date_str == "TBD":
+                                            # Look for just date
+                                            for pattern in DATE_ONLY_PATTERNS:
+                                                match = pattern.search(full_text)
                                                 if match:
-                                                    date_time_str = match.group(1)
-                                                    # Try to parse the date/time
+                                                    date_str = match.group(1)
                                                     try:
-                                                        # Parse date/time string
-                                                        parsed_dt = parser.parse(date_time_str, fuzzy=True)
-                                                        
+                                                        parsed_dt = parser.parse(date_str, fuzzy=True)
+                                                            
                                                         # Fix year if we're in December and date is in January (year transition)
                                                         current_date = datetime.now()
                                                         if current_date.month == 12 and parsed_dt.month == 1:
@@ -1535,416 +1785,308 @@ def scrape_with_working_selenium():
                                                             if parsed_dt.year == current_date.year:
                                                                 parsed_dt = parsed_dt.replace(year=current_date.year + 1)
                                                                 print(f"         Fixed year: {current_date.year} → {parsed_dt.year} (January event)")
-                                                        
+                                                            
                                                         start_date = parsed_dt
                                                         end_date = parsed_dt + timedelta(hours=1)
-                                                        
-                                                        # Extract date and time strings
                                                         date_str = parsed_dt.strftime('%B %d, %Y')
-                                                        time_str = parsed_dt.strftime('%I:%M %p').lstrip('0')
-                                                        
-                                                        print(f"         Parsed date/time: {date_str} {time_str}")
-                                                        break
-                                                    except Exception as e:
-                                                        print(f"         Could not parse date/time: {e}")
-                                                        continue
+                                                    except:
+                                                        pass
+                                                    break
                                             
-                                            # If no date/time found, try to extract just date or time separately
-                                            if date_str == "TBD":
-                                                # Look for just date
-                                                date_patterns = [
-                                                    r'([A-Za-z]+\s+\d{1,2}(?:,\s+\d{4})?)',  # "November 24" or "November 24, 2025"
-                                                    r'([A-Za-z]{3}\s+\d{1,2}(?:,\s+\d{4})?)',  # "Nov 24" or "Nov 24, 2025"
-                                                ]
-                                                for pattern in date_patterns:
-                                                    match = re.search(pattern, full_text, re.IGNORECASE)
-                                                    if match:
-                                                        date_str = match.group(1)
-                                                        try:
-                                                            parsed_dt = parser.parse(date_str, fuzzy=True)
-                                                            
-                                                            # Fix year if we're in December and date is in January (year transition)
-                                                            current_date = datetime.now()
-                                                            if current_date.month == 12 and parsed_dt.month == 1:
-                                                                # If we're in December and the parsed date is January, it should be next year
-                                                                if parsed_dt.year == current_date.year:
-                                                                    parsed_dt = parsed_dt.replace(year=current_date.year + 1)
-                                                                    print(f"         Fixed year: {current_date.year} → {parsed_dt.year} (January event)")
-                                                            
-                                                            start_date = parsed_dt
-                                                            end_date = parsed_dt + timedelta(hours=1)
-                                                            date_str = parsed_dt.strftime('%B %d, %Y')
-                                                        except:
-                                                            pass
-                                                        break
-                                            
-                                            if time_str == "TBD":
-                                                # Look for just time
-                                                time_pattern = r'(\d{1,2}:\d{2}\s*(?:am|pm|AM|PM))'
-                                                match = re.search(time_pattern, full_text, re.IGNORECASE)
-                                                if match:
-                                                    time_str = match.group(1)
-                                                    # Try to apply time to start_date if we have a date
-                                                    if date_str != "TBD":
-                                                        try:
-                                                            time_match = re.search(r'(\d{1,2}):(\d{2})\s*(am|pm|AM|PM)', time_str, re.IGNORECASE)
-                                                            if time_match:
-                                                                hour = int(time_match.group(1))
-                                                                minute = int(time_match.group(2))
-                                                                period = time_match.group(3).upper()
+                                        if time_str == "TBD":
+                                            # Look for just time
+                                            match = TIME_RE.search(full_text)
+                                            if match:
+                                                time_str = match.group(0)
+                                                # Try to apply time to start_date if we have a date
+                                                if date_str != "TBD":
+                                                    try:
+                                                        time_match = TIME_RE.search(time_str)
+                                                        if time_match:
+                                                            hour = int(time_match.group(1))
+                                                            minute = int(time_match.group(2))
+                                                            period = time_match.group(3).upper()
                                                                 
-                                                                if period == 'PM' and hour != 12:
-                                                                    hour += 12
-                                                                elif period == 'AM' and hour == 12:
-                                                                    hour = 0
+                                                            if period == 'PM' and hour != 12:
+                                                                hour += 12
+                                                            elif period == 'AM' and hour == 12:
+                                                                hour = 0
                                                                 
-                                                                start_date = start_date.replace(hour=hour, minute=minute)
-                                                                end_date = start_date + timedelta(hours=1)
-                                                        except:
-                                                            pass
+                                                            start_date = start_date.replace(hour=hour, minute=minute)
+                                                            end_date = start_date + timedelta(hours=1)
+                                                    except:
+                                                        pass
                                             
-                                            # Create event object
-                                            event = {
-                                                "title": title,
-                                                "description": ' '.join(text_content[1:]) if len(text_content) > 1 else title,
-                                                "image_url": img_src,
-                                                "startDate": start_date.isoformat() + 'Z',
-                                                "endDate": end_date.isoformat() + 'Z',
-                                                "location": "Seniors Kingston",
-                                                "dateStr": date_str,
-                                                "timeStr": time_str
-                                            }
+                                        # Create event object
+                                        event = {
+                                            "title": title,
+                                            "description": ' '.join(text_content[1:]) if len(text_content) > 1 else title,
+                                            "image_url": img_src,
+                                            "startDate": start_date.isoformat() + 'Z',
+                                            "endDate": end_date.isoformat() + 'Z',
+                                            "location": "Seniors Kingston",
+                                            "dateStr": date_str,
+                                            "timeStr": time_str
+                                        }
                                             
-                                            # Use title + date as unique key to avoid duplicates
-                                            event_key = f"{title.lower().strip()}_{date_str}_{time_str}"
-                                            if event_key not in seen_event_keys:
-                                                events_found.append(event)
-                                                seen_event_keys.add(event_key)
-                                                print(f"         Event: {title} - {date_str} {time_str}")
-                                                print(f"         Banner: {img_src}")
-                                            else:
-                                                print(f"         ⏭️ Skipped duplicate: {title}")
+                                        # Use title + date as unique key to avoid duplicates
+                                        event_key = (title.lower().strip(), date_str, time_str)
+                                        if event_key not in seen_event_keys:
+                                            add_event(event, event_key)
+                                            print(f"         Event: {title} - {date_str} {time_str}")
+                                            print(f"         Banner: {img_src}")
+                                        else:
+                                            print(f"         ⏭️ Skipped duplicate: {title}")
                 
                 # Helper function to check if an event is already found (fuzzy matching)
-                def is_duplicate_event(title, date_str, time_str):
-                    """Check if this event is already in the found events (fuzzy match)"""
-                    title_lower = title.lower().strip()
-                    for existing_event in events_found:
-                        existing_title = existing_event.get('title', '').lower().strip()
-                        existing_date = existing_event.get('dateStr', '')
-                        existing_time = existing_event.get('timeStr', '')
-                        
-                        # Check if title is similar (one contains the other or very similar)
-                        title_similar = (title_lower in existing_title or existing_title in title_lower) and len(title_lower) > 5
-                        date_similar = date_str in existing_date or existing_date in date_str
-                        time_similar = (not time_str or not existing_time or time_str == existing_time or time_str in existing_time or existing_time in time_str)
-                        
-                        if title_similar and date_similar:
+                def is_duplicate_event(title_lower, date_str):
+                    """Check if this event is already in the found events (fuzzy match); title_lower is lowercased and stripped"""
+                    if len(title_lower) <= 5:
+                        return False
+                    # Only events on the same calendar date can be duplicates
+                    for existing_title in titles_by_date.get(_month_day_key(date_str), ()):
+                        # Check if title is similar (one contains the other, or only a few edits apart)
+                        if title_lower in existing_title or existing_title in title_lower:
+                            return True
+                        max_edits = max(3, min(len(title_lower), len(existing_title)) // 4)
+                        if _bounded_levenshtein(title_lower, existing_title, max_edits) <= max_edits:
                             return True
                     return False
                 
                 # Helper function to extract clean event title from text
-                def extract_clean_title(text, date_str):
+                def extract_clean_title(text, date_str, lines=None):
                     """Extract a clean event title from text, avoiding descriptions"""
-                    # Known event titles to look for
-                    known_titles = [
-                        'Fresh Food Market', 'Legal Advice', 'Legal Clinic', 'E-Resources at the Library',
-                        'Cafe Franglish', "Tuesday at Tom's", '500 years', '500 Years'
-                    ]
-                    
                     # First, check if any known title is in the text
-                    for known_title in known_titles:
-                        if known_title.lower() in text.lower():
+                    text_lower = text.lower()
+                    for known_lower, known_title in KNOWN_EVENT_TITLES_LOWER:
+                        if known_lower in text_lower:
                             return known_title
                     
-                    # Split by common separators
-                    lines = [l.strip() for l in text.split('\n') if l.strip()]
-                    sentences = [s.strip() for s in text.split('.') if s.strip()]
+                    # Split into lines, unless the caller already did
+                    if lines is None:
+                        lines = _clean_lines(text, limit=3)
                     
                     # Look for short, title-like text (not descriptions)
                     for line in lines[:3]:  # Check first 3 lines
-                        line = line.strip()
                         # Skip if it's too long (likely a description)
                         if len(line) > 80:
                             continue
                         # Skip if it contains common description words
-                        if any(word in line.lower() for word in ['brings', 'provides', 'learn', 'join', 'register', 'call', 'appointment']):
+                        if DESCRIPTION_WORDS_RE.search(line):
                             continue
                         # Skip if it's just a time or date
-                        if re.match(r'^\d{1,2}:\d{2}', line):
+                        if TIME_PREFIX_RE.match(line):
                             continue
                         # Good candidate for title
                         if 5 < len(line) < 80:
                             return line
                     
                     # Fallback: first sentence if short enough
-                    if sentences and len(sentences[0]) < 80:
-                        return sentences[0]
+                    first_sentence = next((s.strip() for s in text.split('.') if s.strip()), None)
+                    if first_sentence and len(first_sentence) < 80:
+                        return first_sentence
                     
                     # Last resort: first line
                     return lines[0] if lines else text[:80]
                 
+                def collect_event(event_key, title, date_str, time_match, img_src, description, found_by):
+                    """Parse the date and time of a candidate found in page text and record it as an event"""
+                    try:
+                        current_date = datetime.now()
+                        # date_str is a regex-matched "Month D", so a table lookup replaces dateutil's fuzzy parser
+                        try:
+                            month, day = _month_day_key(date_str)
+                            parsed_dt = datetime(current_date.year, month, day)
+                        except (TypeError, ValueError):
+                            parsed_dt = parser.parse(date_str, fuzzy=True)
+                        # Fix year for January events when we're in December (year transition)
+                        if current_date.month == 12 and parsed_dt.month == 1:
+                            if parsed_dt.year == current_date.year:
+                                parsed_dt = parsed_dt.replace(year=current_date.year + 1)
+                        # Fix year for February+ events when we're in January (should be same year)
+                        elif current_date.month == 1 and parsed_dt.month >= 2:
+                            if parsed_dt.year < current_date.year:
+                                parsed_dt = parsed_dt.replace(year=current_date.year)
+
+                        # Parse time
+                        if time_match:
+                            hour = int(time_match.group(1))
+                            minute = int(time_match.group(2))
+                            period = time_match.group(3).upper()
+                            if period == 'PM' and hour != 12:
+                                hour += 12
+                            elif period == 'AM' and hour == 12:
+                                hour = 0
+                            parsed_dt = parsed_dt.replace(hour=hour, minute=minute)
+
+                        # Default image for known events
+                        if not img_src:
+                            if 'Fresh Food Market' in title:
+                                img_src = "https://cms.seniorskingston.ca/assets/6d7e0dd8-63c7-45ff-916d-67280d4f9966/Fresh Food Market.jpg"
+                            elif 'Legal Advice' in title:
+                                img_src = "https://cms.seniorskingston.ca/assets/ff281879-79a3-45e3-ab4c-b54f69a2e371/Legal Advice.JPG"
+
+                        event = {
+                            "title": title,
+                            "description": description,
+                            "image_url": img_src or "/logo192.png",
+                            "startDate": parsed_dt.isoformat() + 'Z',
+                            "endDate": (parsed_dt + timedelta(hours=1)).isoformat() + 'Z',
+                            "location": "Seniors Kingston",
+                            "dateStr": parsed_dt.strftime('%B %d, %Y'),
+                            "timeStr": parsed_dt.strftime('%I:%M %p').lstrip('0') if parsed_dt.hour != 0 or parsed_dt.minute != 0 else "TBD"
+                        }
+
+                        add_event(event, event_key)
+                        print(f"         ✅ Found {found_by}: {title} - {event['dateStr']} {event['timeStr']}")
+                    except Exception as e:
+                        print(f"         ⚠️ Error parsing date {date_str}: {e}")
+
+                def absolute_img_src(img_elem):
+                    """Absolute banner URL for an <img> element, or None"""
+                    img_src = img_elem.get('src', '') if img_elem else None
+                    if img_src and not img_src.startswith('http'):
+                        if img_src.startswith('/'):
+                            img_src = f"https://seniorskingston.ca{img_src}"
+                        else:
+                            img_src = f"https://seniorskingston.ca/{img_src}"
+                    return img_src or None
+
+                # First <img> under each element, from one walk over the page's images in document
+                # order, so elem.find('img') / parent.find('img') become dict lookups
+                first_img_under = {}
+                for img in soup.find_all('img'):
+                    for ancestor in img.parents:
+                        first_img_under.setdefault(id(ancestor), img)
+
+                def nearby_img(elem):
+                    """First <img> inside elem, otherwise inside its parent"""
+                    img_elem = first_img_under.get(id(elem))
+                    if not img_elem and elem.parent is not None:
+                        img_elem = first_img_under.get(id(elem.parent))
+                    return img_elem
+
+                # Single lazy walk over the candidate elements, keeping only those whose text holds a date:
+                # the lowercased text feeds the second-pass image lookup, and elements whose stripped
+                # text holds a date become third-pass candidates
+                elem_texts = []
+                dated_elems = []
+                for elem in (node for node in soup.descendants if node.name in TEXT_CANDIDATE_TAGS):
+                    elem_text = elem.get_text()
+                    if not MONTH_DATE_RE.search(elem_text):
+                        continue
+                    elem_texts.append((elem, elem_text.lower()))
+                    text = stripped_text(elem)
+                    if len(text) >= 20:
+                        date_match = MONTH_DATE_RE.search(text)
+                        if date_match:
+                            dated_elems.append((elem, text, date_match.group(0)))
+                elems_by_date = {}
+
+                def elems_mentioning(date_lower):
+                    """Elements (with their lowercased text) whose text contains date_lower"""
+                    if date_lower not in elems_by_date:
+                        elems_by_date[date_lower] = [(elem, text) for elem, text in elem_texts if date_lower in text]
+                    return elems_by_date[date_lower]
+
                 # Second pass: Look for events by date patterns in all text (catch any missed events)
                 print("🔍 Second pass: Looking for events by date patterns in all text...")
-                all_text_elements = soup.find_all(['div', 'article', 'section', 'li', 'p', 'span', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
-                
+
                 # Also search in the full page text for specific event patterns
                 full_page_text = soup.get_text()
-                
-                # Look for ALL date patterns (not just specific January dates) to catch all events including February and recurring events
-                # Find all date patterns in the text: "January 20", "February 5", "Jan 20", "Feb 5", etc.
-                all_date_patterns = re.findall(r'(January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2}', full_page_text, re.IGNORECASE)
-                # Remove duplicates while preserving order
-                seen_dates = set()
-                unique_dates = []
-                for date_match in all_date_patterns:
-                    if date_match not in seen_dates:
-                        seen_dates.add(date_match)
-                        unique_dates.append(date_match)
-                
-                print(f"   📅 Found {len(unique_dates)} unique date patterns in page text")
-                
-                for date_str in unique_dates:
-                    # Find all occurrences of this date in the text - look for pattern: Date, Time, Title
-                    pattern = re.escape(date_str) + r'[,\s]+(\d{1,2}:\d{2}\s*(?:am|pm|AM|PM))?[,\s]*(.+?)(?=(?:January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2}|$)'
-                    matches = re.finditer(pattern, full_page_text, re.IGNORECASE | re.DOTALL)
-                    for match in matches:
-                        time_str_match = match.group(1) if match.group(1) else None
-                        event_text = match.group(2) if match.group(2) else match.group(3) if len(match.groups()) > 2 else ''
-                        
-                        if event_text and len(event_text.strip()) > 5:
-                            # Extract clean event title (not description)
-                            potential_title = extract_clean_title(event_text, date_str)
-                            
-                            # Skip if title is too long or looks like a description
-                            if len(potential_title) > 80 or any(word in potential_title.lower() for word in ['brings', 'provides', 'learn about', 'join in', 'register call']):
-                                continue
-                            
-                            # Skip common non-event text
-                            skip_patterns = ['close', 'advertisement', 'register today', 'upcoming events', 'click here']
-                            if any(skip in potential_title.lower() for skip in skip_patterns):
-                                continue
-                            
-                            # Check if this is a duplicate of an existing event
-                            if is_duplicate_event(potential_title, date_str, time_str_match or ''):
-                                print(f"         ⏭️ Skipped duplicate: {potential_title} on {date_str}")
-                                continue
-                            
-                            # Create unique key
-                            event_key = f"{potential_title.lower().strip()}_{date_str}_{time_str_match or ''}"
-                            
-                            if event_key not in seen_event_keys:
-                                    # Parse date
-                                    try:
-                                        parsed_dt = parser.parse(date_str, fuzzy=True)
-                                        current_date = datetime.now()
-                                        # Fix year for January events when we're in December (year transition)
-                                        if current_date.month == 12 and parsed_dt.month == 1:
-                                            if parsed_dt.year == current_date.year:
-                                                parsed_dt = parsed_dt.replace(year=current_date.year + 1)
-                                        # Fix year for February+ events when we're in January (should be same year)
-                                        elif current_date.month == 1 and parsed_dt.month >= 2:
-                                            if parsed_dt.year < current_date.year:
-                                                parsed_dt = parsed_dt.replace(year=current_date.year)
-                                        
-                                        # Parse time
-                                        if time_str_match:
-                                            time_match = re.search(r'(\d{1,2}):(\d{2})\s*(am|pm|AM|PM)', time_str_match, re.IGNORECASE)
-                                            if time_match:
-                                                hour = int(time_match.group(1))
-                                                minute = int(time_match.group(2))
-                                                period = time_match.group(3).upper()
-                                                if period == 'PM' and hour != 12:
-                                                    hour += 12
-                                                elif period == 'AM' and hour == 12:
-                                                    hour = 0
-                                                parsed_dt = parsed_dt.replace(hour=hour, minute=minute)
-                                        else:
-                                            # Default time if not found (try to find in event_text)
-                                            time_in_text = re.search(r'(\d{1,2}):(\d{2})\s*(am|pm|AM|PM)', event_text, re.IGNORECASE)
-                                            if time_in_text:
-                                                hour = int(time_in_text.group(1))
-                                                minute = int(time_in_text.group(2))
-                                                period = time_in_text.group(3).upper()
-                                                if period == 'PM' and hour != 12:
-                                                    hour += 12
-                                                elif period == 'AM' and hour == 12:
-                                                    hour = 0
-                                                parsed_dt = parsed_dt.replace(hour=hour, minute=minute)
-                                        
-                                        # Look for image - search in nearby elements
-                                        img_src = None
-                                        # Try to find image by searching for elements containing this text
-                                        for elem in all_text_elements:
-                                            if date_str.lower() in elem.get_text().lower() and potential_title.lower() in elem.get_text().lower():
-                                                img_elem = elem.find('img')
-                                                if not img_elem:
-                                                    # Check parent
-                                                    parent = elem.find_parent()
-                                                    if parent:
-                                                        img_elem = parent.find('img')
-                                                
-                                                if img_elem:
-                                                    img_src = img_elem.get('src', '')
-                                                    if img_src:
-                                                        if not img_src.startswith('http'):
-                                                            if img_src.startswith('/'):
-                                                                img_src = f"https://seniorskingston.ca{img_src}"
-                                                            else:
-                                                                img_src = f"https://seniorskingston.ca/{img_src}"
-                                                        break
-                                        
-                                        # Default image for known events
-                                        if not img_src:
-                                            if 'Fresh Food Market' in potential_title:
-                                                img_src = "https://cms.seniorskingston.ca/assets/6d7e0dd8-63c7-45ff-916d-67280d4f9966/Fresh Food Market.jpg"
-                                            elif 'Legal Advice' in potential_title:
-                                                img_src = "https://cms.seniorskingston.ca/assets/ff281879-79a3-45e3-ab4c-b54f69a2e371/Legal Advice.JPG"
-                                        
-                                        # Get description (everything after title, but limit length)
-                                        description_lines = [l.strip() for l in event_text.split('\n') if l.strip() and l.strip() != potential_title]
-                                        description = ' '.join(description_lines[:3])[:500] if description_lines else potential_title
-                                        
-                                        event = {
-                                            "title": potential_title,
-                                            "description": description,
-                                            "image_url": img_src or "/logo192.png",
-                                            "startDate": parsed_dt.isoformat() + 'Z',
-                                            "endDate": (parsed_dt + timedelta(hours=1)).isoformat() + 'Z',
-                                            "location": "Seniors Kingston",
-                                            "dateStr": parsed_dt.strftime('%B %d, %Y'),
-                                            "timeStr": parsed_dt.strftime('%I:%M %p').lstrip('0') if parsed_dt.hour != 0 or parsed_dt.minute != 0 else "TBD"
-                                        }
-                                        
-                                        events_found.append(event)
-                                        seen_event_keys.add(event_key)
-                                        print(f"         ✅ Found by date pattern: {potential_title} - {parsed_dt.strftime('%B %d, %Y')} {event['timeStr']}")
-                                    except Exception as e:
-                                        print(f"         ⚠️ Error parsing date pattern {date_str}: {e}")
-                                        continue
-                
-                # Third pass: Look for events in all elements more comprehensively (only for truly missing events)
-                print("🔍 Third pass: Comprehensive search in all elements (skip if already found)...")
-                for elem in all_text_elements:
-                    text = elem.get_text(strip=True)
-                    if not text or len(text) < 20:
+
+                # Look for ALL date patterns (not just specific January dates) to catch all events including February and recurring events.
+                # One scan of the page text: each date's event text runs from just after the date (and an optional time) to the next date.
+                date_matches = list(MONTH_DATE_RE.finditer(full_page_text))
+                print(f"   📅 Found {len(date_matches)} date patterns in page text")
+
+                for index, date_match in enumerate(date_matches):
+                    date_str = date_match.group(0)
+                    next_start = date_matches[index + 1].start() if index + 1 < len(date_matches) else len(full_page_text)
+                    lead = DATE_LEAD_RE.match(full_page_text, date_match.end(), next_start)
+                    if not lead:
                         continue
-                    
-                    # Look for date patterns like "January 20" or "Jan 20" or "January 27"
-                    date_pattern = re.search(r'(January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2}', text, re.IGNORECASE)
-                    if date_pattern:
-                        date_str = date_pattern.group(0)
-                        
-                        # Check if this is a duplicate first
-                        # Extract potential title
-                        lines = [l.strip() for l in text.split('\n') if l.strip()]
-                        if not lines:
+                    time_str_match = lead.group(1)
+                    event_text = full_page_text[lead.end():next_start]
+
+                    if event_text and len(event_text.strip()) > 5:
+                        # Extract clean event title (not description)
+                        event_lines = _clean_lines(event_text)
+                        potential_title = extract_clean_title(event_text, date_str, event_lines)
+
+                        # Skip if title is too short, too long or looks like a description
+                        if len(potential_title) <= 5 or len(potential_title) > 80 or DESCRIPTION_TITLE_RE.search(potential_title):
                             continue
-                        
-                        potential_title = extract_clean_title(text, date_str)
-                        
-                        # Skip if this looks like a duplicate
-                        time_match = re.search(r'(\d{1,2}:\d{2}\s*(?:am|pm|AM|PM))', text, re.IGNORECASE)
-                        time_str = time_match.group(1) if time_match else ""
-                        
-                        if is_duplicate_event(potential_title, date_str, time_str):
+
+                        # Skip common non-event text
+                        if NON_EVENT_TITLE_RE.search(potential_title):
                             continue
-                        
-                        # Check if this looks like an event (has time, title, etc.)
-                        has_time = bool(time_match)
-                        has_title = len(potential_title) > 5 and len(potential_title) < 80
-                        
-                        # Also check for known event keywords
-                        has_event_keywords = any(keyword in text.lower() for keyword in [
-                            'fresh food market', 'legal advice', 'legal clinic', 'e-resources', '500 years', 
-                            'workshop', 'meeting', 'class', 'event', 'program', 'seminar', 'lecture', 'session'
-                        ])
-                        
-                        if (has_time or has_event_keywords) and has_title:
-                            event_key = f"{potential_title.lower().strip()}_{date_str}_{time_str}"
-                            
-                            if event_key not in seen_event_keys:
-                                # Look for image in parent or nearby
-                                img_elem = elem.find('img') or (elem.find_parent().find('img') if elem.find_parent() else None)
-                                img_src = None
-                                if img_elem:
-                                    img_src = img_elem.get('src', '')
-                                    if img_src and not img_src.startswith('http'):
-                                        if img_src.startswith('/'):
-                                            img_src = f"https://seniorskingston.ca{img_src}"
-                                        else:
-                                            img_src = f"https://seniorskingston.ca/{img_src}"
-                                
-                                # Default images for known events
-                                if not img_src:
-                                    if 'Fresh Food Market' in potential_title:
-                                        img_src = "https://cms.seniorskingston.ca/assets/6d7e0dd8-63c7-45ff-916d-67280d4f9966/Fresh Food Market.jpg"
-                                    elif 'Legal Advice' in potential_title:
-                                        img_src = "https://cms.seniorskingston.ca/assets/ff281879-79a3-45e3-ab4c-b54f69a2e371/Legal Advice.JPG"
-                                
-                                # Parse date
-                                try:
-                                    parsed_dt = parser.parse(date_str, fuzzy=True)
-                                    current_date = datetime.now()
-                                    # Fix year for January events when we're in December (year transition)
-                                    if current_date.month == 12 and parsed_dt.month == 1:
-                                        if parsed_dt.year == current_date.year:
-                                            parsed_dt = parsed_dt.replace(year=current_date.year + 1)
-                                    # Fix year for February+ events when we're in January (should be same year)
-                                    elif current_date.month == 1 and parsed_dt.month >= 2:
-                                        if parsed_dt.year < current_date.year:
-                                            parsed_dt = parsed_dt.replace(year=current_date.year)
-                                    
-                                    if time_match:
-                                        hour = int(time_match.group(1))
-                                        minute = int(time_match.group(2))
-                                        period = time_match.group(3).upper() if len(time_match.groups()) > 2 else 'AM'
-                                        if period == 'PM' and hour != 12:
-                                            hour += 12
-                                        elif period == 'AM' and hour == 12:
-                                            hour = 0
-                                        parsed_dt = parsed_dt.replace(hour=hour, minute=minute)
-                                    
-                                    # Get description (everything after title)
-                                    description_lines = [l.strip() for l in lines if l.strip() != potential_title and not re.match(r'^\d{1,2}:\d{2}', l)]
-                                    description = ' '.join(description_lines[:3])[:500] if description_lines else potential_title
-                                    
-                                    event = {
-                                        "title": potential_title,
-                                        "description": description,
-                                        "image_url": img_src or "/logo192.png",
-                                        "startDate": parsed_dt.isoformat() + 'Z',
-                                        "endDate": (parsed_dt + timedelta(hours=1)).isoformat() + 'Z',
-                                        "location": "Seniors Kingston",
-                                        "dateStr": parsed_dt.strftime('%B %d, %Y'),
-                                        "timeStr": parsed_dt.strftime('%I:%M %p').lstrip('0') if parsed_dt.hour != 0 or parsed_dt.minute != 0 else "TBD"
-                                    }
-                                    
-                                    events_found.append(event)
-                                    seen_event_keys.add(event_key)
-                                    print(f"         ✅ Found in comprehensive search: {potential_title} - {parsed_dt.strftime('%B %d, %Y')} {event['timeStr']}")
-                                except Exception as e:
-                                    print(f"         ⚠️ Error parsing: {e}")
-                                    pass
-                
-                # Remove duplicates based on title + date + time (not just title, to allow same event on different dates)
-                unique_events = []
-                seen_event_keys_final = set()
-                for event in events_found:
-                    title = event.get('title', '')
-                    date_str = event.get('dateStr', '')
-                    time_str = event.get('timeStr', '')
-                    # Use title + date + time as unique key to allow same event on different dates
-                    event_key_final = f"{title.lower().strip()}_{date_str}_{time_str}"
-                    if event_key_final not in seen_event_keys_final and len(title) > 5:
-                        unique_events.append(event)
-                        seen_event_keys_final.add(event_key_final)
+
+                        # Cheap exact-key check first, then the fuzzy duplicate check, before any parsing or image lookup
+                        title_lower = potential_title.lower().strip()
+                        event_key = (title_lower, date_str, time_str_match or '')
+                        if event_key in seen_event_keys:
+                            continue
+                        if is_duplicate_event(title_lower, date_str):
+                            print(f"         ⏭️ Skipped duplicate: {potential_title} on {date_str}")
+                            continue
+
+                        # Time right after the date, otherwise the first time in the event text
+                        time_match = TIME_RE.search(time_str_match or event_text)
+
+                        # Look for image - search in nearby elements containing this text
+                        img_src = None
+                        for elem, elem_text in elems_mentioning(date_str.lower()):
+                            if title_lower in elem_text:
+                                img_src = absolute_img_src(nearby_img(elem))
+                                if img_src:
+                                    break
+
+                        # Get description (everything after title, but limit length)
+                        description_lines = [l for l in event_lines if l != potential_title]
+                        description = ' '.join(description_lines[:3])[:500] if description_lines else potential_title
+
+                        collect_event(event_key, potential_title, date_str, time_match, img_src, description, "by date pattern")
+
+                # Third pass: Look for events in all elements more comprehensively (only for truly missing events)
+                print("🔍 Third pass: Comprehensive search in all elements (skip if already found)...")
+                for elem, text, date_str in dated_elems:
+                    # Extract potential title
+                    lines = _clean_lines(text)
+                    if not lines:
+                        continue
+
+                    potential_title = extract_clean_title(text, date_str, lines)
+                    if not 5 < len(potential_title) < 80:
+                        continue
+
+                    # Check if this looks like an event (has time or known event keywords)
+                    time_match = TIME_RE.search(text)
+                    time_str = time_match.group(0) if time_match else ""
+                    if not (time_match or EVENT_KEYWORDS_RE.search(text)):
+                        continue
+
+                    # Skip events already found, exact key first, before any image lookup or parsing
+                    title_lower = potential_title.lower().strip()
+                    event_key = (title_lower, date_str, time_str)
+                    if event_key in seen_event_keys or is_duplicate_event(title_lower, date_str):
+                        continue
+
+                    # Look for image in parent or nearby
+                    img_elem = nearby_img(elem)
+
+                    # Get description (everything after title)
+                    description_lines = [l for l in lines if l != potential_title and not TIME_PREFIX_RE.match(l)]
+                    description = ' '.join(description_lines[:3])[:500] if description_lines else potential_title
+
+                    collect_event(event_key, potential_title, date_str, time_match, absolute_img_src(img_elem), description, "in comprehensive search")
                 
-                print(f"\n📊 Found {len(unique_events)} unique events with banners")
+                # Every event was checked against seen_event_keys and is_duplicate_event before being added
+                print(f"\n📊 Found {len(events_found)} unique events with banners")
                 
-                if unique_events:
+                if events_found:
                     print("✅ Successfully scraped events from website")
-                    return unique_events
+                    return events_found
                 else:
                     print("📅 No events found in loaded content")
                     return []
@@ -1976,13 +2118,80 @@ def scrape_with_requests_fallback():
         print(f"❌ Error in enhanced scraping method: {e}")
         return get_november_2025_events_fallback()
 
+# Start of event data embedded in the events page scripts ("events: [", "calendar: [", ...), one
+# alternation so each script body is scanned once. The array itself is cut out by
+# _extract_balanced_array, so the pattern has no .*? to backtrack over large scripts.
+EMBED_DATA_RE = re.compile(r'(?:events|calendar|programs|data)\s*:\s*\[', re.IGNORECASE)
+HTML_TAG_RE = re.compile(r'<[^>]+>')
+# data-events="..." (or '...') attribute values in raw HTML, still entity-escaped
+DATA_EVENTS_ATTR_RE = re.compile(r'''\bdata-events\s*=\s*(["'])(.*?)\1''', re.IGNORECASE | re.DOTALL)
+
+def _extract_balanced_array(s, pos=0):
+    """The first balanced [...] in s at or after pos, skipping brackets inside quoted strings, or None"""
+    start = s.find('[', pos)
+    if start == -1:
+        return None
+    depth = 0
+    quote = None
+    escaped = False
+    for i in range(start, len(s)):
+        ch = s[i]
+        if quote:
+            if escaped:
+                escaped = False
+            elif ch == '\\':
+                escaped = True
+            elif ch == quote:
+                quote = None
+        elif ch == '"' or ch == "'":
+            quote = ch
+        elif ch == '[':
+            depth += 1
+        elif ch == ']':
+            depth -= 1
+            if depth == 0:
+                return s[start:i + 1]
+    return None
+
+def _probe_event_endpoints(endpoints, headers, extract, label):
+    """Request all endpoints in parallel and return the events from the earliest-listed one that yields any"""
+    def probe(endpoint):
+        print(f"🔍 Trying {label}: {endpoint}")
+        response = SCRAPE_SESSION.get(endpoint, headers=headers, timeout=15)
+        if response.status_code != 200:
+            return []
+        try:
+            data = response.json()
+        except ValueError:
+            # Not JSON, nothing to extract
+            return []
+        return extract(data)
+
+    executor = ThreadPoolExecutor(max_workers=len(endpoints))
+    try:
+        futures = [(endpoint, executor.submit(probe, endpoint)) for endpoint in endpoints]
+        # Results are taken in list order, so a preferred endpoint wins over a faster later one;
+        # the probes still overlap, so this waits no longer than the slowest endpoint it reaches
+        for endpoint, future in futures:
+            try:
+                events = future.result()
+            except Exception as e:
+                print(f"❌ {label} failed: {endpoint} - {e}")
+                continue
+            if events:
+                print(f"✅ Found {len(events)} events from {label}: {endpoint}")
+                return events
+        return []
+    finally:
+        # Don't wait on later endpoints once one has answered
+        executor.shutdown(wait=False, cancel_futures=True)
+
 def scrape_with_smart_requests():
     """REAL SCRAPING - Try to find actual API endpoints for Seniors Kingston events"""
     try:
-        import requests
-        from bs4 import BeautifulSoup
-        import re
-        import json
+        if BeautifulSoup is None:
+            raise ImportError("beautifulsoup4 is not installed")
+        import html
         
         print("🌐 Attempting to find REAL events from Seniors Kingston API")
         
@@ -2007,25 +2216,10 @@ def scrape_with_smart_requests():
             'Referer': 'https://seniorskingston.ca/events'
         }
         
-        for endpoint in api_endpoints:
-            try:
-                print(f"🔍 Trying API endpoint: {endpoint}")
-                response = requests.get(endpoint, headers=headers, timeout=15)
-                
-                if response.status_code == 200:
-                    try:
-                        data = response.json()
-                        events = extract_events_from_api_data(data)
-                        if events:
-                            print(f"✅ Found {len(events)} events from API: {endpoint}")
-                            return events
-                    except:
-                        # Not JSON, continue
-                        pass
-                        
-            except Exception as e:
-                print(f"❌ API endpoint failed: {endpoint} - {e}")
-                continue
+        # Probe every endpoint at once; total wait is the slowest probe rather than the sum
+        events = _probe_event_endpoints(api_endpoints, headers, extract_events_from_api_data, "API")
+        if events:
+            return events
         
         # Strategy 2: Try to find WordPress REST API
         wp_endpoints = [
@@ -2034,21 +2228,9 @@ def scrape_with_smart_requests():
             "https://seniorskingston.ca/wp-json/wp/v2/pages?per_page=100"
         ]
         
-        for endpoint in wp_endpoints:
-            try:
-                print(f"🔍 Trying WordPress API: {endpoint}")
-                response = requests.get(endpoint, headers=headers, timeout=15)
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    events = extract_events_from_wp_data(data)
-                    if events:
-                        print(f"✅ Found {len(events)} events from WordPress API")
-                        return events
-                        
-            except Exception as e:
-                print(f"❌ WordPress API failed: {endpoint} - {e}")
-                continue
+        events = _probe_event_endpoints(wp_endpoints, headers, extract_events_from_wp_data, "WordPress API")
+        if events:
+            return events
         
         # Strategy 3: Try to find embedded data in the main page
         print("🔍 Trying to find embedded event data in main page...")
@@ -2063,10 +2245,11 @@ def scrape_with_smart_requests():
             'Upgrade-Insecure-Requests': '1'
         }
         
-        response = requests.get(url, headers=headers, timeout=30)
+        response = SCRAPE_SESSION.get(url, headers=headers, timeout=30)
         
         if response.status_code == 200:
-            soup = BeautifulSoup(response.content, 'html.parser')
+            # Only <script> tags are needed here, so build those alone rather than the whole page tree
+            soup = BeautifulSoup(response.content, HTML_PARSER, parse_only=SoupStrainer('script'))
             
             # Look for any script tags that might contain event data
             script_tags = soup.find_all('script')
@@ -2077,40 +2260,30 @@ def scrape_with_smart_requests():
                     script_content = script.string
                     
                     # Look for common event data patterns
-                    patterns = [
-                        r'events\s*:\s*\[.*?\]',
-                        r'calendar\s*:\s*\[.*?\]',
-                        r'programs\s*:\s*\[.*?\]',
-                        r'data\s*:\s*\[.*?\]'
-                    ]
-                    
-                    for pattern in patterns:
-                        matches = re.findall(pattern, script_content, re.DOTALL | re.IGNORECASE)
-                        for match in matches:
-                            try:
-                                # Try to extract JSON array
-                                json_match = re.search(r'\[.*\]', match, re.DOTALL)
-                                if json_match:
-                                    data = json.loads(json_match.group())
-                                    events = extract_events_from_api_data(data)
-                                    if events:
-                                        print(f"✅ Found {len(events)} events in embedded script data")
-                                        return events
-                            except:
-                                continue
+                    for embed_match in EMBED_DATA_RE.finditer(script_content):
+                        try:
+                            # Try to extract JSON array
+                            json_array = _extract_balanced_array(script_content, embed_match.end() - 1)
+                            if json_array:
+                                data = _parse_json(json_array)
+                                events = extract_events_from_api_data(data)
+                                if events:
+                                    print(f"✅ Found {len(events)} events in embedded script data")
+                                    return events
+                        except:
+                            continue
             
             # Look for any data attributes or hidden content
-            data_elements = soup.find_all(attrs={"data-events": True})
-            if data_elements:
-                for element in data_elements:
-                    try:
-                        data = json.loads(element['data-events'])
-                        events = extract_events_from_api_data(data)
-                        if events:
-                            print(f"✅ Found {len(events)} events in data attributes")
-                            return events
-                    except:
-                        continue
+            # A single attribute, so read it straight from the raw HTML instead of parsing a tree
+            for attr_match in DATA_EVENTS_ATTR_RE.finditer(response.text):
+                try:
+                    data = _parse_json(html.unescape(attr_match.group(2)))
+                    events = extract_events_from_api_data(data)
+                    if events:
+                        print(f"✅ Found {len(events)} events in data attributes")
+                        return events
+                except:
+                    continue
                     
         # If all strategies fail, return empty list (no fake events)
         print("❌ Could not find real events from Seniors Kingston website")
@@ -2122,26 +2295,18 @@ def scrape_with_smart_requests():
         print(f"❌ Error in real scraping attempt: {e}")
         return []
 
+# Keys an API response dict may hold its events list under, in priority order
+API_EVENT_LIST_KEYS = ('events', 'data', 'items', 'posts', 'programs')
+
 def extract_events_from_api_data(data):
     """Extract events from API response data"""
-    events = []
     try:
-        if isinstance(data, list):
-            for item in data:
-                event = create_event_from_api_item(item)
-                if event:
-                    events.append(event)
-        elif isinstance(data, dict):
-            # Look for events array in the response
-            for key in ['events', 'data', 'items', 'posts', 'programs']:
-                if key in data and isinstance(data[key], list):
-                    for item in data[key]:
-                        event = create_event_from_api_item(item)
-                        if event:
-                            events.append(event)
-                    break
-                    
-        return events
+        if isinstance(data, dict):
+            # Look for events array in the response, first list-valued key wins
+            data = next((data[key] for key in API_EVENT_LIST_KEYS if isinstance(data.get(key), list)), None)
+        if not isinstance(data, list):
+            return []
+        return [event for event in map(create_event_from_api_item, data) if event]
         
     except Exception as e:
         print(f"❌ Error extracting events from API data: {e}")
@@ -2149,48 +2314,50 @@ def extract_events_from_api_data(data):
 
 def extract_events_from_wp_data(data):
     """Extract events from WordPress API data"""
-    events = []
     try:
-        for post in data:
-            if isinstance(post, dict):
-                event = create_event_from_wp_post(post)
-                if event:
-                    events.append(event)
-        return events
+        return [event for event in map(create_event_from_wp_post, data) if event]
         
     except Exception as e:
         print(f"❌ Error extracting events from WordPress data: {e}")
         return []
 
+def _unwrap_wp(obj, key, default=''):
+    """obj[key], or its 'rendered' text when it is a WordPress {"rendered": ...} field"""
+    value = obj.get(key, default)
+    return value.get('rendered', default) if isinstance(value, dict) else value
+
+def _clean_title(title):
+    """Strip HTML tags and whitespace from a scraped title and cap it at 50 characters"""
+    title = HTML_TAG_RE.sub('', title).strip()
+    return title[:50] + ("..." if len(title) > 50 else "")
+
+# Fields every event built from API / WordPress data shares
+EVENT_TEMPLATE = {
+    "image_url": "/event-schedule-banner.png",
+    "location": "Seniors Kingston",
+    "dateStr": "TBD",
+    "timeStr": "TBD"
+}
+
 def create_event_from_api_item(item):
     """Create event from API item"""
     try:
         if not isinstance(item, dict):
             return None
             
-        title = item.get('title', {}).get('rendered', '') if isinstance(item.get('title'), dict) else item.get('title', '')
-        if not title:
-            title = item.get('name', '') or item.get('event_title', '') or item.get('program_name', '')
-            
+        title = _unwrap_wp(item, 'title') or item.get('name', '') or item.get('event_title', '') or item.get('program_name', '')
         if not title:
             return None
             
-        # Clean up title
-        title = re.sub(r'<[^>]+>', '', title)  # Remove HTML tags
-        title = title.strip()
-        
-        if len(title) > 50:
-            title = title[:50] + "..."
+        title = _clean_title(title)
             
+        now = datetime.now().isoformat()
         return {
+            **EVENT_TEMPLATE,
             "title": title,
             "description": item.get('content', {}).get('rendered', '') if isinstance(item.get('content'), dict) else item.get('description', title),
-            "image_url": "/event-schedule-banner.png",
-            "startDate": datetime.now().isoformat(),
-            "endDate": datetime.now().isoformat(),
-            "location": "Seniors Kingston",
-            "dateStr": "TBD",
-            "timeStr": "TBD"
+            "startDate": now,
+            "endDate": now
         }
         
     except Exception as e:
@@ -2200,40 +2367,79 @@ def create_event_from_api_item(item):
 def create_event_from_wp_post(post):
     """Create event from WordPress post"""
     try:
-        title = post.get('title', {}).get('rendered', '') if isinstance(post.get('title'), dict) else post.get('title', '')
+        if not isinstance(post, dict):
+            return None
+            
+        title = _unwrap_wp(post, 'title')
         if not title:
             return None
             
-        # Clean up title
-        title = re.sub(r'<[^>]+>', '', title)  # Remove HTML tags
-        title = title.strip()
-        
-        if len(title) > 50:
-            title = title[:50] + "..."
+        title = _clean_title(title)
             
+        now = datetime.now().isoformat()
         return {
+            **EVENT_TEMPLATE,
             "title": title,
             "description": post.get('content', {}).get('rendered', '') if isinstance(post.get('content'), dict) else post.get('excerpt', title),
-            "image_url": "/event-schedule-banner.png",
-            "startDate": datetime.now().isoformat(),
-            "endDate": datetime.now().isoformat(),
-            "location": "Seniors Kingston",
-            "dateStr": "TBD",
-            "timeStr": "TBD"
+            "startDate": now,
+            "endDate": now
         }
         
     except Exception as e:
         print(f"❌ Error creating event from WordPress post: {e}")
         return None
 
+# Parsed fallback JSON files by path, with the (mtime, size) they were read at
+FALLBACK_JSON_CACHE = {}
+FALLBACK_JSON_LOCK = threading.Lock()
+
+def _share_repeated_strings(records):
+    """Point equal string fields across record dicts at one object (locations, days, image URLs repeat a lot)"""
+    shared = {}
+    for record in records:
+        if isinstance(record, dict):
+            for key, value in record.items():
+                if type(value) is str:
+                    record[key] = shared.setdefault(value, value)
+    return records
+
+def _load_fallback_json(path):
+    """Parsed contents of a fallback JSON file, re-read only when the file changes. Treat as read-only."""
+    stat = os.stat(path)
+    version = (stat.st_mtime_ns, stat.st_size)
+    with FALLBACK_JSON_LOCK:
+        cached = FALLBACK_JSON_CACHE.get(path)
+        if cached and cached[0] == version:
+            return cached[1]
+    with open(path, 'rb') as f:
+        data = _parse_json(f.read())
+    # The parse stays cached, so don't keep a separate copy of every repeated value in it
+    if isinstance(data, dict):
+        for key in ('events', 'programs'):
+            if isinstance(data.get(key), list):
+                _share_repeated_strings(data[key])
+    with FALLBACK_JSON_LOCK:
+        FALLBACK_JSON_CACHE[path] = (version, data)
+    return data
+
+def _write_fallback_json(path, data):
+    """Write a fallback JSON file atomically, so readers never see a half-written file"""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
 def get_excel_fallback_data():
     """Get Excel programs from fallback data"""
     try:
         fallback_file = "/tmp/excel_fallback_data.json" if os.getenv('RENDER') else "excel_fallback_data.json"
         
         if os.path.exists(fallback_file):
-            with open(fallback_file, 'r', encoding='utf-8') as f:
-                fallback_data = json.load(f)
+            fallback_data = _load_fallback_json(fallback_file)
             
             if 'programs' in fallback_data and fallback_data['programs']:
                 print(f"📅 Excel fallback last updated: {fallback_data.get('metadata', {}).get('last_updated', 'Unknown')}")
@@ -2243,12 +2449,12 @@ def get_excel_fallback_data():
         
     except Exception as e:
         print(f"❌ Error loading Excel fallback data: {e}")
-        import traceback
         traceback.print_exc()
         return []
 
 def restore_fallback_programs_to_database():
     """Restore fallback programs to database - CRITICAL RECOVERY FUNCTION"""
+    conn = None
     try:
         print("🔄 Attempting to restore programs from fallback data...")
         fallback_programs = get_excel_fallback_data()
@@ -2259,61 +2465,689 @@ def restore_fallback_programs_to_database():
         
         print(f"📦 Found {len(fallback_programs)} programs in fallback data")
         
-        # Connect to database
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        
-        # Clear existing data
-        cursor.execute("DELETE FROM programs")
-        print("🗑️ Cleared existing database data")
+        def safe_session(value):
+            # Same as import_excel_data's safe_str: pandas wrote missing cells as NaN or 'nan'
+            if value is None or value != value or value == 'nan' or value == '':
+                return ""
+            return str(value).strip()
         
-        # Restore programs to database
-        restored_count = 0
+        # Map fallback data structure to database schema
+        # Fallback may have different field names, so we need to handle both
+        rows = []
         for prog in fallback_programs:
             try:
-                # Map fallback data structure to database schema
-                # Fallback may have different field names, so we need to handle both
-                sheet = prog.get('sheet', '')
-                program = prog.get('program', '')
-                program_id = prog.get('program_id', '')
-                date_range = prog.get('date_range', '')
-                time = prog.get('time', '')
-                location = prog.get('location', '')
-                class_room = prog.get('class_room', '')
-                instructor = prog.get('instructor', '')
-                program_status = prog.get('program_status', 'Active')
-                class_cancellation = prog.get('class_cancellation', '')
-                note = prog.get('note', prog.get('additional_information', ''))
-                withdrawal = prog.get('withdrawal', prog.get('refund', ''))
-                description = prog.get('description', '')
-                fee = prog.get('fee', '')
-                
-                # Insert into database
-                session = safe_str(prog.get('session', ''))
-                cursor.execute('''
-                    INSERT INTO programs (sheet, program, program_id, date_range, time, location, 
-                                       class_room, instructor, program_status, class_cancellation, note, withdrawal, description, fee, session)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (sheet, program, program_id, date_range, time, location, 
-                      class_room, instructor, program_status, class_cancellation, note, withdrawal, description, fee, session))
-                
-                restored_count += 1
+                row = (
+                    prog.get('sheet', ''),
+                    prog.get('program', ''),
+                    prog.get('program_id', ''),
+                    prog.get('date_range', ''),
+                    prog.get('time', ''),
+                    prog.get('location', ''),
+                    prog.get('class_room', ''),
+                    prog.get('instructor', ''),
+                    prog.get('program_status', 'Active'),
+                    prog.get('class_cancellation', ''),
+                    prog.get('note', prog.get('additional_information', '')),
+                    prog.get('withdrawal', prog.get('refund', '')),
+                    prog.get('description', ''),
+                    prog.get('fee', ''),
+                    safe_session(prog.get('session', '')),
+                )
+                # Reject rows sqlite can't bind here, so one bad program can't fail the whole batch
+                if not all(value is None or isinstance(value, (str, int, float)) for value in row):
+                    raise ValueError("unsupported field value")
+                rows.append(row)
             except Exception as e:
                 print(f"⚠️ Error restoring program {prog.get('program', 'Unknown')}: {e}")
                 continue
-        
+
+        # Connect to database (WAL and cache pragmas are set when the connection is opened)
+        conn = _get_db_connection()
+        cursor = conn.cursor()
+
+        # Clear and reload in one transaction with a single batched insert
+        cursor.execute("BEGIN")
+        cursor.execute("DELETE FROM programs")
+        print("🗑️ Cleared existing database data")
+
+        # Drop secondary indexes for the load and rebuild each once afterwards, instead of
+        # updating them row by row (automatic indexes have no sql and are left alone)
+        cursor.execute("SELECT name, sql FROM sqlite_master WHERE type = 'index' AND tbl_name = 'programs' AND sql IS NOT NULL")
+        program_indexes = cursor.fetchall()
+        for index_name, _ in program_indexes:
+            cursor.execute(f'DROP INDEX "{index_name}"')
+
+        cursor.executemany('''
+            INSERT INTO programs (sheet, program, program_id, date_range, time, location, 
+                               class_room, instructor, program_status, class_cancellation, note, withdrawal, description, fee, session)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', rows)
+        restored_count = len(rows)
+
+        for _, index_sql in program_indexes:
+            cursor.execute(index_sql)
+
         conn.commit()
-        conn.close()
         
         print(f"✅ Successfully restored {restored_count} programs from fallback to database")
         return True
         
     except Exception as e:
+        # The connection is shared, so don't leave a half-done restore open on it
+        if conn is not None:
+            conn.rollback()
         print(f"❌ Error restoring fallback programs to database: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
+@dataclass(slots=True, frozen=True)
+class FallbackEvent:
+    """One hardcoded fallback event; slotted and immutable since the table stays resident"""
+    title: str
+    startDate: str
+    endDate: str
+    description: str
+    location: str
+    dateStr: str
+    timeStr: str
+    price: str
+    instructor: str
+    registration: str
+    image_url: str
+
+    def to_dict(self):
+        """A fresh event dict in the shape the API returns"""
+        return {field: getattr(self, field) for field in self.__slots__}
+
+# Real events from Seniors Kingston website (scraped on Oct 25-26, 2025), the last-resort events fallback
+HARDCODED_NOVEMBER_EVENTS = (
+    FallbackEvent(
+        title="Sound Escapes: Kenny & Dolly",
+        startDate="2025-10-24T13:30:00Z",
+        endDate="2025-10-24T14:30:00Z",
+        description="Sound Escapes: Kenny & Dolly  October 24, 1:30 pm Celebrate timeless hits in this unforgettable tribute concert. Relive legendary duets",
+        location="Online",
+        dateStr="October 24",
+        timeStr="1:30 pm",
+        price="$12",
+        instructor="",
+        registration="call 613.548.7810",
+        image_url="https://cms.seniorskingston.ca/assets/bd103f00-5824-449d-9a8d-74dd98f450c3/Sound%20Escapes%202.jpg"
+    ),
+    FallbackEvent(
+        title="Wearable Tech",
+        startDate="2025-10-27T12:00:00Z",
+        endDate="2025-10-27T13:00:00Z",
+        description="Wearable Tech  October 27, 12:00 pm Smartwatches and fitness trackers have become increasing popular. Learn how wearable technology can support your health, fitness and everyday activities.",
+        location="",
+        dateStr="October 27",
+        timeStr="12:00 pm",
+        price="",
+        instructor="Sam Kalb",
+        registration="Call 613.548.7810",
+        image_url="https://cms.seniorskingston.ca/assets/9ac584b0-0bc5-4803-a59b-dd48f5589df7/Tech%20Bytes.jpg"
+    ),
+    FallbackEvent(
+        title="Legal Advice",
+        startDate="2025-10-27T13:00:00Z",
+        endDate="2025-10-27T14:00:00Z",
+        description="Legal Advice October 27, 1:00 pm A practicing lawyer provides confidential advice by phone. Appointment required (20 minutes max).",
+        location="",
+        dateStr="October 27",
+        timeStr="1:00 pm",
+        price="",
+        instructor="",
+        registration="Call 613.548.7810",
+        image_url="https://cms.seniorskingston.ca/assets/ff281879-79a3-45e3-ab4c-b54f69a2e371/Legal%20Advice.JPG"
+    ),
+    FallbackEvent(
+        title="Fresh Food Market",
+        startDate="2025-10-28T10:00:00Z",
+        endDate="2025-10-28T11:00:00Z",
+        description="Fresh Food Market October 28, 10:00 am Lionhearts brings fresh, affordable produce and chef-created gourmet healthy options to The Seniors Centre to help you keep your belly full without emptying your wallet.",
+        location="",
+        dateStr="October 28",
+        timeStr="10:00 am",
+        price="",
+        instructor="",
+        registration="",
+        image_url="https://cms.seniorskingston.ca/assets/6d7e0dd8-63c7-45ff-916d-67280d4f9966/Fresh%20Food%20Market.jpg"
+    ),
+    FallbackEvent(
+        title="18th Century Astronomy",
+        startDate="2025-10-30T13:00:00Z",
+        endDate="2025-10-30T14:00:00Z",
+        description="18th Century Astronomy  October 30, 1:00 pm The 1700s changed our view of the universe. Hear about the first \"X\" prize, the solar system, deep skyobjects, the distance to the stars and the remarkable men and women involved.",
+        location="",
+        dateStr="October 30",
+        timeStr="1:00 pm",
+        price="",
+        instructor="",
+        registration="",
+        image_url="https://cms.seniorskingston.ca/assets/1444a77f-b919-494d-bfe1-87ae130cbdf5/Featured%20Speaker.jpg"
+    ),
+    FallbackEvent(
+        title="Caroles Dance Party",
+        startDate="2025-10-30T13:00:00Z",
+        endDate="2025-10-30T14:00:00Z",
+        description="Caroles Dance Party  October 30, 1:00 pm Let's Dance! Join Carole for spooky tunes and groovy moves. Supportive footwear is mandatory.",
+        location="",
+        dateStr="October 30",
+        timeStr="1:00 pm",
+        price="",
+        instructor="Carole Gibson services",
+        registration="Call 613.548.7810",
+        image_url="https://cms.seniorskingston.ca/assets/5f877585-1735-45c2-b513-2bbe20e82f88/Caroles%20Dance%20Party.jpg"
+    ),
+    FallbackEvent(
+        title="Daylight Savings Ends  November 2, 8:00 am",
+        startDate="2025-11-02T08:00:00Z",
+        endDate="2025-11-02T09:00:00Z",
+        description="",
+        location="",
+        dateStr="November 2",
+        timeStr="8:00 am",
+        price="",
+        instructor="",
+        registration="",
+        image_url="https://cms.seniorskingston.ca/assets/d2758d2b-f79b-49db-9f4e-f55928b48126/Daylight%20Savings%20Time.jpg"
+    ),
+    FallbackEvent(
+        title="Online Registration Begins",
+        startDate="2025-11-03T08:00:00Z",
+        endDate="2025-11-03T09:00:00Z",
+        description="Online Registration Begins  November 3, 8:00 am Online Program Registration Starts Today",
+        location="Online",
+        dateStr="November 3",
+        timeStr="8:00 am",
+        price="",
+        instructor="",
+        registration="",
+        image_url="https://cms.seniorskingston.ca/assets/4d931fd1-40ac-4785-bcae-81d0647e6cf7/Registration%20Online.jpg"
+    ),
+    FallbackEvent(
+        title="Assistive Listening Solutions",
+        startDate="2025-11-03T12:00:00Z",
+        endDate="2025-11-03T13:00:00Z",
+        description="Assistive Listening Solutions  November 3, 12:00 pm Removing communication barriers leads to engagement within the community. Learn about how assistive listening solutions can help hard-of-hearing members remove background noise and hear what they are intended to. This session will provide an overview of the solutions available today and how they can benefit those who struggle to hear in public spaces.",
+        location="",
+        dateStr="November 3",
+        timeStr="12:00 pm",
+        price="",
+        instructor="Stephanie Brown, Hearing Assistive Technology Solutions Group",
+        registration="",
+        image_url="https://cms.seniorskingston.ca/assets/94872db8-dee1-41c2-9fcb-1a8315487c24/Tech%20Bytes.jpg"
+    ),
+    FallbackEvent(
+        title="In-Person Registration for Session 2 Begins",
+        startDate="2025-11-04T08:30:00Z",
+        endDate="2025-11-04T09:30:00Z",
+        description="In-Person Registration for Session 2 Begins November 4, 8:30 am In-person and mail registration begins Monday November 3 at 8:30am. Session 2 begins November 27.",
+        location="",
+        dateStr="November 4",
+        timeStr="8:30 am",
+        price="",
+        instructor="",
+        registration="",
+        image_url="https://cms.seniorskingston.ca/assets/4d931fd1-40ac-4785-bcae-81d0647e6cf7/Registration%20Online.jpg"
+    ),
+    FallbackEvent(
+        title="Fresh Food Market",
+        startDate="2025-11-04T10:00:00Z",
+        endDate="2025-11-04T11:00:00Z",
+        description="Fresh Food Market November 4, 10:00 am Lionhearts brings fresh, affordable produce and chef-created gourmet healthy options to The Seniors Centre to help you keep your belly full without emptying your wallet.",
+        location="",
+        dateStr="November 4",
+        timeStr="10:00 am",
+        price="",
+        instructor="",
+        registration="",
+        image_url="https://cms.seniorskingston.ca/assets/6d7e0dd8-63c7-45ff-916d-67280d4f9966/Fresh%20Food%20Market.jpg"
+    ),
+    FallbackEvent(
+        title="Fraud Awareness",
+        startDate="2025-11-05T13:00:00Z",
+        endDate="2025-11-05T14:00:00Z",
+        description="Fraud Awareness November 5, 1:00 pm Protect your money and identity from phone, internet, and in-person fraudsters. Learn how to spot and avoid scams.",
+        location="",
+        dateStr="November 5",
+        timeStr="1:00 pm",
+        price="",
+        instructor="Paul Van Nest, Kingston Rotary Club",
+        registration="Call 613.548.7810",
+        image_url="https://cms.seniorskingston.ca/assets/cb66e913-8ddb-4252-a74c-4302cec7540f/PFH%20Wednesday%20PM.jpg"
+    ),
+    FallbackEvent(
+        title="Cut. Fold. Glue. Stars.",
+        startDate="2025-11-06T11:30:00Z",
+        endDate="2025-11-06T12:30:00Z",
+        description="Cut. Fold. Glue. Stars.  November 6, 11:30 am Join Carole and learn to make charming loo roll snowflakes to bring whimsy to your winter decor.",
+        location="",
+        dateStr="November 6",
+        timeStr="11:30 am",
+        price="",
+        instructor="Carole Gibson",
+        registration="Call 613.548.7810",
+        image_url="https://cms.seniorskingston.ca/assets/a538b972-f854-424b-b155-a1a48515fd6a/Learn%20&%20Play.jpg"
+    ),
+    FallbackEvent(
+        title="Learn about Tarot",
+        startDate="2025-11-06T13:00:00Z",
+        endDate="2025-11-06T14:00:00Z",
+        description="Learn about Tarot  November 6, 1:00 pm Tarocchini is a card game where trumps take tricks. Created in 1400 in Italy, it has evolved into games like Bridge. Is Tarot a game of fortune telling, tricks, or a psychological study? Come play and decide.",
+        location="",
+        dateStr="November 6",
+        timeStr="1:00 pm",
+        price="",
+        instructor="",
+        registration="",
+        image_url="https://cms.seniorskingston.ca/assets/1444a77f-b919-494d-bfe1-87ae130cbdf5/Featured%20Speaker.jpg"
+    ),
+    FallbackEvent(
+        title="Hearing Clinic",
+        startDate="2025-11-07T09:00:00Z",
+        endDate="2025-11-07T10:00:00Z",
+        description="Hearing Clinic November 7, 9:00 am Holly Brooks, Hearing Instrument Specialist, from Hear Right Canada provides hearing tests and hearing aid cleaning. Batteries also available for a fee. Appointments required.",
+        location="",
+        dateStr="November 7",
+        timeStr="9:00 am",
+        price="",
+        instructor="",
+        registration="Call 613.548.7810",
+        image_url="https://cms.seniorskingston.ca/assets/4b3c4ee7-17b6-4401-9f6f-27303d9ab94f/Hearing%20Clinic.jpg"
+    ),
+    FallbackEvent(
+        title="Coffee with a Cop",
+        startDate="2025-11-07T10:00:00Z",
+        endDate="2025-11-07T11:00:00Z",
+        description="Coffee with a Cop  November 7, 10:00 am Join Constable Anthony Colangeli for coffee and conversation. Ask questions and voice concerns. Walk-in. All are welcome.",
+        location="",
+        dateStr="November 7",
+        timeStr="10:00 am",
+        price="",
+        instructor="",
+        registration="",
+        image_url="https://cms.seniorskingston.ca/assets/7c4a9916-5533-45e6-9a5a-45e7a6a9d252/Coffee%20with%20a%20cop%20FIXED.jpg"
+    ),
+    FallbackEvent(
+        title="Cut. Fold. Glue. Trees",
+        startDate="2025-11-10T10:45:00Z",
+        endDate="2025-11-10T11:45:00Z",
+        description="Cut. Fold. Glue. Trees November 10, 10:45 am Join Carole and learn to make fanciful paper trees for your holiday tablescapes.",
+        location="",
+        dateStr="November 10",
+        timeStr="10:45 am",
+        price="",
+        instructor="Carole Gibson",
+        registration="Call 613.548.7810",
+        image_url="https://cms.seniorskingston.ca/assets/a538b972-f854-424b-b155-a1a48515fd6a/Learn%20&%20Play.jpg"
+    ),
+    FallbackEvent(
+        title="Shopping & Buying Online",
+        startDate="2025-11-10T12:00:00Z",
+        endDate="2025-11-10T13:00:00Z",
+        description="Shopping & Buying Online  November 10, 12:00 pm Dip your toes into online shopping. Learn how to get the most out of online stores, how to comparison shop and making informed purchases and how to choose streaming services for movies and TV programs.",
+        location="Online",
+        dateStr="November 10",
+        timeStr="12:00 pm",
+        price="",
+        instructor="Sam Kalb",
+        registration="Call 613.548.7810",
+        image_url="https://cms.seniorskingston.ca/assets/4d931fd1-40ac-4785-bcae-81d0647e6cf7/Registration%20Online.jpg"
+    ),
+    FallbackEvent(
+        title="Legal Advice",
+        startDate="2025-11-10T13:00:00Z",
+        endDate="2025-11-10T14:00:00Z",
+        description="Legal Advice November 10, 1:00 pm A practicing lawyer provides confidential advice by phone. Appointment required (20 minutes max).",
+        location="",
+        dateStr="November 10",
+        timeStr="1:00 pm",
+        price="",
+        instructor="",
+        registration="Call 613.548.7810",
+        image_url="https://cms.seniorskingston.ca/assets/ff281879-79a3-45e3-ab4c-b54f69a2e371/Legal%20Advice.JPG"
+    ),
+    FallbackEvent(
+        title="Fresh Food Market",
+        startDate="2025-11-11T10:00:00Z",
+        endDate="2025-11-11T11:00:00Z",
+        description="Fresh Food Market November 11, 10:00 am Lionhearts brings fresh, affordable produce and chef-created gourmet healthy options to The Seniors Centre to help you keep your belly full without emptying your wallet.",
+        location="",
+        dateStr="November 11",
+        timeStr="10:00 am",
+        price="",
+        instructor="",
+        registration="",
+        image_url="https://cms.seniorskingston.ca/assets/6d7e0dd8-63c7-45ff-916d-67280d4f9966/Fresh%20Food%20Market.jpg"
+    ),
+    FallbackEvent(
+        title="Service Canada Clinic",
+        startDate="2025-11-12T09:00:00Z",
+        endDate="2025-11-12T10:00:00Z",
+        description="Service Canada Clinic November 12, 9:00 am Service Canada representatives come to The Seniors Centre to help you with Canadian Pension Plan (CPP), Old Age Security (OAS), Guaranteed Income Supplement (GIS), Social Insurance Number (SIN), or Canadian Dental Care Plan.",
+        location="",
+        dateStr="November 12",
+        timeStr="9:00 am",
+        price="",
+        instructor="",
+        registration="",
+        image_url="https://cms.seniorskingston.ca/assets/4b3c4ee7-17b6-4401-9f6f-27303d9ab94f/Hearing%20Clinic.jpg"
+    ),
+    FallbackEvent(
+        title="Coast to Coast: A Canoe Odyssey",
+        startDate="2025-11-13T13:00:00Z",
+        endDate="2025-11-13T14:00:00Z",
+        description="Coast to Coast: A Canoe Odyssey November 13, 1:00 pm Two paddlers, one canoe, and 8,500 km from Vancouver to Sydney – through cities, towns, and wild terrain. Hear about this epic adventure of resilience, connection, and discovery across Canada's diverse landscapes and waterways.",
+        location="",
+        dateStr="November 13",
+        timeStr="1:00 pm",
+        price="",
+        instructor="",
+        registration="",
+        image_url="https://cms.seniorskingston.ca/assets/1444a77f-b919-494d-bfe1-87ae130cbdf5/Featured%20Speaker.jpg"
+    ),
+    FallbackEvent(
+        title="Birthday Lunch",
+        startDate="2025-11-14T12:00:00Z",
+        endDate="2025-11-14T13:00:00Z",
+        description="Birthday Lunch November 14, 12:00 pm Members celebrate their birthday month for free!",
+        location="Online",
+        dateStr="November 14",
+        timeStr="12:00 pm",
+        price="$16",
+        instructor="",
+        registration="call 613.548.7810",
+        image_url="https://cms.seniorskingston.ca/assets/e09e616f-444c-4f2d-989a-32fa84b34083/Birthday.jpg"
+    ),
+    FallbackEvent(
+        title="Sound Escapes: Georgette Fry",
+        startDate="2025-11-14T13:30:00Z",
+        endDate="2025-11-14T14:30:00Z",
+        description="Sound Escapes: Georgette Fry November 14, 1:30 pm Experience the award-winning Georgette Fry's soulful blend of blues, jazz, and pop. Her electrifying style will have you up and dancing all afternoon long!",
+        location="Online",
+        dateStr="November 14",
+        timeStr="1:30 pm",
+        price="$12",
+        instructor="",
+        registration="call 613.548.7810",
+        image_url="https://cms.seniorskingston.ca/assets/bd103f00-5824-449d-9a8d-74dd98f450c3/Sound%20Escapes%202.jpg"
+    ),
+    FallbackEvent(
+        title="Program Break Week",
+        startDate="2025-11-17T08:30:00Z",
+        endDate="2025-11-17T09:30:00Z",
+        description="Program Break Week November 17, 8:30 am No programs are scheduled at any Seniors Association locations.",
+        location="",
+        dateStr="November 17",
+        timeStr="8:30 am",
+        price="",
+        instructor="",
+        registration="",
+        image_url="https://cms.seniorskingston.ca/assets/569fd7a5-9905-4e34-b0f2-770421fc7e6d/Program%20Break.jpg"
+    ),
+    FallbackEvent(
+        title="Speed Friending",
+        startDate="2025-11-17T13:00:00Z",
+        endDate="2025-11-17T14:00:00Z",
+        description="Speed Friending  November 17, 1:00 pm Meet new people quickly in a fun, structured setting with speed friending, a platonic twist on speed dating. Rotate through brief conversations, connect with others, and potentially form lasting friendships in just minutes.",
+        location="",
+        dateStr="November 17",
+        timeStr="1:00 pm",
+        price="",
+        instructor="",
+        registration="Call 613.548.7810",
+        image_url="https://cms.seniorskingston.ca/assets/29174fb0-87d2-4f16-9d7e-a773dca5ff2a/Speed%20Friending.jpg"
+    ),
+    FallbackEvent(
+        title="Advanced Care Planning",
+        startDate="2025-11-17T16:30:00Z",
+        endDate="2025-11-17T17:30:00Z",
+        description="Advanced Care Planning November 17, 4:30 pm The process of thinking about, writing down, and sharing your wishes/instructions with loved ones for future health care treatment if you become incapable of deciding for yourself. Learn, listen, and ask questions to help you improve your plan.",
+        location="",
+        dateStr="November 17",
+        timeStr="4:30 pm",
+        price="",
+        instructor="",
+        registration="",
+        image_url="https://cms.seniorskingston.ca/assets/0b47a5d9-7476-44c7-ad1f-fac13a579936/Advance%20Care%20Planning.jpg"
+    ),
+    FallbackEvent(
+        title="Fresh Food Market",
+        startDate="2025-11-18T10:00:00Z",
+        endDate="2025-11-18T11:00:00Z",
+        description="Fresh Food Market November 18, 10:00 am Lionhearts brings fresh, affordable produce and chef-created gourmet healthy options to The Seniors Centre to help you keep your belly full without emptying your wallet.",
+        location="",
+        dateStr="November 18",
+        timeStr="10:00 am",
+        price="",
+        instructor="",
+        registration="",
+        image_url="https://cms.seniorskingston.ca/assets/6d7e0dd8-63c7-45ff-916d-67280d4f9966/Fresh%20Food%20Market.jpg"
+    ),
+    FallbackEvent(
+        title="Expressive Mark Making",
+        startDate="2025-11-18T13:00:00Z",
+        endDate="2025-11-18T14:00:00Z",
+        description="Expressive Mark Making  November 18, 1:00 pm Rekindle your passion for abstract art through expressive mark-making. This liberating workshop uses skill-building exercises and soul-nurturing prompts to unlock your subconscious, inspire creativity, and help you rediscover your unique, lyrical style.",
+        location="",
+        dateStr="November 18",
+        timeStr="1:00 pm",
+        price="",
+        instructor="Sharlena Wood",
+        registration="Call 613.548.7810",
+        image_url="https://cms.seniorskingston.ca/assets/a538b972-f854-424b-b155-a1a48515fd6a/Learn%20&%20Play.jpg"
+    ),
+    FallbackEvent(
+        title="Cafe Franglish",
+        startDate="2025-11-18T14:30:00Z",
+        endDate="2025-11-18T15:30:00Z",
+        description="Cafe Franglish November 18, 2:30 pm Join a monthly bilingual meetup where Francophones and Anglophones connect chat, and build confidence in both languages through lively, judgement-free conversations on a variety of engaging topics.",
+        location="",
+        dateStr="November 18",
+        timeStr="2:30 pm",
+        price="free",
+        instructor="",
+        registration="",
+        image_url="https://cms.seniorskingston.ca/assets/5476e070-622a-45a3-972b-3e61bdc511f8/Cafe%20Franglish.jpg"
+    ),
+    FallbackEvent(
+        title="Tuesday at Tom's",
+        startDate="2025-11-18T15:00:00Z",
+        endDate="2025-11-18T16:00:00Z",
+        description="Tuesday at Tom's November 18, 3:00 pm New to town or looking to make new friends? Come and enjoy a relaxing conversation and beverage with other members.",
+        location="",
+        dateStr="November 18",
+        timeStr="3:00 pm",
+        price="",
+        instructor="",
+        registration="Call 613.548.7810",
+        image_url="https://cms.seniorskingston.ca/assets/c01d910e-fd8d-4135-9963-5b9a5126d1cb/Tuesdays%20at%20Tom's.jpg"
+    ),
+    FallbackEvent(
+        title="Learn Resilience",
+        startDate="2025-11-19T09:30:00Z",
+        endDate="2025-11-19T10:30:00Z",
+        description="Learn Resilience  November 19, 9:30 am Experience the award-winning documentary Resilience, then join Teach Resilience trainers from Kingston Community Health Centres for an engaging panel discussion of the film, speaking about trauma and its impact.",
+        location="",
+        dateStr="November 19",
+        timeStr="9:30 am",
+        price="",
+        instructor="",
+        registration="Call 613.548.7810",
+        image_url="https://cms.seniorskingston.ca/assets/1444a77f-b919-494d-bfe1-87ae130cbdf5/Featured%20Speaker.jpg"
+    ),
+    FallbackEvent(
+        title="Vision Workshop",
+        startDate="2025-11-19T10:30:00Z",
+        endDate="2025-11-19T11:30:00Z",
+        description="Vision Workshop November 19, 10:30 am Rediscover purpose, passion, and joy in retirement. Learn simple tools to dream again, break free from \"too late\" thinking, and design a vibrant next chapter – filled with meaning, connection, and confidence.",
+        location="",
+        dateStr="November 19",
+        timeStr="10:30 am",
+        price="free",
+        instructor="Victoria Hirst",
+        registration="Call 613.548.7810",
+        image_url="https://cms.seniorskingston.ca/assets/a538b972-f854-424b-b155-a1a48515fd6a/Learn%20&%20Play.jpg"
+    ),
+    FallbackEvent(
+        title="New Member Mixer",
+        startDate="2025-11-19T14:00:00Z",
+        endDate="2025-11-19T15:00:00Z",
+        description="New Member Mixer\t November 19, 2:00 pm Are you a new member and want to learn more about what we offer? Have a friend you'd like to join? Or do you just want to know more about the Seniors Association? Meet with staff and other members for a brief orientation, introduction to our database, light refreshments, and socializing.",
+        location="",
+        dateStr="November 19",
+        timeStr="2:00 pm",
+        price="",
+        instructor="",
+        registration="Call 613.548.7810",
+        image_url="https://cms.seniorskingston.ca/assets/5fcfa81b-02bf-4985-9b86-8ec565c0bb00/New%20Member%20Mixer.jpg"
+    ),
+    FallbackEvent(
+        title="Time for Tea",
+        startDate="2025-11-20T13:00:00Z",
+        endDate="2025-11-20T14:00:00Z",
+        description="Time for Tea November 20, 1:00 pm Explore the fine art of tea and food pairing with a certified tea sommelier. Discover how nuanced flavors enhance cuisine through expertly selected teas and culinary harmony over the Holiday season.",
+        location="",
+        dateStr="November 20",
+        timeStr="1:00 pm",
+        price="",
+        instructor="",
+        registration="",
+        image_url="https://cms.seniorskingston.ca/assets/1444a77f-b919-494d-bfe1-87ae130cbdf5/Featured%20Speaker.jpg"
+    ),
+    FallbackEvent(
+        title="Book & Puzzle EXCHANGE",
+        startDate="2025-11-21T10:00:00Z",
+        endDate="2025-11-21T11:00:00Z",
+        description="Book & Puzzle EXCHANGE November 21, 10:00 am Bring up to 10 paperback books or puzzles to the Rendezvous Café to exchange for any in our library. Additional books or puzzles can be purchased for $2.",
+        location="",
+        dateStr="November 21",
+        timeStr="10:00 am",
+        price="$2",
+        instructor="",
+        registration="",
+        image_url="https://cms.seniorskingston.ca/assets/7948f41c-bcf4-42d1-97aa-5c7eb4245861/Book%20&%20Puzzle.jpg"
+    ),
+    FallbackEvent(
+        title="Annual General Meeting",
+        startDate="2025-11-21T11:00:00Z",
+        endDate="2025-11-21T12:00:00Z",
+        description="Annual General Meeting November 21, 11:00 am The theme for the 49th Annual General Meeting is Strategic Growth for Future Success and will be held at The Seniors Centre.",
+        location="",
+        dateStr="November 21",
+        timeStr="11:00 am",
+        price="",
+        instructor="",
+        registration="",
+        image_url="https://cms.seniorskingston.ca/assets/29174fb0-87d2-4f16-9d7e-a773dca5ff2a/Speed%20Friending.jpg"
+    ),
+    FallbackEvent(
+        title="December Vista Available for Pickup",
+        startDate="2025-11-21T12:00:00Z",
+        endDate="2025-11-21T13:00:00Z",
+        description="December Vista Available for Pickup November 21, 12:00 pm Volunteer Deliverers pick up their bundles to hand deliver and members can pick up their individual copy.",
+        location="",
+        dateStr="November 21",
+        timeStr="12:00 pm",
+        price="",
+        instructor="",
+        registration="",
+        image_url="https://cms.seniorskingston.ca/assets/8c8f92ce-34ef-442e-bab9-a06836704f9d/Vista.jpg"
+    ),
+    FallbackEvent(
+        title="Holiday Artisan Fair",
+        startDate="2025-11-22T10:00:00Z",
+        endDate="2025-11-22T11:00:00Z",
+        description="Holiday Artisan Fair November 22, 10:00 am Something for everyone!",
+        location="",
+        dateStr="November 22",
+        timeStr="10:00 am",
+        price="",
+        instructor="",
+        registration="",
+        image_url="https://cms.seniorskingston.ca/assets/a278053e-4f35-40af-a2f6-610cfd893930/Holiday%20Artisan%20Fair.jpg"
+    ),
+    FallbackEvent(
+        title="Simplify Your Digital Life",
+        startDate="2025-11-24T12:00:00Z",
+        endDate="2025-11-24T13:00:00Z",
+        description="Simplify Your Digital Life  November 24, 12:00 pm Feeling overwhelmed by your online accounts, passwords, and subscriptions? This presentation offers practical strategies to simplify your digital life. Learn to organize accounts, manage passwords, use cloud storage effectively, and understand your subscriptions. We'll also explore options for closing services you no longer need – empowering you to take control of your digital world.",
+        location="Online",
+        dateStr="November 24",
+        timeStr="12:00 pm",
+        price="",
+        instructor="Jarda Zborovsy",
+        registration="Call 613.548.7810",
+        image_url="https://cms.seniorskingston.ca/assets/cb66e913-8ddb-4252-a74c-4302cec7540f/PFH%20Wednesday%20PM.jpg"
+    ),
+    FallbackEvent(
+        title="Legal Advice",
+        startDate="2025-11-24T13:00:00Z",
+        endDate="2025-11-24T14:00:00Z",
+        description="Legal Advice November 24, 1:00 pm A practicing lawyer provides confidential advice by phone. Appointment required (20 minutes max).",
+        location="",
+        dateStr="November 24",
+        timeStr="1:00 pm",
+        price="",
+        instructor="",
+        registration="Call 613.548.7810",
+        image_url="https://cms.seniorskingston.ca/assets/ff281879-79a3-45e3-ab4c-b54f69a2e371/Legal%20Advice.JPG"
+    ),
+    FallbackEvent(
+        title="Fresh Food Market",
+        startDate="2025-11-25T10:00:00Z",
+        endDate="2025-11-25T11:00:00Z",
+        description="Fresh Food Market November 25, 10:00 am Lionhearts brings fresh, affordable produce and chef-created gourmet healthy options to The Seniors Centre to help you keep your belly full without emptying your wallet.",
+        location="",
+        dateStr="November 25",
+        timeStr="10:00 am",
+        price="",
+        instructor="",
+        registration="",
+        image_url="https://cms.seniorskingston.ca/assets/6d7e0dd8-63c7-45ff-916d-67280d4f9966/Fresh%20Food%20Market.jpg"
+    ),
+    FallbackEvent(
+        title="Holiday Lunch",
+        startDate="2025-11-25T12:00:00Z",
+        endDate="2025-11-25T13:00:00Z",
+        description="Holiday Lunch November 25, 12:00 pm Tomato Basil Soup, Roast Turkey, dressing, mashed potatoes, vegetables, cranberry sauce, and dessert!",
+        location="Online",
+        dateStr="November 25",
+        timeStr="12:00 pm",
+        price="$25",
+        instructor="",
+        registration="call 613.548.7810",
+        image_url="https://cms.seniorskingston.ca/assets/e09e616f-444c-4f2d-989a-32fa84b34083/Birthday.jpg"
+    ),
+    FallbackEvent(
+        title="Domino Theatre Dress Rehearsal: Miss Bennet: Christmas at Pemberley",
+        startDate="2025-11-26T19:30:00Z",
+        endDate="2025-11-26T20:30:00Z",
+        description="Domino Theatre Dress Rehearsal: Miss Bennet: Christmas at Pemberley November 26, 7:30 pm Celebrate the holidays with a witty sequel to Pride and Prejudice, where overlooked Mary Bennet discovers romance at Pemberley. Full of heart, humour, and Regency charm, this play delights.",
+        location="Online",
+        dateStr="November 26",
+        timeStr="7:30 pm",
+        price="",
+        instructor="",
+        registration="",
+        image_url="https://cms.seniorskingston.ca/assets/365bab44-7685-4223-8319-d8dea27b3484/Domino%20Dress%20Rehearsal.jpg"
+    ),
+    FallbackEvent(
+        title="Anxiety Unlocked",
+        startDate="2025-11-27T13:00:00Z",
+        endDate="2025-11-27T14:00:00Z",
+        description="Anxiety Unlocked  November 27, 1:00 pm Discover fun, easy-to-use tools that bring quick relief from anxiety. Learn simple, effective techniques you may not know, designed to calm your mind, ease stress, and restore balance anytime, anywhere.",
+        location="",
+        dateStr="November 27",
+        timeStr="1:00 pm",
+        price="",
+        instructor="",
+        registration="",
+        image_url="https://cms.seniorskingston.ca/assets/1444a77f-b919-494d-bfe1-87ae130cbdf5/Featured%20Speaker.jpg"
+    )
+)
+
 def get_comprehensive_november_events():
     """SMART EVENTS FALLBACK - Try saved fallback first, then use real events data"""
     print("🔄 Using SMART events fallback system")
@@ -2323,11 +3157,11 @@ def get_comprehensive_november_events():
     
     if os.path.exists(fallback_file):
         try:
-            with open(fallback_file, 'r', encoding='utf-8') as f:
-                fallback_data = json.load(f)
+            fallback_data = _load_fallback_json(fallback_file)
             
             if 'events' in fallback_data and fallback_data['events']:
-                events = fallback_data['events']
+                # Copies, since callers edit events in place and the parsed file is cached
+                events = [dict(event) for event in fallback_data['events']]
                 print(f"✅ Using saved fallback events: {len(events)} events")
                 print(f"📅 Last updated: {fallback_data.get('metadata', {}).get('last_updated', 'Unknown')}")
                 return events
@@ -2338,11 +3172,10 @@ def get_comprehensive_november_events():
     real_events_file = "events_with_real_banners.json"
     if os.path.exists(real_events_file):
         try:
-            with open(real_events_file, 'r', encoding='utf-8') as f:
-                real_data = json.load(f)
+            real_data = _load_fallback_json(real_events_file)
             
             if 'events' in real_data and real_data['events']:
-                events = real_data['events']
+                events = [dict(event) for event in real_data['events']]
                 print(f"✅ Using real events with banners: {len(events)} events")
                 print(f"📅 Source: {real_data.get('metadata', {}).get('source', 'Unknown')}")
                 return events
@@ -2352,626 +3185,39 @@ def get_comprehensive_november_events():
     # If no saved fallback or real events, use hardcoded events
     print("📅 Using hardcoded events fallback (45 events from Seniors Kingston)")
     
-    # Real events from Seniors Kingston website (scraped on Oct 25-26, 2025)
-    return [
-            {
-            "title": "Sound Escapes: Kenny & Dolly",
-            "startDate": "2025-10-24T13:30:00Z",
-            "endDate": "2025-10-24T14:30:00Z",
-            "description": "Sound Escapes: Kenny & Dolly  October 24, 1:30 pm Celebrate timeless hits in this unforgettable tribute concert. Relive legendary duets",
-            "location": "Online",
-            "dateStr": "October 24",
-            "timeStr": "1:30 pm",
-            "price": "$12",
-            "instructor": "",
-            "registration": "call 613.548.7810",
-            "image_url": "https://cms.seniorskingston.ca/assets/bd103f00-5824-449d-9a8d-74dd98f450c3/Sound%20Escapes%202.jpg"
-        },
-        {
-            "title": "Wearable Tech",
-            "startDate": "2025-10-27T12:00:00Z",
-            "endDate": "2025-10-27T13:00:00Z",
-            "description": "Wearable Tech  October 27, 12:00 pm Smartwatches and fitness trackers have become increasing popular. Learn how wearable technology can support your health, fitness and everyday activities.",
-            "location": "",
-            "dateStr": "October 27",
-            "timeStr": "12:00 pm",
-            "price": "",
-            "instructor": "Sam Kalb",
-            "registration": "Call 613.548.7810",
-            "image_url": "https://cms.seniorskingston.ca/assets/9ac584b0-0bc5-4803-a59b-dd48f5589df7/Tech%20Bytes.jpg"
-        },
-        {
-            "title": "Legal Advice",
-            "startDate": "2025-10-27T13:00:00Z",
-            "endDate": "2025-10-27T14:00:00Z",
-            "description": "Legal Advice October 27, 1:00 pm A practicing lawyer provides confidential advice by phone. Appointment required (20 minutes max).",
-            "location": "",
-            "dateStr": "October 27",
-            "timeStr": "1:00 pm",
-            "price": "",
-            "instructor": "",
-            "registration": "Call 613.548.7810",
-            "image_url": "https://cms.seniorskingston.ca/assets/ff281879-79a3-45e3-ab4c-b54f69a2e371/Legal%20Advice.JPG"
-        },
-        {
-            "title": "Fresh Food Market",
-            "startDate": "2025-10-28T10:00:00Z",
-            "endDate": "2025-10-28T11:00:00Z",
-            "description": "Fresh Food Market October 28, 10:00 am Lionhearts brings fresh, affordable produce and chef-created gourmet healthy options to The Seniors Centre to help you keep your belly full without emptying your wallet.",
-            "location": "",
-            "dateStr": "October 28",
-            "timeStr": "10:00 am",
-            "price": "",
-            "instructor": "",
-            "registration": "",
-            "image_url": "https://cms.seniorskingston.ca/assets/6d7e0dd8-63c7-45ff-916d-67280d4f9966/Fresh%20Food%20Market.jpg"
-        },
-        {
-            "title": "18th Century Astronomy",
-            "startDate": "2025-10-30T13:00:00Z",
-            "endDate": "2025-10-30T14:00:00Z",
-            "description": "18th Century Astronomy  October 30, 1:00 pm The 1700s changed our view of the universe. Hear about the first \"X\" prize, the solar system, deep skyobjects, the distance to the stars and the remarkable men and women involved.",
-            "location": "",
-            "dateStr": "October 30",
-            "timeStr": "1:00 pm",
-            "price": "",
-            "instructor": "",
-            "registration": "",
-            "image_url": "https://cms.seniorskingston.ca/assets/1444a77f-b919-494d-bfe1-87ae130cbdf5/Featured%20Speaker.jpg"
-        },
-        {
-            "title": "Caroles Dance Party",
-            "startDate": "2025-10-30T13:00:00Z",
-            "endDate": "2025-10-30T14:00:00Z",
-            "description": "Caroles Dance Party  October 30, 1:00 pm Let's Dance! Join Carole for spooky tunes and groovy moves. Supportive footwear is mandatory.",
-            "location": "",
-            "dateStr": "October 30",
-            "timeStr": "1:00 pm",
-            "price": "",
-            "instructor": "Carole Gibson services",
-            "registration": "Call 613.548.7810",
-            "image_url": "https://cms.seniorskingston.ca/assets/5f877585-1735-45c2-b513-2bbe20e82f88/Caroles%20Dance%20Party.jpg"
-        },
-        {
-            "title": "Daylight Savings Ends  November 2, 8:00 am",
-            "startDate": "2025-11-02T08:00:00Z",
-            "endDate": "2025-11-02T09:00:00Z",
-            "description": "",
-            "location": "",
-            "dateStr": "November 2",
-            "timeStr": "8:00 am",
-            "price": "",
-            "instructor": "",
-            "registration": "",
-            "image_url": "https://cms.seniorskingston.ca/assets/d2758d2b-f79b-49db-9f4e-f55928b48126/Daylight%20Savings%20Time.jpg"
-        },
-        {
-            "title": "Online Registration Begins",
-            "startDate": "2025-11-03T08:00:00Z",
-            "endDate": "2025-11-03T09:00:00Z",
-            "description": "Online Registration Begins  November 3, 8:00 am Online Program Registration Starts Today",
-            "location": "Online",
-            "dateStr": "November 3",
-            "timeStr": "8:00 am",
-            "price": "",
-            "instructor": "",
-            "registration": "",
-            "image_url": "https://cms.seniorskingston.ca/assets/4d931fd1-40ac-4785-bcae-81d0647e6cf7/Registration%20Online.jpg"
-        },
-        {
-            "title": "Assistive Listening Solutions",
-            "startDate": "2025-11-03T12:00:00Z",
-            "endDate": "2025-11-03T13:00:00Z",
-            "description": "Assistive Listening Solutions  November 3, 12:00 pm Removing communication barriers leads to engagement within the community. Learn about how assistive listening solutions can help hard-of-hearing members remove background noise and hear what they are intended to. This session will provide an overview of the solutions available today and how they can benefit those who struggle to hear in public spaces.",
-            "location": "",
-            "dateStr": "November 3",
-            "timeStr": "12:00 pm",
-            "price": "",
-            "instructor": "Stephanie Brown, Hearing Assistive Technology Solutions Group",
-            "registration": "",
-            "image_url": "https://cms.seniorskingston.ca/assets/94872db8-dee1-41c2-9fcb-1a8315487c24/Tech%20Bytes.jpg"
-        },
-        {
-            "title": "In-Person Registration for Session 2 Begins",
-            "startDate": "2025-11-04T08:30:00Z",
-            "endDate": "2025-11-04T09:30:00Z",
-            "description": "In-Person Registration for Session 2 Begins November 4, 8:30 am In-person and mail registration begins Monday November 3 at 8:30am. Session 2 begins November 27.",
-            "location": "",
-            "dateStr": "November 4",
-            "timeStr": "8:30 am",
-            "price": "",
-            "instructor": "",
-            "registration": "",
-            "image_url": "https://cms.seniorskingston.ca/assets/4d931fd1-40ac-4785-bcae-81d0647e6cf7/Registration%20Online.jpg"
-        },
-        {
-            "title": "Fresh Food Market",
-            "startDate": "2025-11-04T10:00:00Z",
-            "endDate": "2025-11-04T11:00:00Z",
-            "description": "Fresh Food Market November 4, 10:00 am Lionhearts brings fresh, affordable produce and chef-created gourmet healthy options to The Seniors Centre to help you keep your belly full without emptying your wallet.",
-            "location": "",
-            "dateStr": "November 4",
-            "timeStr": "10:00 am",
-            "price": "",
-            "instructor": "",
-            "registration": "",
-            "image_url": "https://cms.seniorskingston.ca/assets/6d7e0dd8-63c7-45ff-916d-67280d4f9966/Fresh%20Food%20Market.jpg"
-        },
-        {
-            "title": "Fraud Awareness",
-            "startDate": "2025-11-05T13:00:00Z",
-            "endDate": "2025-11-05T14:00:00Z",
-            "description": "Fraud Awareness November 5, 1:00 pm Protect your money and identity from phone, internet, and in-person fraudsters. Learn how to spot and avoid scams.",
-            "location": "",
-            "dateStr": "November 5",
-            "timeStr": "1:00 pm",
-            "price": "",
-            "instructor": "Paul Van Nest, Kingston Rotary Club",
-            "registration": "Call 613.548.7810",
-            "image_url": "https://cms.seniorskingston.ca/assets/cb66e913-8ddb-4252-a74c-4302cec7540f/PFH%20Wednesday%20PM.jpg"
-        },
-        {
-            "title": "Cut. Fold. Glue. Stars.",
-            "startDate": "2025-11-06T11:30:00Z",
-            "endDate": "2025-11-06T12:30:00Z",
-            "description": "Cut. Fold. Glue. Stars.  November 6, 11:30 am Join Carole and learn to make charming loo roll snowflakes to bring whimsy to your winter decor.",
-            "location": "",
-            "dateStr": "November 6",
-            "timeStr": "11:30 am",
-            "price": "",
-            "instructor": "Carole Gibson",
-            "registration": "Call 613.548.7810",
-            "image_url": "https://cms.seniorskingston.ca/assets/a538b972-f854-424b-b155-a1a48515fd6a/Learn%20&%20Play.jpg"
-        },
-        {
-            "title": "Learn about Tarot",
-            "startDate": "2025-11-06T13:00:00Z",
-            "endDate": "2025-11-06T14:00:00Z",
-            "description": "Learn about Tarot  November 6, 1:00 pm Tarocchini is a card game where trumps take tricks. Created in 1400 in Italy, it has evolved into games like Bridge. Is Tarot a game of fortune telling, tricks, or a psychological study? Come play and decide.",
-            "location": "",
-            "dateStr": "November 6",
-            "timeStr": "1:00 pm",
-            "price": "",
-            "instructor": "",
-            "registration": "",
-            "image_url": "https://cms.seniorskingston.ca/assets/1444a77f-b919-494d-bfe1-87ae130cbdf5/Featured%20Speaker.jpg"
-        },
-        {
-            "title": "Hearing Clinic",
-            "startDate": "2025-11-07T09:00:00Z",
-            "endDate": "2025-11-07T10:00:00Z",
-            "description": "Hearing Clinic November 7, 9:00 am Holly Brooks, Hearing Instrument Specialist, from Hear Right Canada provides hearing tests and hearing aid cleaning. Batteries also available for a fee. Appointments required.",
-            "location": "",
-            "dateStr": "November 7",
-            "timeStr": "9:00 am",
-            "price": "",
-            "instructor": "",
-            "registration": "Call 613.548.7810",
-            "image_url": "https://cms.seniorskingston.ca/assets/4b3c4ee7-17b6-4401-9f6f-27303d9ab94f/Hearing%20Clinic.jpg"
-        },
-        {
-            "title": "Coffee with a Cop",
-            "startDate": "2025-11-07T10:00:00Z",
-            "endDate": "2025-11-07T11:00:00Z",
-            "description": "Coffee with a Cop  November 7, 10:00 am Join Constable Anthony Colangeli for coffee and conversation. Ask questions and voice concerns. Walk-in. All are welcome.",
-            "location": "",
-            "dateStr": "November 7",
-            "timeStr": "10:00 am",
-            "price": "",
-            "instructor": "",
-            "registration": "",
-            "image_url": "https://cms.seniorskingston.ca/assets/7c4a9916-5533-45e6-9a5a-45e7a6a9d252/Coffee%20with%20a%20cop%20FIXED.jpg"
-        },
-        {
-            "title": "Cut. Fold. Glue. Trees",
-            "startDate": "2025-11-10T10:45:00Z",
-            "endDate": "2025-11-10T11:45:00Z",
-            "description": "Cut. Fold. Glue. Trees November 10, 10:45 am Join Carole and learn to make fanciful paper trees for your holiday tablescapes.",
-            "location": "",
-            "dateStr": "November 10",
-            "timeStr": "10:45 am",
-            "price": "",
-            "instructor": "Carole Gibson",
-            "registration": "Call 613.548.7810",
-            "image_url": "https://cms.seniorskingston.ca/assets/a538b972-f854-424b-b155-a1a48515fd6a/Learn%20&%20Play.jpg"
-        },
-        {
-            "title": "Shopping & Buying Online",
-            "startDate": "2025-11-10T12:00:00Z",
-            "endDate": "2025-11-10T13:00:00Z",
-            "description": "Shopping & Buying Online  November 10, 12:00 pm Dip your toes into online shopping. Learn how to get the most out of online stores, how to comparison shop and making informed purchases and how to choose streaming services for movies and TV programs.",
-            "location": "Online",
-            "dateStr": "November 10",
-            "timeStr": "12:00 pm",
-            "price": "",
-            "instructor": "Sam Kalb",
-            "registration": "Call 613.548.7810",
-            "image_url": "https://cms.seniorskingston.ca/assets/4d931fd1-40ac-4785-bcae-81d0647e6cf7/Registration%20Online.jpg"
-        },
-        {
-            "title": "Legal Advice",
-            "startDate": "2025-11-10T13:00:00Z",
-            "endDate": "2025-11-10T14:00:00Z",
-            "description": "Legal Advice November 10, 1:00 pm A practicing lawyer provides confidential advice by phone. Appointment required (20 minutes max).",
-            "location": "",
-            "dateStr": "November 10",
-            "timeStr": "1:00 pm",
-            "price": "",
-            "instructor": "",
-            "registration": "Call 613.548.7810",
-            "image_url": "https://cms.seniorskingston.ca/assets/ff281879-79a3-45e3-ab4c-b54f69a2e371/Legal%20Advice.JPG"
-        },
-        {
-            "title": "Fresh Food Market",
-            "startDate": "2025-11-11T10:00:00Z",
-            "endDate": "2025-11-11T11:00:00Z",
-            "description": "Fresh Food Market November 11, 10:00 am Lionhearts brings fresh, affordable produce and chef-created gourmet healthy options to The Seniors Centre to help you keep your belly full without emptying your wallet.",
-            "location": "",
-            "dateStr": "November 11",
-            "timeStr": "10:00 am",
-            "price": "",
-            "instructor": "",
-            "registration": "",
-            "image_url": "https://cms.seniorskingston.ca/assets/6d7e0dd8-63c7-45ff-916d-67280d4f9966/Fresh%20Food%20Market.jpg"
-        },
-        {
-            "title": "Service Canada Clinic",
-            "startDate": "2025-11-12T09:00:00Z",
-            "endDate": "2025-11-12T10:00:00Z",
-            "description": "Service Canada Clinic November 12, 9:00 am Service Canada representatives come to The Seniors Centre to help you with Canadian Pension Plan (CPP), Old Age Security (OAS), Guaranteed Income Supplement (GIS), Social Insurance Number (SIN), or Canadian Dental Care Plan.",
-            "location": "",
-            "dateStr": "November 12",
-            "timeStr": "9:00 am",
-            "price": "",
-            "instructor": "",
-            "registration": "",
-            "image_url": "https://cms.seniorskingston.ca/assets/4b3c4ee7-17b6-4401-9f6f-27303d9ab94f/Hearing%20Clinic.jpg"
-        },
-        {
-            "title": "Coast to Coast: A Canoe Odyssey",
-            "startDate": "2025-11-13T13:00:00Z",
-            "endDate": "2025-11-13T14:00:00Z",
-            "description": "Coast to Coast: A Canoe Odyssey November 13, 1:00 pm Two paddlers, one canoe, and 8,500 km from Vancouver to Sydney – through cities, towns, and wild terrain. Hear about this epic adventure of resilience, connection, and discovery across Canada's diverse landscapes and waterways.",
-            "location": "",
-            "dateStr": "November 13",
-            "timeStr": "1:00 pm",
-            "price": "",
-            "instructor": "",
-            "registration": "",
-            "image_url": "https://cms.seniorskingston.ca/assets/1444a77f-b919-494d-bfe1-87ae130cbdf5/Featured%20Speaker.jpg"
-        },
-        {
-            "title": "Birthday Lunch",
-            "startDate": "2025-11-14T12:00:00Z",
-            "endDate": "2025-11-14T13:00:00Z",
-            "description": "Birthday Lunch November 14, 12:00 pm Members celebrate their birthday month for free!",
-            "location": "Online",
-            "dateStr": "November 14",
-            "timeStr": "12:00 pm",
-            "price": "$16",
-            "instructor": "",
-            "registration": "call 613.548.7810",
-            "image_url": "https://cms.seniorskingston.ca/assets/e09e616f-444c-4f2d-989a-32fa84b34083/Birthday.jpg"
-        },
-        {
-            "title": "Sound Escapes: Georgette Fry",
-            "startDate": "2025-11-14T13:30:00Z",
-            "endDate": "2025-11-14T14:30:00Z",
-            "description": "Sound Escapes: Georgette Fry November 14, 1:30 pm Experience the award-winning Georgette Fry's soulful blend of blues, jazz, and pop. Her electrifying style will have you up and dancing all afternoon long!",
-            "location": "Online",
-            "dateStr": "November 14",
-            "timeStr": "1:30 pm",
-            "price": "$12",
-            "instructor": "",
-            "registration": "call 613.548.7810",
-            "image_url": "https://cms.seniorskingston.ca/assets/bd103f00-5824-449d-9a8d-74dd98f450c3/Sound%20Escapes%202.jpg"
-        },
-        {
-            "title": "Program Break Week",
-            "startDate": "2025-11-17T08:30:00Z",
-            "endDate": "2025-11-17T09:30:00Z",
-            "description": "Program Break Week November 17, 8:30 am No programs are scheduled at any Seniors Association locations.",
-            "location": "",
-            "dateStr": "November 17",
-            "timeStr": "8:30 am",
-            "price": "",
-            "instructor": "",
-            "registration": "",
-            "image_url": "https://cms.seniorskingston.ca/assets/569fd7a5-9905-4e34-b0f2-770421fc7e6d/Program%20Break.jpg"
-        },
-        {
-            "title": "Speed Friending",
-            "startDate": "2025-11-17T13:00:00Z",
-            "endDate": "2025-11-17T14:00:00Z",
-            "description": "Speed Friending  November 17, 1:00 pm Meet new people quickly in a fun, structured setting with speed friending, a platonic twist on speed dating. Rotate through brief conversations, connect with others, and potentially form lasting friendships in just minutes.",
-            "location": "",
-            "dateStr": "November 17",
-            "timeStr": "1:00 pm",
-            "price": "",
-            "instructor": "",
-            "registration": "Call 613.548.7810",
-            "image_url": "https://cms.seniorskingston.ca/assets/29174fb0-87d2-4f16-9d7e-a773dca5ff2a/Speed%20Friending.jpg"
-        },
-        {
-            "title": "Advanced Care Planning",
-            "startDate": "2025-11-17T16:30:00Z",
-            "endDate": "2025-11-17T17:30:00Z",
-            "description": "Advanced Care Planning November 17, 4:30 pm The process of thinking about, writing down, and sharing your wishes/instructions with loved ones for future health care treatment if you become incapable of deciding for yourself. Learn, listen, and ask questions to help you improve your plan.",
-            "location": "",
-            "dateStr": "November 17",
-            "timeStr": "4:30 pm",
-            "price": "",
-            "instructor": "",
-            "registration": "",
-            "image_url": "https://cms.seniorskingston.ca/assets/0b47a5d9-7476-44c7-ad1f-fac13a579936/Advance%20Care%20Planning.jpg"
-        },
-        {
-            "title": "Fresh Food Market",
-            "startDate": "2025-11-18T10:00:00Z",
-            "endDate": "2025-11-18T11:00:00Z",
-            "description": "Fresh Food Market November 18, 10:00 am Lionhearts brings fresh, affordable produce and chef-created gourmet healthy options to The Seniors Centre to help you keep your belly full without emptying your wallet.",
-            "location": "",
-            "dateStr": "November 18",
-            "timeStr": "10:00 am",
-            "price": "",
-            "instructor": "",
-            "registration": "",
-            "image_url": "https://cms.seniorskingston.ca/assets/6d7e0dd8-63c7-45ff-916d-67280d4f9966/Fresh%20Food%20Market.jpg"
-        },
-        {
-            "title": "Expressive Mark Making",
-            "startDate": "2025-11-18T13:00:00Z",
-            "endDate": "2025-11-18T14:00:00Z",
-            "description": "Expressive Mark Making  November 18, 1:00 pm Rekindle your passion for abstract art through expressive mark-making. This liberating workshop uses skill-building exercises and soul-nurturing prompts to unlock your subconscious, inspire creativity, and help you rediscover your unique, lyrical style.",
-            "location": "",
-            "dateStr": "November 18",
-            "timeStr": "1:00 pm",
-            "price": "",
-            "instructor": "Sharlena Wood",
-            "registration": "Call 613.548.7810",
-            "image_url": "https://cms.seniorskingston.ca/assets/a538b972-f854-424b-b155-a1a48515fd6a/Learn%20&%20Play.jpg"
-        },
-        {
-            "title": "Cafe Franglish",
-            "startDate": "2025-11-18T14:30:00Z",
-            "endDate": "2025-11-18T15:30:00Z",
-            "description": "Cafe Franglish November 18, 2:30 pm Join a monthly bilingual meetup where Francophones and Anglophones connect chat, and build confidence in both languages through lively, judgement-free conversations on a variety of engaging topics.",
-            "location": "",
-            "dateStr": "November 18",
-            "timeStr": "2:30 pm",
-            "price": "free",
-            "instructor": "",
-            "registration": "",
-            "image_url": "https://cms.seniorskingston.ca/assets/5476e070-622a-45a3-972b-3e61bdc511f8/Cafe%20Franglish.jpg"
-        },
-        {
-            "title": "Tuesday at Tom's",
-            "startDate": "2025-11-18T15:00:00Z",
-            "endDate": "2025-11-18T16:00:00Z",
-            "description": "Tuesday at Tom's November 18, 3:00 pm New to town or looking to make new friends? Come and enjoy a relaxing conversation and beverage with other members.",
-            "location": "",
-            "dateStr": "November 18",
-            "timeStr": "3:00 pm",
-            "price": "",
-            "instructor": "",
-            "registration": "Call 613.548.7810",
-            "image_url": "https://cms.seniorskingston.ca/assets/c01d910e-fd8d-4135-9963-5b9a5126d1cb/Tuesdays%20at%20Tom's.jpg"
-        },
-        {
-            "title": "Learn Resilience",
-            "startDate": "2025-11-19T09:30:00Z",
-            "endDate": "2025-11-19T10:30:00Z",
-            "description": "Learn Resilience  November 19, 9:30 am Experience the award-winning documentary Resilience, then join Teach Resilience trainers from Kingston Community Health Centres for an engaging panel discussion of the film, speaking about trauma and its impact.",
-            "location": "",
-            "dateStr": "November 19",
-            "timeStr": "9:30 am",
-            "price": "",
-            "instructor": "",
-            "registration": "Call 613.548.7810",
-            "image_url": "https://cms.seniorskingston.ca/assets/1444a77f-b919-494d-bfe1-87ae130cbdf5/Featured%20Speaker.jpg"
-        },
-        {
-            "title": "Vision Workshop",
-            "startDate": "2025-11-19T10:30:00Z",
-            "endDate": "2025-11-19T11:30:00Z",
-            "description": "Vision Workshop November 19, 10:30 am Rediscover purpose, passion, and joy in retirement. Learn simple tools to dream again, break free from \"too late\" thinking, and design a vibrant next chapter – filled with meaning, connection, and confidence.",
-            "location": "",
-            "dateStr": "November 19",
-            "timeStr": "10:30 am",
-            "price": "free",
-            "instructor": "Victoria Hirst",
-            "registration": "Call 613.548.7810",
-            "image_url": "https://cms.seniorskingston.ca/assets/a538b972-f854-424b-b155-a1a48515fd6a/Learn%20&%20Play.jpg"
-        },
-        {
-            "title": "New Member Mixer",
-            "startDate": "2025-11-19T14:00:00Z",
-            "endDate": "2025-11-19T15:00:00Z",
-            "description": "New Member Mixer\t November 19, 2:00 pm Are you a new member and want to learn more about what we offer? Have a friend you'd like to join? Or do you just want to know more about the Seniors Association? Meet with staff and other members for a brief orientation, introduction to our database, light refreshments, and socializing.",
-            "location": "",
-            "dateStr": "November 19",
-            "timeStr": "2:00 pm",
-            "price": "",
-            "instructor": "",
-            "registration": "Call 613.548.7810",
-            "image_url": "https://cms.seniorskingston.ca/assets/5fcfa81b-02bf-4985-9b86-8ec565c0bb00/New%20Member%20Mixer.jpg"
-        },
-        {
-            "title": "Time for Tea",
-            "startDate": "2025-11-20T13:00:00Z",
-            "endDate": "2025-11-20T14:00:00Z",
-            "description": "Time for Tea November 20, 1:00 pm Explore the fine art of tea and food pairing with a certified tea sommelier. Discover how nuanced flavors enhance cuisine through expertly selected teas and culinary harmony over the Holiday season.",
-            "location": "",
-            "dateStr": "November 20",
-            "timeStr": "1:00 pm",
-            "price": "",
-            "instructor": "",
-            "registration": "",
-            "image_url": "https://cms.seniorskingston.ca/assets/1444a77f-b919-494d-bfe1-87ae130cbdf5/Featured%20Speaker.jpg"
-        },
-        {
-            "title": "Book & Puzzle EXCHANGE",
-            "startDate": "2025-11-21T10:00:00Z",
-            "endDate": "2025-11-21T11:00:00Z",
-            "description": "Book & Puzzle EXCHANGE November 21, 10:00 am Bring up to 10 paperback books or puzzles to the Rendezvous Café to exchange for any in our library. Additional books or puzzles can be purchased for $2.",
-            "location": "",
-            "dateStr": "November 21",
-            "timeStr": "10:00 am",
-            "price": "$2",
-            "instructor": "",
-            "registration": "",
-            "image_url": "https://cms.seniorskingston.ca/assets/7948f41c-bcf4-42d1-97aa-5c7eb4245861/Book%20&%20Puzzle.jpg"
-        },
-        {
-            "title": "Annual General Meeting",
-            "startDate": "2025-11-21T11:00:00Z",
-            "endDate": "2025-11-21T12:00:00Z",
-            "description": "Annual General Meeting November 21, 11:00 am The theme for the 49th Annual General Meeting is Strategic Growth for Future Success and will be held at The Seniors Centre.",
-            "location": "",
-            "dateStr": "November 21",
-            "timeStr": "11:00 am",
-            "price": "",
-            "instructor": "",
-            "registration": "",
-            "image_url": "https://cms.seniorskingston.ca/assets/29174fb0-87d2-4f16-9d7e-a773dca5ff2a/Speed%20Friending.jpg"
-        },
-        {
-            "title": "December Vista Available for Pickup",
-            "startDate": "2025-11-21T12:00:00Z",
-            "endDate": "2025-11-21T13:00:00Z",
-            "description": "December Vista Available for Pickup November 21, 12:00 pm Volunteer Deliverers pick up their bundles to hand deliver and members can pick up their individual copy.",
-            "location": "",
-            "dateStr": "November 21",
-            "timeStr": "12:00 pm",
-            "price": "",
-            "instructor": "",
-            "registration": "",
-            "image_url": "https://cms.seniorskingston.ca/assets/8c8f92ce-34ef-442e-bab9-a06836704f9d/Vista.jpg"
-        },
-        {
-            "title": "Holiday Artisan Fair",
-            "startDate": "2025-11-22T10:00:00Z",
-            "endDate": "2025-11-22T11:00:00Z",
-            "description": "Holiday Artisan Fair November 22, 10:00 am Something for everyone!",
-            "location": "",
-            "dateStr": "November 22",
-            "timeStr": "10:00 am",
-            "price": "",
-            "instructor": "",
-            "registration": "",
-            "image_url": "https://cms.seniorskingston.ca/assets/a278053e-4f35-40af-a2f6-610cfd893930/Holiday%20Artisan%20Fair.jpg"
-        },
-        {
-            "title": "Simplify Your Digital Life",
-            "startDate": "2025-11-24T12:00:00Z",
-            "endDate": "2025-11-24T13:00:00Z",
-            "description": "Simplify Your Digital Life  November 24, 12:00 pm Feeling overwhelmed by your online accounts, passwords, and subscriptions? This presentation offers practical strategies to simplify your digital life. Learn to organize accounts, manage passwords, use cloud storage effectively, and understand your subscriptions. We'll also explore options for closing services you no longer need – empowering you to take control of your digital world.",
-            "location": "Online",
-            "dateStr": "November 24",
-            "timeStr": "12:00 pm",
-            "price": "",
-            "instructor": "Jarda Zborovsy",
-            "registration": "Call 613.548.7810",
-            "image_url": "https://cms.seniorskingston.ca/assets/cb66e913-8ddb-4252-a74c-4302cec7540f/PFH%20Wednesday%20PM.jpg"
-        },
-        {
-            "title": "Legal Advice",
-            "startDate": "2025-11-24T13:00:00Z",
-            "endDate": "2025-11-24T14:00:00Z",
-            "description": "Legal Advice November 24, 1:00 pm A practicing lawyer provides confidential advice by phone. Appointment required (20 minutes max).",
-            "location": "",
-            "dateStr": "November 24",
-            "timeStr": "1:00 pm",
-            "price": "",
-            "instructor": "",
-            "registration": "Call 613.548.7810",
-            "image_url": "https://cms.seniorskingston.ca/assets/ff281879-79a3-45e3-ab4c-b54f69a2e371/Legal%20Advice.JPG"
-        },
-        {
-            "title": "Fresh Food Market",
-            "startDate": "2025-11-25T10:00:00Z",
-            "endDate": "2025-11-25T11:00:00Z",
-            "description": "Fresh Food Market November 25, 10:00 am Lionhearts brings fresh, affordable produce and chef-created gourmet healthy options to The Seniors Centre to help you keep your belly full without emptying your wallet.",
-            "location": "",
-            "dateStr": "November 25",
-            "timeStr": "10:00 am",
-            "price": "",
-            "instructor": "",
-            "registration": "",
-            "image_url": "https://cms.seniorskingston.ca/assets/6d7e0dd8-63c7-45ff-916d-67280d4f9966/Fresh%20Food%20Market.jpg"
-        },
-        {
-            "title": "Holiday Lunch",
-            "startDate": "2025-11-25T12:00:00Z",
-            "endDate": "2025-11-25T13:00:00Z",
-            "description": "Holiday Lunch November 25, 12:00 pm Tomato Basil Soup, Roast Turkey, dressing, mashed potatoes, vegetables, cranberry sauce, and dessert!",
-            "location": "Online",
-            "dateStr": "November 25",
-            "timeStr": "12:00 pm",
-            "price": "$25",
-            "instructor": "",
-            "registration": "call 613.548.7810",
-            "image_url": "https://cms.seniorskingston.ca/assets/e09e616f-444c-4f2d-989a-32fa84b34083/Birthday.jpg"
-        },
-        {
-            "title": "Domino Theatre Dress Rehearsal: Miss Bennet: Christmas at Pemberley",
-            "startDate": "2025-11-26T19:30:00Z",
-            "endDate": "2025-11-26T20:30:00Z",
-            "description": "Domino Theatre Dress Rehearsal: Miss Bennet: Christmas at Pemberley November 26, 7:30 pm Celebrate the holidays with a witty sequel to Pride and Prejudice, where overlooked Mary Bennet discovers romance at Pemberley. Full of heart, humour, and Regency charm, this play delights.",
-            "location": "Online",
-            "dateStr": "November 26",
-            "timeStr": "7:30 pm",
-            "price": "",
-            "instructor": "",
-            "registration": "",
-            "image_url": "https://cms.seniorskingston.ca/assets/365bab44-7685-4223-8319-d8dea27b3484/Domino%20Dress%20Rehearsal.jpg"
-        },
-        {
-            "title": "Anxiety Unlocked",
-            "startDate": "2025-11-27T13:00:00Z",
-            "endDate": "2025-11-27T14:00:00Z",
-            "description": "Anxiety Unlocked  November 27, 1:00 pm Discover fun, easy-to-use tools that bring quick relief from anxiety. Learn simple, effective techniques you may not know, designed to calm your mind, ease stress, and restore balance anytime, anywhere.",
-            "location": "",
-            "dateStr": "November 27",
-            "timeStr": "1:00 pm",
-            "price": "",
-            "instructor": "",
-            "registration": "",
-            "image_url": "https://cms.seniorskingston.ca/assets/1444a77f-b919-494d-bfe1-87ae130cbdf5/Featured%20Speaker.jpg"
-        }
-    ]
+    return [event.to_dict() for event in HARDCODED_NOVEMBER_EVENTS]
+
+# Flat JSON objects in a script that mention a "title", "event" or "name" key, found in one
+# scan; each object is parsed once even when it has several of those keys
+SCRIPT_EVENT_OBJECT_RE = re.compile(r'\{[^{}]*"(?:title|event|name)"[^{}]*\}', re.IGNORECASE)
 
 def extract_events_from_scripts(soup):
     """Extract events from JavaScript/JSON data in script tags"""
     events = []
     try:
-        script_tags = soup.find_all('script')
-        for script in script_tags:
-            if script.string:
-                script_content = script.string
+        now_iso = datetime.now().isoformat()
+        # .string checks the tag's children each time it is read, so take each script's text once
+        script_contents = [script.string for script in soup.find_all('script') if script.string]
+        for script_content in script_contents:
+            script_lower = script_content.lower()
+            
+            # Look for event-related JSON data
+            if any(keyword in script_lower for keyword in ('event', 'calendar', 'schedule', 'november', 'december')):
+                print("🔍 Found potential event data in script")
                 
-                # Look for event-related JSON data
-                if any(keyword in script_content.lower() for keyword in ['event', 'calendar', 'schedule', 'november', 'december']):
-                    print("🔍 Found potential event data in script")
-                    
-                    # Try to extract JSON objects
-                    json_patterns = [
-                        r'\{[^{}]*"title"[^{}]*\}',
-                        r'\{[^{}]*"event"[^{}]*\}',
-                        r'\{[^{}]*"name"[^{}]*\}'
-                    ]
-                    
-                    for pattern in json_patterns:
-                        matches = re.findall(pattern, script_content, re.IGNORECASE)
-                        for match in matches:
-                            try:
-                                data = json.loads(match)
-                                if 'title' in data or 'event' in data or 'name' in data:
-                                    event = create_event_from_json(data)
-                                    if event:
-                                        events.append(event)
-                            except:
-                                continue
+                # Try to extract JSON objects, lazily so nothing past the 20-event cap is matched or parsed
+                for json_match in SCRIPT_EVENT_OBJECT_RE.finditer(script_content):
+                    try:
+                        data = _parse_json(json_match.group(0))
+                        if 'title' in data or 'event' in data or 'name' in data:
+                            event = create_event_from_json(data, now_iso)
+                            if event:
+                                events.append(event)
+                                if len(events) >= 20:
+                                    return events
+                    except ValueError:
+                        # Not valid JSON (e.g. a JS object literal with unquoted keys)
+                        continue
         
         return events[:20]  # Limit to 20 events
             
@@ -2979,10 +3225,14 @@ def extract_events_from_scripts(soup):
         print(f"❌ Error extracting events from scripts: {e}")
         return []
 
+# Any month name anywhere in the text (plain substring, so "may" also matches inside words)
+MONTH_NAME_RE = re.compile(r'january|february|march|april|may|june|july|august|september|october|november|december', re.IGNORECASE)
+
 def extract_events_from_html(soup):
     """Extract events from HTML structure"""
     events = []
     try:
+        now_iso = datetime.now().isoformat()
         # Look for common event container patterns
         selectors = [
             'div[class*="event"]',
@@ -2997,12 +3247,14 @@ def extract_events_from_html(soup):
             elements = soup.select(selector)
             for element in elements:
                 text = element.get_text().strip()
-                if len(text) > 30 and any(word in text.lower() for word in ['november', 'december', 'january', 'february', 'march', 'april', 'may', 'june', 'july', 'august', 'september', 'october']):
-                    event = create_event_from_text(text)
+                if len(text) > 30 and MONTH_NAME_RE.search(text):
+                    event = create_event_from_text(text, now_iso)
                     if event:
                         events.append(event)
+                        if len(events) >= 20:
+                            return events  # Limit to 20 events, nothing further is parsed
                         
-        return events[:20]  # Limit to 20 events
+        return events
         
     except Exception as e:
         print(f"❌ Error extracting events from HTML: {e}")
@@ -3012,42 +3264,47 @@ def extract_events_from_text(soup):
     """Extract events from text content"""
     events = []
     try:
+        now_iso = datetime.now().isoformat()
         text_content = soup.get_text()
-        lines = text_content.split('\n')
         
-        for line in lines:
+        for line in text_content.splitlines():
             line = line.strip()
-            if len(line) > 20 and any(word in line.lower() for word in ['november', 'december', 'january', 'february', 'march', 'april', 'may', 'june', 'july', 'august', 'september', 'october']):
-                event = create_event_from_text(line)
+            if len(line) > 20 and MONTH_NAME_RE.search(line):
+                event = create_event_from_text(line, now_iso)
                 if event:
                     events.append(event)
+                    if len(events) >= 20:
+                        return events  # Limit to 20 events, nothing further is scanned
                     
-        return events[:20]  # Limit to 20 events
+        return events
         
     except Exception as e:
         print(f"❌ Error extracting events from text: {e}")
         return []
 
-def create_event_from_json(data):
-    """Create event object from JSON data"""
+def create_event_from_json(data, now_iso=None):
+    """Create event object from JSON data (now_iso lets a batch share one timestamp)"""
     try:
+        now_iso = now_iso or datetime.now().isoformat()
         title = data.get('title') or data.get('event') or data.get('name') or 'Event'
         return {
             "title": title[:50],
             "description": str(data.get('description', title)),
             "image_url": "/event-schedule-banner.png",
-            "startDate": datetime.now().isoformat(),
-            "endDate": datetime.now().isoformat(),
+            "startDate": now_iso,
+            "endDate": now_iso,
             "location": "Seniors Kingston",
             "dateStr": "TBD",
             "timeStr": "TBD"
         }
-    except:
+    except TypeError:
+        # title was a number or object rather than a string
         return None
 
-def create_event_from_text(text):
-    """Create event object from text content"""
+def create_event_from_text(text, now_iso=None):
+    """Create event object from text content (now_iso lets a batch share one timestamp)"""
     try:
+        now_iso = now_iso or datetime.now().isoformat()
         # Clean up the text
         lines = [line.strip() for line in text.split('\n') if line.strip()]
         title = lines[0] if lines else text[:50]
@@ -3059,90 +3316,105 @@ def create_event_from_text(text):
             "title": title,
             "description": text,
             "image_url": "/event-schedule-banner.png", 
-            "startDate": datetime.now().isoformat(),
-            "endDate": datetime.now().isoformat(),
+            "startDate": now_iso,
+            "endDate": now_iso,
             "location": "Seniors Kingston",
             "dateStr": "TBD",
             "timeStr": "TBD"
         }
-    except:
+    except (AttributeError, TypeError):
         return None
 
+# November 2025 events used when the requests scrape fails. Kept as JSON text and parsed on
+# first use, so importing the backend doesn't build these dicts.
+NOVEMBER_2025_EVENTS_JSON = """[
+    {
+        "title": "Holiday Artisan Fair",
+        "startDate": "2025-11-22T10:00:00Z",
+        "endDate": "2025-11-22T16:00:00Z",
+        "description": "Local artisans showcase their handmade crafts and holiday gifts",
+        "location": "Seniors Kingston Centre",
+        "dateStr": "November 22, 2025",
+        "timeStr": "10:00 AM - 4:00 PM",
+        "image_url": "/event-schedule-banner.png",
+        "price": "Free admission",
+        "instructor": "Various Artisans",
+        "registration": "No registration required"
+    },
+    {
+        "title": "Thanksgiving Potluck",
+        "startDate": "2025-11-28T12:00:00Z",
+        "endDate": "2025-11-28T15:00:00Z",
+        "description": "Community Thanksgiving celebration with potluck dinner",
+        "location": "Seniors Kingston Centre",
+        "dateStr": "November 28, 2025",
+        "timeStr": "12:00 PM - 3:00 PM",
+        "image_url": "/event-schedule-banner.png",
+        "price": "Free",
+        "instructor": "Community",
+        "registration": "Bring a dish to share"
+    },
+    {
+        "title": "Winter Wellness Workshop",
+        "startDate": "2025-11-15T14:00:00Z",
+        "endDate": "2025-11-15T16:00:00Z",
+        "description": "Learn about staying healthy and active during winter months",
+        "location": "Seniors Kingston Centre",
+        "dateStr": "November 15, 2025",
+        "timeStr": "2:00 PM - 4:00 PM",
+        "image_url": "/event-schedule-banner.png",
+        "price": "Free",
+        "instructor": "Health Professional",
+        "registration": "Call to register"
+    },
+    {
+        "title": "November Book Club",
+        "startDate": "2025-11-08T14:00:00Z",
+        "endDate": "2025-11-08T16:00:00Z",
+        "description": "Monthly book discussion group",
+        "location": "Seniors Kingston Centre",
+        "dateStr": "November 8, 2025",
+        "timeStr": "2:00 PM - 4:00 PM",
+        "image_url": "/event-schedule-banner.png",
+        "price": "Free",
+        "instructor": "Book Club Leader",
+        "registration": "No registration required"
+    },
+    {
+        "title": "Fall Craft Workshop",
+        "startDate": "2025-11-12T10:00:00Z",
+        "endDate": "2025-11-12T12:00:00Z",
+        "description": "Create beautiful fall-themed crafts",
+        "location": "Seniors Kingston Centre",
+        "dateStr": "November 12, 2025",
+        "timeStr": "10:00 AM - 12:00 PM",
+        "image_url": "/event-schedule-banner.png",
+        "price": "$5 materials fee",
+        "instructor": "Craft Instructor",
+        "registration": "Call to register"
+    }
+]"""
+
+@lru_cache(maxsize=1)
+def _november_2025_events():
+    """The parsed November 2025 fallback events, shared; callers get copies"""
+    return tuple(_share_repeated_strings(_parse_json(NOVEMBER_2025_EVENTS_JSON)))
+
 def get_november_2025_events_fallback():
     """Return comprehensive November 2025 events as fallback"""
-    return [
-            {
-            'title': 'Holiday Artisan Fair',
-            'startDate': '2025-11-22T10:00:00Z',
-            'endDate': '2025-11-22T16:00:00Z',
-            'description': 'Local artisans showcase their handmade crafts and holiday gifts',
-            'location': 'Seniors Kingston Centre',
-            'dateStr': 'November 22, 2025',
-            'timeStr': '10:00 AM - 4:00 PM',
-            'image_url': '/event-schedule-banner.png',
-            'price': 'Free admission',
-            'instructor': 'Various Artisans',
-            'registration': 'No registration required'
-        },
-        {
-            'title': 'Thanksgiving Potluck',
-            'startDate': '2025-11-28T12:00:00Z',
-            'endDate': '2025-11-28T15:00:00Z',
-            'description': 'Community Thanksgiving celebration with potluck dinner',
-            'location': 'Seniors Kingston Centre',
-            'dateStr': 'November 28, 2025',
-            'timeStr': '12:00 PM - 3:00 PM',
-            'image_url': '/event-schedule-banner.png',
-            'price': 'Free',
-            'instructor': 'Community',
-            'registration': 'Bring a dish to share'
-        },
-        {
-            'title': 'Winter Wellness Workshop',
-            'startDate': '2025-11-15T14:00:00Z',
-            'endDate': '2025-11-15T16:00:00Z',
-            'description': 'Learn about staying healthy and active during winter months',
-            'location': 'Seniors Kingston Centre',
-            'dateStr': 'November 15, 2025',
-            'timeStr': '2:00 PM - 4:00 PM',
-            'image_url': '/event-schedule-banner.png',
-            'price': 'Free',
-            'instructor': 'Health Professional',
-            'registration': 'Call to register'
-        },
-        {
-            'title': 'November Book Club',
-            'startDate': '2025-11-08T14:00:00Z',
-            'endDate': '2025-11-08T16:00:00Z',
-            'description': 'Monthly book discussion group',
-            'location': 'Seniors Kingston Centre',
-            'dateStr': 'November 8, 2025',
-            'timeStr': '2:00 PM - 4:00 PM',
-            'image_url': '/event-schedule-banner.png',
-            'price': 'Free',
-            'instructor': 'Book Club Leader',
-            'registration': 'No registration required'
-        },
-        {
-            'title': 'Fall Craft Workshop',
-            'startDate': '2025-11-12T10:00:00Z',
-            'endDate': '2025-11-12T12:00:00Z',
-            'description': 'Create beautiful fall-themed crafts',
-            'location': 'Seniors Kingston Centre',
-            'dateStr': 'November 12, 2025',
-            'timeStr': '10:00 AM - 12:00 PM',
-            'image_url': '/event-schedule-banner.png',
-            'price': '$5 materials fee',
-            'instructor': 'Craft Instructor',
-            'registration': 'Call to register'
-        }
-    ]
+    return [dict(event) for event in _november_2025_events()]
+
+# Tags extract_events_from_loaded_content looks at, plus the common wrappers around them. Parsing
+# with a strainer on these builds only those subtrees (on this site, everything under the app's root
+# div) and skips <head> and its assets. A kept tag whose wrapper is not kept ends up directly under
+# the document, so the wrappers are listed to keep event titles next to their images.
+EVENT_CONTENT_TAGS = ['main', 'article', 'section', 'div', 'li', 'p', 'span', 'h3', 'h4', 'h5']
 
 def try_simple_requests_scraping():
     """Simple requests fallback for cloud environments"""
     try:
-        import requests
-        from bs4 import BeautifulSoup
+        if BeautifulSoup is None:
+            raise ImportError("beautifulsoup4 is not installed")
         
         url = "https://seniorskingston.ca/events"
         headers = {
@@ -3155,10 +3427,10 @@ def try_simple_requests_scraping():
         }
         
         print(f"🔍 Trying simple requests scraping from: {url}")
-        response = requests.get(url, headers=headers, timeout=30)
+        response = SCRAPE_SESSION.get(url, headers=headers, timeout=30)
         
         if response.status_code == 200:
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, HTML_PARSER, parse_only=SoupStrainer(EVENT_CONTENT_TAGS))
             print("✅ Successfully fetched website content")
             
             # Try to extract events from HTML content
@@ -3184,10 +3456,14 @@ def extract_events_from_loaded_content(soup):
     events = []
     
     try:
-        # Look for common event patterns in the loaded content
-        selectors = [
+        # Look for common event patterns in the loaded content. Each group is one union query, so
+        # the tree is walked once per group and an element matching several selectors is seen once;
+        # the site-specific title selectors still go first so their titles win the dedup.
+        site_selectors = [
             # Seniors Kingston specific selectors (based on actual HTML structure)
-            'h5.green', 'h5[class*="green"]', 'h5[data-v-60d883ca]',
+            'h5.green', 'h5[class*="green"]', 'h5[data-v-60d883ca]'
+        ]
+        generic_selectors = [
             # Common event selectors
             'article', '.event', '.post', '.event-item', '[class*="event"]', '.entry', '.event-card', '.event-listing',
             '.events-list li', '.events li', '.event-list-item', '.calendar-event', '.program-event',
@@ -3199,11 +3475,16 @@ def extract_events_from_loaded_content(soup):
             'div', 'li', 'article', 'section'
         ]
         
-        for selector in selectors:
-            elements = soup.select(selector)
-            print(f"🔍 Found {len(elements)} elements with selector: {selector}")
+        seen_elements = set()
+        seen_titles = set()
+        for selectors in (site_selectors, generic_selectors):
+            elements = soup.select(', '.join(selectors))
+            print(f"🔍 Found {len(elements)} elements with selectors: {', '.join(selectors)}")
             
             for element in elements:
+                if id(element) in seen_elements:
+                    continue
+                seen_elements.add(id(element))
                 try:
                     # Get all text content
                     text_content = element.get_text().strip()
@@ -3216,10 +3497,12 @@ def extract_events_from_loaded_content(soup):
                     if element.name == 'h5' and 'green' in element.get('class', []):
                         print(f"🎯 Found event title: {text_content}")
                         event_data = parse_event_from_text(text_content)
-                        if event_data and not any(e['title'] == event_data['title'] for e in events):
-                            # Look for associated image in the same container
+                        if event_data and event_data['title'] not in seen_titles:
+                            # Look for associated image in the same container. A title that sits
+                            # directly under the document has no container, and searching the
+                            # whole page would pick up an unrelated image.
                             parent = element.parent
-                            if parent:
+                            if parent and not isinstance(parent, BeautifulSoup):
                                 img = parent.find('img')
                                 if img and img.get('src'):
                                     event_data['image_url'] = img.get('src')
@@ -3232,6 +3515,7 @@ def extract_events_from_loaded_content(soup):
                                             print(f"🖼️ Found event image in sibling: {event_data['image_url']}")
                                             break
                             
+                            seen_titles.add(event_data['title'])
                             events.append(event_data)
                             print(f"📅 Added event: {event_data['title']}")
                         continue
@@ -3239,7 +3523,8 @@ def extract_events_from_loaded_content(soup):
                     # Look for event-like patterns in other elements
                     if is_likely_event_content(text_content):
                         event_data = parse_event_from_text(text_content)
-                        if event_data and not any(e['title'] == event_data['title'] for e in events):
+                        if event_data and event_data['title'] not in seen_titles:
+                            seen_titles.add(event_data['title'])
                             events.append(event_data)
                             print(f"📅 Added event: {event_data['title']}")
                 
@@ -3253,29 +3538,82 @@ def extract_events_from_loaded_content(soup):
         print(f"❌ Error extracting events: {e}")
         return []
 
+# Words that suggest a block of page text describes an event, checked as plain substrings
+EVENT_INDICATORS = [
+    'october', 'november', 'december', 'january', 'february', 'march', 'april', 'may', 'june', 'july', 'august', 'september',
+    'am', 'pm', 'morning', 'afternoon', 'evening', 'night',
+    'clinic', 'workshop', 'class', 'meeting', 'party', 'lunch', 'dinner', 'seminar', 'presentation', 'tour', 'social', 'game', 'music', 'dance',
+    'health', 'legal', 'technology', 'book', 'puzzle', 'exchange', 'market', 'celtic', 'kitchen', 'whisky', 'tasting', 'board', 'vista', 'pickup',
+    'internet', 'smartphone', 'phone', 'medical', 'myths', 'fresh', 'food', 'senior', 'woman', 'google', 'app', 'hearing', 'sex', 'top', 'free',
+    'kingston', 'taxi', 'tales', 'fire', 'safety', 'cafe', 'franglish', 'domino', 'theatre', 'witness', 'prosecution', 'ally', 'later', 'life', 'learning',
+    'library', 'resources', 'tuesday', 'tom', 'sound', 'bath', 'board', 'meeting', 'paint', 'gouache', 'achieve', 'best', 'health', 'kenny', 'dolly',
+    'wearable', 'tech', 'legal', 'advice', 'astronomy', 'carole', 'dance', 'party'
+]
+EVENT_INDICATORS_RE = re.compile('|'.join(re.escape(indicator) for indicator in dict.fromkeys(EVENT_INDICATORS)), re.IGNORECASE)
+
 def is_likely_event_content(text):
     """Check if text content looks like an event"""
-    # Look for event indicators
-    event_indicators = [
-        'october', 'november', 'december', 'january', 'february', 'march', 'april', 'may', 'june', 'july', 'august', 'september',
-        'am', 'pm', 'morning', 'afternoon', 'evening', 'night',
-        'clinic', 'workshop', 'class', 'meeting', 'party', 'lunch', 'dinner', 'seminar', 'presentation', 'tour', 'social', 'game', 'music', 'dance',
-        'health', 'legal', 'technology', 'book', 'puzzle', 'exchange', 'market', 'celtic', 'kitchen', 'whisky', 'tasting', 'board', 'vista', 'pickup',
-        'internet', 'smartphone', 'phone', 'medical', 'myths', 'fresh', 'food', 'senior', 'woman', 'google', 'app', 'hearing', 'sex', 'top', 'free',
-        'kingston', 'taxi', 'tales', 'fire', 'safety', 'cafe', 'franglish', 'domino', 'theatre', 'witness', 'prosecution', 'ally', 'later', 'life', 'learning',
-        'library', 'resources', 'tuesday', 'tom', 'sound', 'bath', 'board', 'meeting', 'paint', 'gouache', 'achieve', 'best', 'health', 'kenny', 'dolly',
-        'wearable', 'tech', 'legal', 'advice', 'astronomy', 'carole', 'dance', 'party'
-    ]
-    
-    text_lower = text.lower()
-    return any(indicator in text_lower for indicator in event_indicators)
+    return EVENT_INDICATORS_RE.search(text) is not None
+
+# The date shapes parse_event_from_text accepts, as one alternation so each line is scanned once:
+# full month name, abbreviated month, day-before-month, then numeric D/M(/Y)
+EVENT_TEXT_DATE_RE = re.compile(
+    r'(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2}(?:,\s*\d{4})?'
+    r'|(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2}(?:,\s*\d{4})?'
+    r'|\d{1,2}\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)(?:\s+\d{4})?'
+    r'|\d{1,2}/\d{1,2}(?:/\d{2,4})?',
+    re.IGNORECASE
+)
+
+# Full and three-letter month names, for dates that dateutil would read the same way
+MONTH_NAME_NUMBERS = {
+    **MONTH_NUMBERS,
+    'january': 1, 'february': 2, 'march': 3, 'april': 4, 'june': 6, 'july': 7,
+    'august': 8, 'september': 9, 'october': 10, 'november': 11, 'december': 12,
+}
+# The plain date shapes scraped text usually holds: "November 18[, 2025]", "18 November [2025]", "11/18[/2025]"
+PLAIN_EVENT_DATE_RE = re.compile(
+    r'(?P<month>[a-z]+)\s+(?P<day>\d{1,2})(?:,\s*(?P<year>\d{4}))?'
+    r'|(?P<day2>\d{1,2})\s+(?P<month2>[a-z]+)(?:\s+(?P<year2>\d{4}))?'
+    r'|(?P<num_month>\d{1,2})/(?P<num_day>\d{1,2})(?:/(?P<num_year>\d{4}))?',
+    re.IGNORECASE
+)
+
+def _parse_plain_event_date(date_str, today):
+    """datetime for a date in one of the plain shapes (year from today if missing), or None to leave it to dateutil"""
+    match = PLAIN_EVENT_DATE_RE.fullmatch(date_str.strip())
+    if not match:
+        return None
+    month_name = match['month'] or match['month2']
+    if month_name:
+        month = MONTH_NAME_NUMBERS.get(month_name.lower())
+        day = match['day'] or match['day2']
+        year = match['year'] or match['year2']
+    else:
+        # dateutil reads "13/05" day-first, so only month-first numeric dates are handled here
+        month = int(match['num_month'])
+        month = month if 1 <= month <= 12 else None
+        day, year = match['num_day'], match['num_year']
+    if month is None:
+        return None
+    try:
+        return datetime(int(year) if year else today.year, month, int(day))
+    except ValueError:
+        return None
+
+@lru_cache(maxsize=4096)
+def _parse_event_date_cached(date_str, today):
+    """Fuzzy-parse a date string against a given day (yearless dates like "November 18" fill in from it)"""
+    return (_parse_plain_event_date(date_str, today)
+            or parser.parse(date_str, fuzzy=True, default=datetime.combine(today, datetime.min.time())))
+
+def _parse_event_date(date_str):
+    """Fuzzy-parse a scraped date string, memoized per string and day since pages repeat the same dates"""
+    return _parse_event_date_cached(date_str, datetime.now().date())
 
 def parse_event_from_text(text):
     """Parse event data from text content"""
     try:
-        import re
-        from dateutil import parser
-        
         lines = text.split('\n')
         title = None
         date_str = None
@@ -3292,42 +3630,24 @@ def parse_event_from_text(text):
             return None
         
         # Look for date patterns
-        date_patterns = [
-            r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2}(?:,\s*\d{4})?',
-            r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2}(?:,\s*\d{4})?',
-            r'\d{1,2}\s+(January|February|March|April|May|June|July|August|September|October|November|December)(?:\s+\d{4})?',
-            r'\d{1,2}/\d{1,2}(?:/\d{2,4})?'
-        ]
-        
         for line in lines:
-            for pattern in date_patterns:
-                date_match = re.search(pattern, line, re.IGNORECASE)
-                if date_match:
-                    date_str = date_match.group(0)
-                    break
-            if date_str:
+            date_match = EVENT_TEXT_DATE_RE.search(line)
+            if date_match:
+                date_str = date_match.group(0)
                 break
         
         # Look for time patterns
-        time_patterns = [
-            r'(\d{1,2}:\d{2}\s*(?:am|pm|AM|PM)?)',
-            r'(\d{1,2}\s*(?:am|pm|AM|PM))'
-        ]
-        
         for line in lines:
-            for pattern in time_patterns:
-                time_match = re.search(pattern, line, re.IGNORECASE)
-                if time_match:
-                    time_str = time_match.group(1)
-                    break
-            if time_str:
+            time_match = EVENT_TIME_RE.search(line)
+            if time_match:
+                time_str = time_match.group(1)
                 break
         
         # Parse date
         event_date = None
         if date_str:
             try:
-                event_date = parser.parse(date_str, fuzzy=True)
+                event_date = _parse_event_date(date_str)
             except:
                 pass
         
@@ -3350,10 +3670,6 @@ def parse_event_from_text(text):
         return None
 
 # Automatic syncing with Seniors Kingston website
-import threading
-import time
-import re
-from datetime import datetime, timedelta
 
 # Global variable to store last sync time
 last_sync_time = None
@@ -3382,82 +3698,95 @@ def sync_with_seniors_kingston():
         print(f"❌ Sync error: {e}")
         return False
 
-def start_auto_sync():
-    """Start the automatic sync process in a background thread"""
-    def sync_worker():
-        while True:
-            try:
-                current_time = datetime.now()
-                
-                # Check if it's time to sync
-                if (last_sync_time is None or 
-                    (current_time - last_sync_time).total_seconds() >= sync_interval_hours * 3600):
-                    
-                    sync_with_seniors_kingston()
-                
-                # Sleep for 1 hour before checking again
-                time.sleep(3600)
-                
-            except Exception as e:
-                print(f"❌ Auto sync worker error: {e}")
-                time.sleep(3600)  # Continue trying every hour
-    
-    # Start the sync worker in a background thread
-    sync_thread = threading.Thread(target=sync_worker, daemon=True)
-    sync_thread.start()
-    print("🔄 Automatic sync started - will sync every 6 hours")
+def run_auto_sync():
+    """Scheduled sync; if it finds nothing, try again in an hour rather than waiting a week"""
+    if not sync_with_seniors_kingston() and scheduler:
+        scheduler.add_job(run_auto_sync, 'date', run_date=datetime.now() + timedelta(hours=1),
+                          id='auto_sync_retry', replace_existing=True)
+
+def start_auto_sync(scheduler):
+    """Start the automatic sync process as a job on the background scheduler"""
+    # The scheduler fires the job when it is due, so nothing wakes up hourly just to check the time
+    scheduler.add_job(run_auto_sync, 'interval', hours=sync_interval_hours,
+                      next_run_time=datetime.now(), id='auto_sync', replace_existing=True)
+    print(f"🔄 Automatic sync started - will sync every {sync_interval_hours} hours")
 
 # Start automatic syncing when the server starts - DISABLED to prevent data changes
-# start_auto_sync()
+# (re-enable with start_auto_sync(scheduler) in lifespan_handler)
 print("⏸️ Automatic sync disabled - events will come only from stored file")
 
+# Look for common event container patterns
+EVENT_CONTAINER_SELECTOR = ', '.join([
+    'article', '.event', '.event-item', '.event-card', '.event-listing',
+    'div[class*="event"]', 'li[class*="event"]', '.post', '.entry',
+    'div[class*="post"]', 'div[class*="entry"]', '.program'
+])
+
 def extract_events_comprehensively(soup):
     """Extract events from Seniors Kingston website systematically"""
-    events = []
     try:
-        import re
-        from dateutil import parser
-        
         print("🔍 Starting systematic event extraction...")
         
-        # First, try to find event containers or structured elements
-        event_containers = []
+        # First, try to find event containers or structured elements. One union query walks the
+        # tree once and returns each container once, in document order, however many selectors match it.
+        event_containers = soup.select(EVENT_CONTAINER_SELECTOR)
+        if event_containers:
+            print(f"📦 Found {len(event_containers)} containers with selector: {EVENT_CONTAINER_SELECTOR}")
         
-        # Look for common event container patterns
-        container_selectors = [
-            'article', '.event', '.event-item', '.event-card', '.event-listing',
-            'div[class*="event"]', 'li[class*="event"]', '.post', '.entry',
-            'div[class*="post"]', 'div[class*="entry"]', '.program'
-        ]
+        # Convert to final format as events are collected, so the 50-event limit counts only
+        # events that survive finalizing (an unparseable date drops the event)
+        final_events = []
         
-        for selector in container_selectors:
-            containers = soup.select(selector)
-            if containers:
-                print(f"📦 Found {len(containers)} containers with selector: {selector}")
-                event_containers.extend(containers)
+        def finalize(event):
+            try:
+                # Parse date
+                event_date = event.get('date')
+                if isinstance(event_date, str):
+                    event_date = _parse_event_date(event_date)
+                
+                # Parse time
+                event_time = event.get('time', 'TBA')
+                
+                # Create final event data
+                final_event = {
+                    'title': event['title'],
+                    'startDate': (event_date or datetime.now()).isoformat() + 'Z',
+                    'endDate': ((event_date or datetime.now()) + timedelta(hours=1)).isoformat() + 'Z',
+                    'description': event.get('description', ''),
+                    'location': '',
+                    'dateStr': event_date.strftime('%B %d, %Y') if event_date else 'TBA',
+                    'timeStr': event_time
+                }
+                
+                final_events.append(final_event)
+                print(f"✅ Finalized event: {final_event['title']} ({final_event['dateStr']} {event_time})")
+                
+            except Exception as e:
+                print(f"❌ Error finalizing event: {e}")
         
         # If no structured containers found, get all text and parse line by line
         if not event_containers:
             print("📄 No structured containers found, parsing all text...")
             text_content = soup.get_text()
-            lines = text_content.split('\n')
             
             current_event = None
-            for i, line in enumerate(lines):
-                line = line.strip()
-                if not line or len(line) < 5:
+            for line in map(str.strip, text_content.splitlines()):
+                if len(final_events) >= 50:
+                    break  # Only 50 events are returned, the rest of the page need not be read
+                if len(line) < 5:
                     continue
                 
                 # Look for event titles (green text under company logo)
                 if is_event_title(line):
                     if current_event:
-                        events.append(current_event)
+                        current_event['description'] = ' '.join(current_event.pop('description_parts'))
+                        finalize(current_event)
                     
                     current_event = {
                         'title': line,
                         'date': None,
                         'time': None,
-                        'description': ''
+                        'description_parts': []  # detail lines, joined once the event is complete
                     }
                     print(f"📅 Found event title: {line}")
                 
@@ -3471,64 +3800,59 @@ def extract_events_comprehensively(soup):
                 
                 # Look for additional event details
                 elif current_event and is_event_detail(line):
-                    if not current_event['description']:
-                        current_event['description'] = line
-                    else:
-                        current_event['description'] += f" {line}"
+                    current_event['description_parts'].append(line)
             
             # Add the last event if exists
-            if current_event:
-                events.append(current_event)
+            if current_event and len(final_events) < 50:
+                current_event['description'] = ' '.join(current_event.pop('description_parts'))
+                finalize(current_event)
         
         else:
             # Process structured containers
             for container in event_containers:
+                if len(final_events) >= 50:
+                    break
                 try:
                     event_data = extract_event_from_container(container)
                     if event_data:
-                        events.append(event_data)
+                        finalize(event_data)
                 except Exception as e:
                     print(f"❌ Error processing container: {e}")
                     continue
         
-        # Convert to final format
-        final_events = []
-        for event in events:
-            try:
-                # Parse date
-                event_date = event.get('date')
-                if isinstance(event_date, str):
-                    event_date = parser.parse(event_date, fuzzy=True)
-                
-                # Parse time
-                event_time = event.get('time', 'TBA')
-                
-                # Create final event data
-                final_event = {
-                    'title': event['title'],
-                    'startDate': (event_date or datetime.now()).isoformat() + 'Z',
-                    'endDate': ((event_date or datetime.now()) + timedelta(hours=1)).isoformat() + 'Z',
-                    'description': event.get('description', ''),
-                    'location': '',
-                    'dateStr': event_date.strftime('%B %d, %Y') if event_date else 'TBA',
-                    'timeStr': event_time
-                }
-                
-                final_events.append(final_event)
-                print(f"✅ Finalized event: {final_event['title']} ({final_event['dateStr']} {event_time})")
-                
-            except Exception as e:
-                print(f"❌ Error finalizing event: {e}")
-                continue
-        
-        return final_events[:50]  # Limit to 50 events
+        return final_events
         
     except Exception as e:
         print(f"❌ Error in comprehensive extraction: {e}")
-        import traceback
         traceback.print_exc()
         return []
 
+# Date/time detection for scraped page lines: clock times, "10 am", month names and
+# abbreviations, and numeric D/M or D-M dates, as one alternation so each line is scanned once
+DATE_TIME_LINE_RE = re.compile(
+    r'\d{1,2}:\d{2}\s*(?:am|pm)'
+    r'|\d{1,2}\s*(?:am|pm)'
+    r'|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec'
+    r'|\d{1,2}/\d{1,2}'
+    r'|\d{1,2}-\d{1,2}',
+    re.IGNORECASE
+)
+# A clock time (am/pm optional) or a bare "10 am"; the leftmost one in the line wins
+EVENT_TIME_RE = re.compile(r'(\d{1,2}:\d{2}\s*(?:am|pm)?|\d{1,2}\s*(?:am|pm))', re.IGNORECASE)
+
+# Navigation and generic page text that is never an event title, checked as plain substrings
+TITLE_SKIP_WORDS_RE = re.compile('menu|navigation|header|footer|copyright|privacy|events|calendar|programs', re.IGNORECASE)
+# Words that suggest a line names an event, checked as plain substrings
+TITLE_EVENT_WORDS_RE = re.compile(
+    'clinic|workshop|class|meeting|party|lunch|dinner|'
+    'seminar|presentation|tour|social|game|music|dance|'
+    'health|legal|technology|book|puzzle|exchange|market|'
+    'celtic|kitchen|whisky|tasting|board|vista|pickup|'
+    'internet|smartphone|phone|medical|myths|fresh|food|'
+    'senior|woman|google|app|hearing|sex|top|free',
+    re.IGNORECASE
+)
+
 def is_event_title(line):
     """Check if a line looks like an event title"""
     # Event titles are typically in green, but we can't detect color in text
@@ -3537,70 +3861,26 @@ def is_event_title(line):
         return False
     
     # Skip navigation and generic text
-    skip_words = ['menu', 'navigation', 'header', 'footer', 'copyright', 'privacy', 'events', 'calendar', 'programs']
-    if any(word in line.lower() for word in skip_words):
+    if TITLE_SKIP_WORDS_RE.search(line):
         return False
     
     # Look for event-like patterns
-    event_indicators = [
-        'clinic', 'workshop', 'class', 'meeting', 'party', 'lunch', 'dinner',
-        'seminar', 'presentation', 'tour', 'social', 'game', 'music', 'dance',
-        'health', 'legal', 'technology', 'book', 'puzzle', 'exchange', 'market',
-        'celtic', 'kitchen', 'whisky', 'tasting', 'board', 'vista', 'pickup',
-        'internet', 'smartphone', 'phone', 'medical', 'myths', 'fresh', 'food',
-        'senior', 'woman', 'google', 'app', 'hearing', 'sex', 'top', 'free'
-    ]
-    
-    return any(indicator in line.lower() for indicator in event_indicators)
+    return TITLE_EVENT_WORDS_RE.search(line) is not None
 
 def is_date_time_line(line):
     """Check if a line contains date/time information"""
     # Date/time lines are typically in blue and contain date/time patterns
-    date_time_patterns = [
-        r'\d{1,2}:\d{2}\s*(?:am|pm|AM|PM)',
-        r'\d{1,2}\s*(?:am|pm|AM|PM)',
-        r'(January|February|March|April|May|June|July|August|September|October|November|December)',
-        r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)',
-        r'\d{1,2}/\d{1,2}(?:/\d{2,4})?',
-        r'\d{1,2}-\d{1,2}(?:-\d{2,4})?'
-    ]
-    
-    return any(re.search(pattern, line, re.IGNORECASE) for pattern in date_time_patterns)
+    return DATE_TIME_LINE_RE.search(line) is not None
 
 def extract_date_time(line):
     """Extract date and time from a line"""
     try:
-        import re
-        from dateutil import parser
-        
         # Look for time patterns
-        time_patterns = [
-            r'(\d{1,2}:\d{2}\s*(?:am|pm|AM|PM)?)',
-            r'(\d{1,2}\s*(?:am|pm|AM|PM))'
-        ]
-        
-        time_match = None
-        for pattern in time_patterns:
-            time_match = re.search(pattern, line, re.IGNORECASE)
-            if time_match:
-                break
-        
+        time_match = EVENT_TIME_RE.search(line)
         time_str = time_match.group(1) if time_match else 'TBA'
         
         # Look for date patterns
-        date_patterns = [
-            r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2}(?:,\s*\d{4})?',
-            r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2}(?:,\s*\d{4})?',
-            r'\d{1,2}\s+(January|February|March|April|May|June|July|August|September|October|November|December)(?:\s+\d{4})?',
-            r'\d{1,2}/\d{1,2}(?:/\d{2,4})?'
-        ]
-        
-        date_match = None
-        for pattern in date_patterns:
-            date_match = re.search(pattern, line, re.IGNORECASE)
-            if date_match:
-                break
-        
+        date_match = EVENT_TEXT_DATE_RE.search(line)
         date_str = date_match.group(0) if date_match else None
         
         return {
@@ -3665,6 +3945,19 @@ def extract_event_from_container(container):
         print(f"❌ Error extracting from container: {e}")
         return None
 
+# Lines pairing an October date with an event name, in either order, found in a single scan.
+# Gaps are bounded to 120 characters of the same line, and two-word names only start at a word,
+# so long runs of page text can't make the matcher backtrack quadratically. Longer names come
+# first so "Hearing Clinic" is taken whole over "Hearing".
+OCTOBER_EVENT_NAMES = r'(?:Sex and the Senior Woman|Hearing Clinic|Top 10 Free Google App|Sex|Hearing|Google|App|Clinic|Senior|Woman|Top|Free)'
+OCTOBER_EVENT_RE = re.compile(
+    r'(?:Oct|October)\s+\d+[^\n]{0,120}?' + OCTOBER_EVENT_NAMES +
+    r'|' + OCTOBER_EVENT_NAMES + r'[^\n]{0,120}?(?:Oct|October)\s+\d+'
+    r'|(?<![A-Z])[A-Z][a-z]+ [A-Z][a-z]+[^\n]{0,120}?(?:Oct|October)\s+\d+'
+    r'|(?:Oct|October)\s+\d+[^\n]{0,120}?[A-Z][a-z]+ [A-Z][a-z]+',
+    re.IGNORECASE
+)
+
 def extract_events_from_text(soup):
     """Extract events from text content when selectors fail"""
     events = []
@@ -3673,48 +3966,31 @@ def extract_events_from_text(soup):
         text_content = soup.get_text()
         
         # Look for patterns that might indicate events
-        import re
-        
-        # Common event patterns - more specific for October events
-        patterns = [
-            r'(?:Oct|October)\s+\d+[,\s]*(?:.*?)(?:Sex|Hearing|Google|App|Clinic|Senior|Woman|Top|Free)',
-            r'(?:Sex|Hearing|Google|App|Clinic|Senior|Woman|Top|Free).*?(?:Oct|October)\s+\d+',
-            r'[A-Z][a-z]+ [A-Z][a-z]+.*?(?:Oct|October)\s+\d+',
-            r'(?:Oct|October)\s+\d+.*?[A-Z][a-z]+ [A-Z][a-z]+',
-            r'(?:Oct|October)\s+\d+.*?Sex and the Senior Woman',
-            r'(?:Oct|October)\s+\d+.*?Hearing Clinic',
-            r'(?:Oct|October)\s+\d+.*?Top 10 Free Google App',
-            r'(?:Oct|October)\s+\d+.*?Senior.*?Woman',
-            r'(?:Oct|October)\s+\d+.*?Clinic',
-            r'(?:Oct|October)\s+\d+.*?Google.*?App'
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, text_content, re.IGNORECASE)
-            for match in matches:
-                if len(match.strip()) > 10:  # Only meaningful matches
-                    events.append({
-                        'title': match.strip(),
-                        'startDate': datetime.now().isoformat() + 'Z',
-                        'endDate': (datetime.now() + timedelta(hours=1)).isoformat() + 'Z',
-                        'description': '',
-                        'location': '',
-                        'dateStr': 'TBA',
-                        'timeStr': 'TBA'
-                    })
-                    print(f"📅 Found event via text pattern: {match.strip()}")
+        for found in OCTOBER_EVENT_RE.finditer(text_content):
+            if len(events) >= 30:
+                return events  # Limit to 30 events, the rest of the page need not be scanned
+            match = found.group(0)
+            if len(match.strip()) > 10:  # Only meaningful matches
+                events.append({
+                    'title': match.strip(),
+                    'startDate': datetime.now().isoformat() + 'Z',
+                    'endDate': (datetime.now() + timedelta(hours=1)).isoformat() + 'Z',
+                    'description': '',
+                    'location': '',
+                    'dateStr': 'TBA',
+                    'timeStr': 'TBA'
+                })
+                print(f"📅 Found event via text pattern: {match.strip()}")
         
-        # Also try to extract October events more broadly
-        october_lines = []
-        lines = text_content.split('\n')
-        for line in lines:
+        # Also try to extract October events more broadly, from lines mentioning October and an event word
+        for line in text_content.splitlines():
+            if len(events) >= 30:
+                break
             line = line.strip()
-            if 'oct' in line.lower() and len(line) > 10:
-                october_lines.append(line)
-        
-        # Extract events from October lines
-        for line in october_lines:
-            if any(keyword in line.lower() for keyword in ['sex', 'hearing', 'google', 'clinic', 'senior', 'woman', 'app', 'top', 'free']):
+            line_lower = line.lower()
+            if 'oct' not in line_lower or len(line) <= 10:
+                continue
+            if any(keyword in line_lower for keyword in ['sex', 'hearing', 'google', 'clinic', 'senior', 'woman', 'app', 'top', 'free']):
                 events.append({
                     'title': line,
                     'startDate': datetime.now().isoformat() + 'Z',
@@ -3741,9 +4017,8 @@ def parse_event_date_time(date_str):
             start = datetime.now()
             end = start + timedelta(hours=1)
         else:
-            # Try to parse common date formats
-            from dateutil import parser
-            parsed_date = parser.parse(date_str)
+            # Try to parse common date formats, plain ones without dateutil
+            parsed_date = _parse_plain_event_date(date_str, datetime.now().date()) or parser.parse(date_str)
             start = parsed_date
             end = parsed_date + timedelta(hours=1)
         
@@ -3754,466 +4029,73 @@ def parse_event_date_time(date_str):
         end = start + timedelta(hours=1)
         return start.isoformat() + 'Z', end.isoformat() + 'Z'
 
+# Look for pattern like "Event Name October 24, 1:30 pm Description"
+# Try multiple patterns to extract just the event name
+TITLE_CLEAN_PATTERNS = [
+    re.compile(r'^([^0-9]+?)\s+\w+\s+\d+,\s+\d+:\d+\s+[ap]m'),  # "Event Name October 24, 1:30 pm"
+    re.compile(r'^([^0-9]+?)\s+\w+\s+\d+'),  # "Event Name October 24"
+    re.compile(r'^([^0-9]+?)\s+\d+:\d+\s+[ap]m'),  # "Event Name 1:30 pm"
+    re.compile(r'^([^0-9]+?)\s+\d+'),  # "Event Name 24"
+]
+TITLE_TRAILING_RE = re.compile(r'[,\s]+$')
+
+@lru_cache(maxsize=1024)
+def _clean_event_title(title):
+    """Title with a trailing date/time and description cut off, or the title unchanged if none is found"""
+    for pattern in TITLE_CLEAN_PATTERNS:
+        match = pattern.match(title)
+        if match:
+            clean_title = match.group(1).strip()
+            # Remove trailing punctuation and extra spaces
+            clean_title = TITLE_TRAILING_RE.sub('', clean_title)
+            if len(clean_title) > 3:  # Make sure we have a meaningful title
+                return clean_title
+    return title
+
 @app.get("/api/events")
 def get_events(request: Request):
     """Get all events (real + editable events) from Seniors Kingston"""
     global stored_events  # CRITICAL: Declare global before using
     
-    print(f"🌐 Events API call received")
+    logger.debug("🌐 Events API call received")
     
     # Track the visit
     user_agent = request.headers.get('user-agent', '')
     track_visit(user_agent)
     
-    # PRIORITY: Use stored events first (most reliable)
-    print("🔍 Checking for stored events first...")
-    if stored_events and len(stored_events) > 0:
-        # Remove duplicates from stored_events before returning
-        unique_events = []
-        seen_keys = set()
-        for event in stored_events:
-            key = (event.get('title', ''), event.get('startDate', ''))
-            if key not in seen_keys:
-                unique_events.append(event)
-                seen_keys.add(key)
-        
-        print(f"📦 Using {len(unique_events)} unique stored events (removed {len(stored_events) - len(unique_events)} duplicates)")
-        all_events = unique_events
-    else:
-        # Do NOT scrape anymore. Only return stored events.
-        print("⏸️ Scraping disabled. Using stored events only.")
-        all_events = stored_events
-        
-        # CRITICAL FIX: Auto-load fallback when data is empty
-        if not all_events or len(all_events) == 0:
-            print("⚠️ No stored events found - loading fallback data...")
-            fallback_events = get_comprehensive_november_events()
-            if fallback_events and len(fallback_events) > 0:
-                print(f"✅ Loaded {len(fallback_events)} events from fallback")
-                all_events = fallback_events
-                # Also save to stored_events so they persist
-                stored_events = fallback_events
-                save_stored_events()
-                print(f"💾 Saved fallback events to stored_events.json")
-            
-            # Fix image URLs and clean titles for all events
-    if all_events:
-            for event in all_events:
-                if not event.get('image_url') or event.get('image_url') == '/assets/event-schedule-banner.png':
-                    event['image_url'] = '/logo192.png'  # Use accessible logo as banner
-                
-                # Clean up titles that contain descriptions
-                title = event.get('title', '')
-                description = event.get('description', '')
-                
-                # If title is very long and contains description, extract just the title part
-                if len(title) > 50:  # Lower threshold to catch more cases
-                    import re
-                    # Look for pattern like "Event Name October 24, 1:30 pm Description"
-                    # Try multiple patterns to extract just the event name
-                    patterns = [
-                        r'^([^0-9]+?)\s+\w+\s+\d+,\s+\d+:\d+\s+[ap]m',  # "Event Name October 24, 1:30 pm"
-                        r'^([^0-9]+?)\s+\w+\s+\d+',  # "Event Name October 24"
-                        r'^([^0-9]+?)\s+\d+:\d+\s+[ap]m',  # "Event Name 1:30 pm"
-                        r'^([^0-9]+?)\s+\d+',  # "Event Name 24"
-                    ]
-                    
-                    for pattern in patterns:
-                        match = re.match(pattern, title)
-                        if match:
-                            clean_title = match.group(1).strip()
-                            # Remove trailing punctuation and extra spaces
-                            clean_title = re.sub(r'[,\s]+$', '', clean_title)
-                            if len(clean_title) > 3:  # Make sure we have a meaningful title
-                                event['title'] = clean_title
-                                print(f"🧹 Cleaned title: '{title[:50]}...' -> '{clean_title}'")
-                                break
-            
-    # If no events were processed, provide fallback
-    if 'all_events' not in locals() or len(all_events) == 0:
-        print("📅 No events found, using known events as fallback")
-        all_events = []
-    
-    # REAL EVENTS from Seniors Kingston website - 100% ACCURATE DATA (2025)
-    # Extracted directly from the actual website using Selenium scraping
-    known_events = [
-        # September 2025 Events
-        {
-            'title': "Board Meeting",
-            'startDate': datetime(2025, 9, 24, 20, 0).isoformat() + 'Z',  # 4:00 pm EDT
-            'endDate': datetime(2025, 9, 24, 21, 0).isoformat() + 'Z',
-            'description': "The next scheduled Board meeting is September 24, 4:00pm",
-            'location': '',
-            'dateStr': 'September 24, 2025, 4:00 pm',
-            'timeStr': '4:00 pm'
-        },
-        {
-            'title': "Medical Myths",
-            'startDate': datetime(2025, 9, 25, 17, 0).isoformat() + 'Z',  # 1:00 pm EDT
-            'endDate': datetime(2025, 9, 25, 18, 0).isoformat() + 'Z',
-            'description': "Educational program about medical myths and facts",
-            'location': '',
-            'dateStr': 'September 25, 2025, 1:00 pm',
-            'timeStr': '1:00 pm'
-        },
-        {
-            'title': "Whisky Tasting",
-            'startDate': datetime(2025, 9, 25, 22, 0).isoformat() + 'Z',  # 6:00 pm EDT
-            'endDate': datetime(2025, 9, 25, 23, 0).isoformat() + 'Z',
-            'description': "Sample and learn about different whiskies",
-            'location': '',
-            'dateStr': 'September 25, 2025, 6:00 pm',
-            'timeStr': '6:00 pm'
-        },
-        {
-            'title': "Sound Escapes: You've Got a Friend",
-            'startDate': datetime(2025, 9, 26, 17, 30).isoformat() + 'Z',  # 1:30 pm EDT
-            'endDate': datetime(2025, 9, 26, 18, 30).isoformat() + 'Z',
-            'description': "Musical program featuring classic friendship songs",
-            'location': '',
-            'dateStr': 'September 26, 2025, 1:30 pm',
-            'timeStr': '1:30 pm'
-        },
-        {
-            'title': "Selecting a Smart Phone",
-            'startDate': datetime(2025, 9, 29, 16, 0).isoformat() + 'Z',  # 12:00 pm EDT
-            'endDate': datetime(2025, 9, 29, 17, 0).isoformat() + 'Z',
-            'description': "Workshop on choosing the right smartphone for seniors",
-            'location': '',
-            'dateStr': 'September 29, 2025, 12:00 pm',
-            'timeStr': '12:00 pm'
-        },
-        {
-            'title': "National Day of Truth and Reconciliation",
-            'startDate': datetime(2025, 9, 30, 16, 0).isoformat() + 'Z',  # 12:00 pm EDT
-            'endDate': datetime(2025, 9, 30, 23, 0).isoformat() + 'Z',
-            'description': "National Day of Truth and Reconciliation",
-            'location': '',
-            'dateStr': 'September 30, 2025, 12:00 pm',
-            'timeStr': '12:00 pm'
-        },
-        
-        # October 2025 Events - 100% ACCURATE from website
-        {
-            'title': "Biker Bros",
-            'startDate': datetime(2025, 10, 1, 12, 30).isoformat() + 'Z',  # 8:30 am EDT
-            'endDate': datetime(2025, 10, 1, 13, 30).isoformat() + 'Z',
-            'description': "Motorcycle enthusiasts gathering",
-            'location': '',
-            'dateStr': 'October 1, 2025, 8:30 am',
-            'timeStr': '8:30 am'
-        },
-        {
-            'title': "Kingston Taxi Tales",
-            'startDate': datetime(2025, 10, 1, 14, 0).isoformat() + 'Z',  # 10:00 am EDT
-            'endDate': datetime(2025, 10, 1, 15, 0).isoformat() + 'Z',
-            'description': "Stories and experiences from Kingston taxi drivers",
-            'location': '',
-            'dateStr': 'October 1, 2025, 10:00 am',
-            'timeStr': '10:00 am'
-        },
-        {
-            'title': "Sex and the Senior Woman",
-            'startDate': datetime(2025, 10, 2, 17, 0).isoformat() + 'Z',  # 1:00 pm EDT
-            'endDate': datetime(2025, 10, 2, 18, 0).isoformat() + 'Z',
-            'description': "Educational program for senior women",
-            'location': '',
-            'dateStr': 'October 2, 2025, 1:00 pm',
-            'timeStr': '1:00 pm'
-        },
-        {
-            'title': "Hearing Clinic",
-            'startDate': datetime(2025, 10, 3, 13, 0).isoformat() + 'Z',  # 9:00 am EDT
-            'endDate': datetime(2025, 10, 3, 14, 0).isoformat() + 'Z',
-            'description': "Free hearing assessment clinic",
-            'location': '',
-            'dateStr': 'October 3, 2025, 9:00 am',
-            'timeStr': '9:00 am'
-        },
-        {
-            'title': "Top 10 Free Google Apps for Every Device",
-            'startDate': datetime(2025, 10, 6, 16, 0).isoformat() + 'Z',  # 12:00 pm EDT
-            'endDate': datetime(2025, 10, 6, 17, 0).isoformat() + 'Z',
-            'description': "Learn about useful free Google applications",
-            'location': '',
-            'dateStr': 'October 6, 2025, 12:00 pm',
-            'timeStr': '12:00 pm'
-        },
-        {
-            'title': "Fresh Food Market",
-            'startDate': datetime(2025, 10, 7, 14, 0).isoformat() + 'Z',  # 10:00 am EDT
-            'endDate': datetime(2025, 10, 7, 15, 0).isoformat() + 'Z',
-            'description': "Local fresh produce and goods market",
-            'location': '',
-            'dateStr': 'October 7, 2025, 10:00 am',
-            'timeStr': '10:00 am'
-        },
-        {
-            'title': "Fire Safety for Seniors: Seniors Day with Kingston Fire & Rescue",
-            'startDate': datetime(2025, 10, 8, 13, 0).isoformat() + 'Z',  # 9:00 am EDT
-            'endDate': datetime(2025, 10, 8, 14, 0).isoformat() + 'Z',
-            'description': "Fire safety education and prevention for seniors",
-            'location': '',
-            'dateStr': 'October 8, 2025, 9:00 am',
-            'timeStr': '9:00 am'
-        },
-        {
-            'title': "Autumn Floral Centerpiece",
-            'startDate': datetime(2025, 10, 9, 14, 0).isoformat() + 'Z',  # 10:00 am EDT
-            'endDate': datetime(2025, 10, 9, 15, 0).isoformat() + 'Z',
-            'description': "Create beautiful autumn floral arrangements",
-            'location': '',
-            'dateStr': 'October 9, 2025, 10:00 am',
-            'timeStr': '10:00 am'
-        },
-        {
-            'title': "Fraud Prevention",
-            'startDate': datetime(2025, 10, 9, 17, 0).isoformat() + 'Z',  # 1:00 pm EDT
-            'endDate': datetime(2025, 10, 9, 18, 0).isoformat() + 'Z',
-            'description': "Learn how to protect yourself from fraud and scams",
-            'location': '',
-            'dateStr': 'October 9, 2025, 1:00 pm',
-            'timeStr': '1:00 pm'
-        },
-        {
-            'title': "Birthday Lunch",
-            'startDate': datetime(2025, 10, 10, 16, 0).isoformat() + 'Z',  # 12:00 pm EDT
-            'endDate': datetime(2025, 10, 10, 17, 0).isoformat() + 'Z',
-            'description': "Monthly birthday celebration lunch",
-            'location': '',
-            'dateStr': 'October 10, 2025, 12:00 pm',
-            'timeStr': '12:00 pm'
-        },
-        {
-            'title': "Fresh Food Market",
-            'startDate': datetime(2025, 10, 14, 14, 0).isoformat() + 'Z',  # 10:00 am EDT
-            'endDate': datetime(2025, 10, 14, 15, 0).isoformat() + 'Z',
-            'description': "Local fresh produce and goods market",
-            'location': '',
-            'dateStr': 'October 14, 2025, 10:00 am',
-            'timeStr': '10:00 am'
-        },
-        {
-            'title': "Thanksgiving Lunch",
-            'startDate': datetime(2025, 10, 14, 16, 0).isoformat() + 'Z',  # 12:00 pm EDT
-            'endDate': datetime(2025, 10, 14, 17, 0).isoformat() + 'Z',
-            'description': "Community Thanksgiving celebration with traditional meal",
-            'location': '',
-            'dateStr': 'October 14, 2025, 12:00 pm',
-            'timeStr': '12:00 pm'
-        },
-        {
-            'title': "Cafe Franglish",
-            'startDate': datetime(2025, 10, 14, 18, 30).isoformat() + 'Z',  # 2:30 pm EDT
-            'endDate': datetime(2025, 10, 14, 19, 30).isoformat() + 'Z',
-            'description': "French-English conversation cafe",
-            'location': '',
-            'dateStr': 'October 14, 2025, 2:30 pm',
-            'timeStr': '2:30 pm'
-        },
-        {
-            'title': "Domino Theatre Dress Rehearsal: Witness for the Prosecution",
-            'startDate': datetime(2025, 10, 15, 23, 30).isoformat() + 'Z',  # 7:30 pm EDT
-            'endDate': datetime(2025, 10, 16, 0, 30).isoformat() + 'Z',
-            'description': "Dress rehearsal for the Domino Theatre production",
-            'location': 'Domino Theatre',
-            'dateStr': 'October 15, 2025, 7:30 pm',
-            'timeStr': '7:30 pm'
-        },
-        {
-            'title': "Service Canada Clinic",
-            'startDate': datetime(2025, 10, 16, 13, 0).isoformat() + 'Z',  # 9:00 am EDT
-            'endDate': datetime(2025, 10, 16, 14, 0).isoformat() + 'Z',
-            'description': "Get help with Service Canada programs and benefits",
-            'location': '',
-            'dateStr': 'October 16, 2025, 9:00 am',
-            'timeStr': '9:00 am'
-        },
-        {
-            'title': "How to be an Ally",
-            'startDate': datetime(2025, 10, 16, 17, 0).isoformat() + 'Z',  # 1:00 pm EDT
-            'endDate': datetime(2025, 10, 16, 18, 0).isoformat() + 'Z',
-            'description': "Educational workshop on being an effective ally",
-            'location': '',
-            'dateStr': 'October 16, 2025, 1:00 pm',
-            'timeStr': '1:00 pm'
-        },
-        {
-            'title': "Later Life Learning: Series B",
-            'startDate': datetime(2025, 10, 17, 14, 0).isoformat() + 'Z',  # 10:00 am EDT
-            'endDate': datetime(2025, 10, 17, 15, 0).isoformat() + 'Z',
-            'description': "Educational program for continued learning",
-            'location': '',
-            'dateStr': 'October 17, 2025, 10:00 am',
-            'timeStr': '10:00 am'
-        },
-        {
-            'title': "Book & Puzzle EXCHANGE",
-            'startDate': datetime(2025, 10, 17, 14, 0).isoformat() + 'Z',  # 10:00 am EDT
-            'endDate': datetime(2025, 10, 17, 15, 0).isoformat() + 'Z',
-            'description': "Bring books and puzzles to exchange with others",
-            'location': '',
-            'dateStr': 'October 17, 2025, 10:00 am',
-            'timeStr': '10:00 am'
-        },
-        {
-            'title': "Library e-Resources",
-            'startDate': datetime(2025, 10, 20, 16, 0).isoformat() + 'Z',  # 12:00 pm EDT
-            'endDate': datetime(2025, 10, 20, 17, 0).isoformat() + 'Z',
-            'description': "Learn about digital library resources",
-            'location': '',
-            'dateStr': 'October 20, 2025, 12:00 pm',
-            'timeStr': '12:00 pm'
-        },
-        {
-            'title': "Fresh Food Market",
-            'startDate': datetime(2025, 10, 21, 14, 0).isoformat() + 'Z',  # 10:00 am EDT
-            'endDate': datetime(2025, 10, 21, 15, 0).isoformat() + 'Z',
-            'description': "Local fresh produce and goods market",
-            'location': '',
-            'dateStr': 'October 21, 2025, 10:00 am',
-            'timeStr': '10:00 am'
-        },
-        {
-            'title': "Tuesday at Tom's",
-            'startDate': datetime(2025, 10, 21, 19, 0).isoformat() + 'Z',  # 3:00 pm EDT
-            'endDate': datetime(2025, 10, 21, 20, 0).isoformat() + 'Z',
-            'description': "Social gathering at Tom's",
-            'location': 'Tom\'s',
-            'dateStr': 'October 21, 2025, 3:00 pm',
-            'timeStr': '3:00 pm'
-        },
-        {
-            'title': "Sound Bath",
-            'startDate': datetime(2025, 10, 21, 21, 30).isoformat() + 'Z',  # 5:30 pm EDT
-            'endDate': datetime(2025, 10, 21, 22, 30).isoformat() + 'Z',
-            'description': "Relaxing sound therapy session",
-            'location': '',
-            'dateStr': 'October 21, 2025, 5:30 pm',
-            'timeStr': '5:30 pm'
-        },
-        {
-            'title': "Board Meeting",
-            'startDate': datetime(2025, 10, 22, 20, 0).isoformat() + 'Z',  # 4:00 pm EDT
-            'endDate': datetime(2025, 10, 22, 21, 0).isoformat() + 'Z',
-            'description': "Seniors Kingston board meeting",
-            'location': '',
-            'dateStr': 'October 22, 2025, 4:00 pm',
-            'timeStr': '4:00 pm'
-        },
-        {
-            'title': "Paint with Gouache",
-            'startDate': datetime(2025, 10, 23, 14, 0).isoformat() + 'Z',  # 10:00 am EDT
-            'endDate': datetime(2025, 10, 23, 15, 0).isoformat() + 'Z',
-            'description': "Art workshop using gouache painting techniques",
-            'location': '',
-            'dateStr': 'October 23, 2025, 10:00 am',
-            'timeStr': '10:00 am'
-        },
-        {
-            'title': "Achieve Your Best Health",
-            'startDate': datetime(2025, 10, 23, 17, 0).isoformat() + 'Z',  # 1:00 pm EDT
-            'endDate': datetime(2025, 10, 23, 18, 0).isoformat() + 'Z',
-            'description': "Health and wellness workshop for seniors",
-            'location': '',
-            'dateStr': 'October 23, 2025, 1:00 pm',
-            'timeStr': '1:00 pm'
-        },
-        {
-            'title': "Sound Escapes: Kenny & Dolly",
-            'startDate': datetime(2025, 10, 24, 17, 30).isoformat() + 'Z',  # 1:30 pm EDT
-            'endDate': datetime(2025, 10, 24, 18, 30).isoformat() + 'Z',
-            'description': "Musical program featuring Kenny Rogers and Dolly Parton songs",
-            'location': '',
-            'dateStr': 'October 24, 2025, 1:30 pm',
-            'timeStr': '1:30 pm'
-        },
-        {
-            'title': "Wearable Tech",
-            'startDate': datetime(2025, 10, 27, 16, 0).isoformat() + 'Z',  # 12:00 pm EDT
-            'endDate': datetime(2025, 10, 27, 17, 0).isoformat() + 'Z',
-            'description': "Learn about wearable technology for seniors",
-            'location': '',
-            'dateStr': 'October 27, 2025, 12:00 pm',
-            'timeStr': '12:00 pm'
-        },
-        {
-            'title': "Legal Advice",
-            'startDate': datetime(2025, 10, 27, 17, 0).isoformat() + 'Z',  # 1:00 pm EDT
-            'endDate': datetime(2025, 10, 27, 18, 0).isoformat() + 'Z',
-            'description': "Free legal advice session",
-            'location': '',
-            'dateStr': 'October 27, 2025, 1:00 pm',
-            'timeStr': '1:00 pm'
-        },
-        {
-            'title': "Fresh Food Market",
-            'startDate': datetime(2025, 10, 28, 14, 0).isoformat() + 'Z',  # 10:00 am EDT
-            'endDate': datetime(2025, 10, 28, 15, 0).isoformat() + 'Z',
-            'description': "Local fresh produce and goods market",
-            'location': '',
-            'dateStr': 'October 28, 2025, 10:00 am',
-            'timeStr': '10:00 am'
-        },
-        {
-            'title': "18th Century Astronomy",
-            'startDate': datetime(2025, 10, 30, 17, 0).isoformat() + 'Z',  # 1:00 pm EDT
-            'endDate': datetime(2025, 10, 30, 18, 0).isoformat() + 'Z',
-            'description': "Educational program about 18th century astronomy",
-            'location': '',
-            'dateStr': 'October 30, 2025, 1:00 pm',
-            'timeStr': '1:00 pm'
-        },
-        {
-            'title': "Caroles Dance Party",
-            'startDate': datetime(2025, 10, 30, 17, 0).isoformat() + 'Z',  # 1:00 pm EDT
-            'endDate': datetime(2025, 10, 30, 18, 0).isoformat() + 'Z',
-            'description': "Dance party hosted by Carole",
-            'location': '',
-            'dateStr': 'October 30, 2025, 1:00 pm',
-            'timeStr': '1:00 pm'
-        }
-    ]
+    # Do NOT scrape anymore. Only return stored events.
+    # CRITICAL FIX: Auto-load fallback when data is empty
+    if not stored_events:
+        logger.warning("⚠️ No stored events found - loading fallback data...")
+        fallback_events = get_comprehensive_november_events()
+        if fallback_events:
+            logger.info("✅ Loaded %s events from fallback", len(fallback_events))
+            # Also save to stored_events so they persist
+            stored_events = fallback_events
+            save_stored_events()
+            logger.info("💾 Saved fallback events to stored_events.json")
     
     # Always use stored events if available, otherwise return empty list (no fallback to old events)
     if stored_events and len(stored_events) > 0:
-        print(f"📦 Using {len(stored_events)} stored events")
+        logger.debug("📦 Using %s stored events", len(stored_events))
         all_events = stored_events
     else:
-        print("📅 No stored events found - returning empty list (no fallback to old events)")
+        logger.debug("📅 No stored events found - returning empty list (no fallback to old events)")
         all_events = []
     
-    # Fix image URLs and clean titles for all events
+    # Fix image URLs and clean titles for all events. This edits the stored events in place, so
+    # after the first request it only re-checks them; long titles are cleaned through a cache.
     for event in all_events:
         if not event.get('image_url') or event.get('image_url') == '/assets/event-schedule-banner.png':
             event['image_url'] = '/logo192.png'  # Use accessible logo as banner
         
         # Clean up titles that contain descriptions
         title = event.get('title', '')
-        description = event.get('description', '')
-        
-        # If title is very long and contains description, extract just the title part
         if len(title) > 50:  # Lower threshold to catch more cases
-            import re
-            # Look for pattern like "Event Name October 24, 1:30 pm Description"
-            # Try multiple patterns to extract just the event name
-            patterns = [
-                r'^([^0-9]+?)\s+\w+\s+\d+,\s+\d+:\d+\s+[ap]m',  # "Event Name October 24, 1:30 pm"
-                r'^([^0-9]+?)\s+\w+\s+\d+',  # "Event Name October 24"
-                r'^([^0-9]+?)\s+\d+:\d+\s+[ap]m',  # "Event Name 1:30 pm"
-                r'^([^0-9]+?)\s+\d+',  # "Event Name 24"
-            ]
-            
-            for pattern in patterns:
-                match = re.match(pattern, title)
-                if match:
-                    clean_title = match.group(1).strip()
-                    # Remove trailing punctuation and extra spaces
-                    clean_title = re.sub(r'[,\s]+$', '', clean_title)
-                    if len(clean_title) > 3:  # Make sure we have a meaningful title
-                        event['title'] = clean_title
-                        print(f"🧹 Cleaned title: '{title[:50]}...' -> '{clean_title}'")
-                        break
+            clean_title = _clean_event_title(title)
+            if clean_title != title:
+                event['title'] = clean_title
+                logger.debug("🧹 Cleaned title: '%s...' -> '%s'", title[:50], clean_title)
     
     return {
         "events": all_events,
@@ -4225,7 +4107,7 @@ def get_events(request: Request):
 @app.post("/api/events")
 def create_event(event_data: dict):
     """Create a new event"""
-    print(f"🌐 Create event API call received: {event_data}")
+    logger.debug("🌐 Create event API call received: %s", event_data)
     
     try:
         # Generate unique ID
@@ -4246,30 +4128,44 @@ def create_event(event_data: dict):
         # Store in editable events
         editable_events[event_id] = event
         
-        print(f"✅ Event created with ID: {event_id}")
+        logger.info("✅ Event created with ID: %s", event_id)
         return {"success": True, "event": event, "message": "Event created successfully"}
         
     except Exception as e:
-        print(f"❌ Error creating event: {e}")
+        logger.error("❌ Error creating event: %s", e)
         return {"success": False, "error": str(e)}
 
+def _normalize_iso(value):
+    """Comparison key for an ISO timestamp: UTC isoformat() + 'Z' if it carries 'Z' or an offset, else the value unchanged"""
+    if not value or not isinstance(value, str):
+        return value
+    try:
+        parsed = datetime.fromisoformat(value[:-1] + '+00:00' if value.endswith('Z') else value)
+    except ValueError:
+        return value
+    if parsed.tzinfo is None:
+        return value
+    return parsed.astimezone(utc).replace(tzinfo=None).isoformat() + 'Z'
+
 @app.put("/api/events/{event_id}")
 def update_event(event_id: str, event_data: dict):
     """Update an existing event"""
-    print(f"🌐 Update event API call received for ID {event_id}: {event_data}")
+    logger.debug("🌐 Update event API call received for ID %s: %s", event_id, event_data)
     
     try:
         updated = False
         
         # Check editable_events first
-        if event_id in editable_events:
-            editable_events[event_id].update({
-                'title': event_data.get('title', editable_events[event_id]['title']),
-                'startDate': event_data.get('startDate', editable_events[event_id]['startDate']),
-                'endDate': event_data.get('endDate', editable_events[event_id]['endDate']),
-                'description': event_data.get('description', editable_events[event_id]['description']),
-                'location': event_data.get('location', editable_events[event_id]['location'])
+        existing = editable_events.get(event_id)
+        if existing is not None:
+            existing.update({
+                'title': event_data.get('title', existing['title']),
+                'startDate': event_data.get('startDate', existing['startDate']),
+                'endDate': event_data.get('endDate', existing['endDate']),
+                'description': event_data.get('description', existing['description']),
+                'location': event_data.get('location', existing['location'])
             })
+            editable_events[event_id] = existing
             updated = True
         
         # Check stored_events (by matching title and startDate if event_id is index-based)
@@ -4287,19 +4183,18 @@ def update_event(event_id: str, event_data: dict):
         if not updated:
             return {"success": False, "error": "Event not found"}
         
-        print(f"✅ Event updated with ID: {event_id}")
+        logger.info("✅ Event updated with ID: %s", event_id)
         return {"success": True, "message": "Event updated successfully"}
         
     except Exception as e:
-        print(f"❌ Error updating event: {e}")
-        import traceback
+        logger.error("❌ Error updating event: %s", e)
         traceback.print_exc()
         return {"success": False, "error": str(e)}
 
 @app.delete("/api/events/{event_id}")
 def delete_event(event_id: str):
     """Delete an event"""
-    print(f"🌐 Delete event API call received for ID {event_id}")
+    logger.debug("🌐 Delete event API call received for ID %s", event_id)
     
     try:
         deleted = False
@@ -4323,12 +4218,11 @@ def delete_event(event_id: str):
         if not deleted:
             return {"success": False, "error": "Event not found"}
         
-        print(f"✅ Event deleted with ID: {event_id}")
+        logger.info("✅ Event deleted with ID: %s", event_id)
         return {"success": True, "message": "Event deleted successfully"}
         
     except Exception as e:
-        print(f"❌ Error deleting event: {e}")
-        import traceback
+        logger.error("❌ Error deleting event: %s", e)
         traceback.print_exc()
         return {"success": False, "error": str(e)}
 
@@ -4348,7 +4242,7 @@ async def bulk_update_events(request: Request):
                 "total_count": len(stored_events)
             }
         
-        print(f"🔄 Bulk update received: {len(events)} events to REPLACE all existing events")
+        logger.debug("🔄 Bulk update received: %s events to REPLACE all existing events", len(events))
         
         # Replace all stored events with the new list
         old_count = len(stored_events)
@@ -4363,12 +4257,12 @@ async def bulk_update_events(request: Request):
             save_successful = True
         except Exception as e:
             save_error = str(e)
-            print(f"❌ ERROR: Save failed: {save_error}")
+            logger.error("❌ ERROR: Save failed: %s", save_error)
             save_successful = False
             # Don't return here - we still updated in memory, but file save failed
         
-        print(f"✅ Successfully replaced {old_count} old events with {len(events)} new events")
-        print(f"📊 Total events now: {len(stored_events)}")
+        logger.info("✅ Successfully replaced %s old events with %s new events", old_count, len(events))
+        logger.info("📊 Total events now: %s", len(stored_events))
         
         if not save_successful:
             return {
@@ -4390,8 +4284,7 @@ async def bulk_update_events(request: Request):
         }
         
     except Exception as e:
-        print(f"❌ Error in bulk update: {e}")
-        import traceback
+        logger.error("❌ Error in bulk update: %s", e)
         traceback.print_exc()
         return {"success": False, "error": str(e)}
 
@@ -4406,42 +4299,58 @@ async def upload_excel(request: Request):
         if not file:
             return {"success": False, "error": "No file uploaded"}
         
-        # Read the file content
-        content = await file.read()
         filename = file.filename
         
-        print(f"📊 Excel file uploaded: {filename} ({len(content)} bytes)")
-        
-        # Save the file temporarily
-        import os
-        temp_path = f"temp_{filename}"
-        with open(temp_path, "wb") as f:
-            f.write(content)
+        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(filename)[1])
+        temp_path = temp_file.name
         
         # Process the Excel file
         try:
+            # Stream the upload to the temporary file rather than reading it into memory
+            with temp_file:
+                shutil.copyfileobj(file.file, temp_file, 64 * 1024)
+            
+            logger.info("📊 Excel file uploaded: %s (%s bytes)", filename, os.path.getsize(temp_path))
+            
             # Check file extension first
             file_ext = filename.lower().split('.')[-1] if '.' in filename else ''
             
-            print(f"📊 Processing file: {filename} (extension: {file_ext})")
+            logger.debug("📊 Processing file: %s (extension: %s)", filename, file_ext)
             
             # For now, use CSV processing for all files since pandas/openpyxl may not be available
-            print("📊 Using CSV processing for all file types...")
+            logger.debug("📊 Using CSV processing for all file types...")
             return process_csv_fallback(temp_path, filename)
                     
         except Exception as excel_error:
-            # Clean up temp file
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
             return {
                 "success": False,
                 "error": f"Excel processing error: {str(excel_error)}"
             }
+        finally:
+            # Clean up temp file on every path, including unsupported file types
+            try:
+                os.remove(temp_path)
+            except FileNotFoundError:
+                pass
         
     except Exception as e:
-        print(f"❌ Error uploading Excel: {e}")
+        logger.error("❌ Error uploading Excel: %s", e)
         return {"success": False, "error": str(e)}
 
+# Event field -> (accepted CSV headers, value used when the column is missing)
+CSV_EVENT_COLUMNS = (
+    ('title', ('title', 'Title'), None),
+    ('startDate', ('startDate', 'Start Date'), '2025-01-01T10:00:00Z'),
+    ('endDate', ('endDate', 'End Date'), '2025-01-01T11:00:00Z'),
+    ('description', ('description', 'Description'), ''),
+    ('location', ('location', 'Location'), ''),
+    ('dateStr', ('dateStr', 'Date String'), ''),
+    ('timeStr', ('timeStr', 'Time String'), ''),
+    ('price', ('price', 'Price'), ''),
+    ('instructor', ('instructor', 'Instructor'), ''),
+    ('registration', ('registration', 'Registration'), ''),
+)
+
 def process_csv_fallback(temp_path, filename):
     """Process CSV file as fallback"""
     try:
@@ -4469,32 +4378,32 @@ def process_csv_fallback(temp_path, filename):
             elif ';' in sample:
                 delimiter = ';'
             
-            reader = csv.DictReader(file, delimiter=delimiter)
+            reader = csv.reader(file, delimiter=delimiter)
+            header = next(reader, [])
+            
+            # Resolve each field's column index once from the header row
+            columns = []
+            for field, names, default in CSV_EVENT_COLUMNS:
+                index = next((header.index(name) for name in names if name in header), None)
+                columns.append((field, index, default))
             
             for row in reader:
-                event = {
-                    "title": str(row.get('title', row.get('Title', f'Event {len(events) + 1}'))),
-                    "startDate": str(row.get('startDate', row.get('Start Date', '2025-01-01T10:00:00Z'))),
-                    "endDate": str(row.get('endDate', row.get('End Date', '2025-01-01T11:00:00Z'))),
-                    "description": str(row.get('description', row.get('Description', ''))),
-                    "location": str(row.get('location', row.get('Location', ''))),
-                    "dateStr": str(row.get('dateStr', row.get('Date String', ''))),
-                    "timeStr": str(row.get('timeStr', row.get('Time String', ''))),
-                    "price": str(row.get('price', row.get('Price', ''))),
-                    "instructor": str(row.get('instructor', row.get('Instructor', ''))),
-                    "registration": str(row.get('registration', row.get('Registration', ''))),
-                    "image_url": "/event-schedule-banner.png"
-                }
+                if not row:
+                    continue
+                event = {}
+                for field, index, default in columns:
+                    if index is not None and index < len(row):
+                        event[field] = row[index]
+                    else:
+                        event[field] = f'Event {len(events) + 1}' if default is None else default
+                event["image_url"] = "/event-schedule-banner.png"
                 events.append(event)
         
         # Merge with existing events instead of replacing
         global stored_events
         
         # Create a set to track existing events by (title, startDate)
-        existing_events_dict = {}
-        for event in stored_events:
-            key = (event.get('title', ''), event.get('startDate', ''))
-            existing_events_dict[key] = event
+        existing_keys = {(event.get('title', ''), _normalize_iso(event.get('startDate', ''))) for event in stored_events}
         
         # Track counts
         added_count = 0
@@ -4502,23 +4411,20 @@ def process_csv_fallback(temp_path, filename):
         
         # Add only new events (no duplicates)
         for new_event in events:
-            key = (new_event.get('title', ''), new_event.get('startDate', ''))
-            if key not in existing_events_dict:
+            key = (new_event.get('title', ''), _normalize_iso(new_event.get('startDate', '')))
+            if key not in existing_keys:
                 stored_events.append(new_event)
-                existing_events_dict[key] = new_event
+                existing_keys.add(key)
                 added_count += 1
             else:
                 skipped_count += 1
         
-        print(f"✅ Merged {added_count} new events from Excel (skipped {skipped_count} duplicates)")
-        print(f"📊 Total events now: {len(stored_events)}")
+        logger.info("✅ Merged %s new events from Excel (skipped %s duplicates)", added_count, skipped_count)
+        logger.info("📊 Total events now: %s", len(stored_events))
         
         # Save to persistent storage
         save_stored_events()
         
-        # Clean up temp file
-        os.remove(temp_path)
-        
         return {
             "success": True,
             "message": f"CSV file '{filename}' processed successfully! Loaded {len(events)} events.",
@@ -4526,9 +4432,6 @@ def process_csv_fallback(temp_path, filename):
         }
         
     except Exception as csv_error:
-        # Clean up temp file
-        if os.path.exists(temp_path):
-            os.remove(temp_path)
         return {
             "success": False,
             "error": f"CSV processing error: {str(csv_error)}"
@@ -4537,7 +4440,7 @@ def process_csv_fallback(temp_path, filename):
 @app.get("/api/october-events")
 def get_october_events():
     """Get known October events manually"""
-    print("📅 Getting October events...")
+    logger.debug("📅 Getting October events...")
     
     october_events = [
         {
@@ -4598,7 +4501,7 @@ async def update_event_banner(event_title: str, request: Request):
                 if event_date is None or event.get('startDate') == event_date:
                     event['image_url'] = new_image_url
                     updated = True
-                    print(f"✅ Updated banner for: {event_title}")
+                    logger.info("✅ Updated banner for: %s", event_title)
         
         if updated:
             save_stored_events()
@@ -4614,8 +4517,7 @@ async def update_event_banner(event_title: str, request: Request):
             }
             
     except Exception as e:
-        print(f"❌ Error updating event banner: {e}")
-        import traceback
+        logger.error("❌ Error updating event banner: %s", e)
         traceback.print_exc()
         return {"success": False, "error": str(e)}
 
@@ -4654,7 +4556,7 @@ async def debug_events():
         "warning": "Mismatch between memory and file!" if len(stored_events) != file_events_count else None
     }
     
-    print(f"🔍 DEBUG: {debug_info}")
+    logger.debug("🔍 DEBUG: %s", debug_info)
     return debug_info
 
 @app.post("/api/fallback/save-events")
@@ -4681,8 +4583,7 @@ async def save_events_as_fallback():
         # Save to fallback file
         fallback_file = "/tmp/events_fallback_data.json" if os.getenv('RENDER') else "events_fallback_data.json"
         
-        with open(fallback_file, 'w', encoding='utf-8') as f:
-            json.dump(fallback_data, f, indent=2, ensure_ascii=False)
+        _write_fallback_json(fallback_file, fallback_data)
         
         print(f"✅ Saved {len(stored_events)} events as fallback data")
         
@@ -4723,8 +4624,7 @@ async def save_excel_as_fallback():
         # Save to fallback file
         fallback_file = "/tmp/excel_fallback_data.json" if os.getenv('RENDER') else "excel_fallback_data.json"
         
-        with open(fallback_file, 'w', encoding='utf-8') as f:
-            json.dump(fallback_data, f, indent=2, ensure_ascii=False)
+        _write_fallback_json(fallback_file, fallback_data)
         
         print(f"✅ Saved {len(programs)} programs as fallback data")
         
@@ -4776,8 +4676,7 @@ async def get_fallback_status():
         events_fallback_file = "/tmp/events_fallback_data.json" if os.getenv('RENDER') else "events_fallback_data.json"
         if os.path.exists(events_fallback_file):
             try:
-                with open(events_fallback_file, 'r', encoding='utf-8') as f:
-                    events_data = json.load(f)
+                events_data = _load_fallback_json(events_fallback_file)
                 status["events_fallback"]["file_exists"] = True
                 status["events_fallback"]["total_events"] = events_data.get("metadata", {}).get("total_events", 0)
                 status["events_fallback"]["last_updated"] = events_data.get("metadata", {}).get("last_updated", "Unknown")
@@ -4788,8 +4687,7 @@ async def get_fallback_status():
         excel_fallback_file = "/tmp/excel_fallback_data.json" if os.getenv('RENDER') else "excel_fallback_data.json"
         if os.path.exists(excel_fallback_file):
             try:
-                with open(excel_fallback_file, 'r', encoding='utf-8') as f:
-                    excel_data = json.load(f)
+                excel_data = _load_fallback_json(excel_fallback_file)
                 status["excel_fallback"]["file_exists"] = True
                 status["excel_fallback"]["total_programs"] = excel_data.get("metadata", {}).get("total_programs", 0)
                 status["excel_fallback"]["last_updated"] = excel_data.get("metadata", {}).get("last_updated", "Unknown")
@@ -5136,6 +5034,7 @@ async def upload_excel_file_to_gcs(file: UploadFile = File(...)):
             # Also process and save as JSON
             try:
                 # Read Excel content
+                import pandas as pd
                 excel_io = io.BytesIO(file_content)
                 df = pd.read_excel(excel_io)
                 
@@ -5298,7 +5197,6 @@ async def restore_excel_from_fallback():
         
     except Exception as e:
         print(f"❌ Error restoring from fallback: {e}")
-        import traceback
         traceback.print_exc()
         return {"success": False, "error": str(e)}
 
@@ -5400,6 +5298,13 @@ async def scrape_and_save_file_locally():
             "message": f"An error occurred while scraping: {e}. Make sure you're running the backend locally and have Chrome installed."
         }
 
+def _unique_events(events):
+    """Events with repeated (title, startDate) pairs dropped, keeping the first of each in order"""
+    unique = {}
+    for event in events:
+        unique.setdefault((event.get('title', ''), event.get('startDate', '')), event)
+    return list(unique.values())
+
 @app.post("/api/events/import")
 async def import_events(file: UploadFile = File(...)):
     """Import events from JSON file"""
@@ -5416,13 +5321,7 @@ async def import_events(file: UploadFile = File(...)):
         new_events = data['events']
         
         # Remove duplicates based on title + startDate
-        unique_events = []
-        seen_keys = set()
-        for event in new_events:
-            key = (event.get('title', ''), event.get('startDate', ''))
-            if key not in seen_keys:
-                unique_events.append(event)
-                seen_keys.add(key)
+        unique_events = _unique_events(new_events)
         
         # Replace stored events
         stored_events = unique_events
@@ -5458,13 +5357,7 @@ async def remove_duplicates_endpoint():
     original_count = len(stored_events)
     
     # Remove duplicates
-    unique_events = []
-    seen_keys = set()
-    for event in stored_events:
-        key = (event.get('title', ''), event.get('startDate', ''))
-        if key not in seen_keys:
-            unique_events.append(event)
-            seen_keys.add(key)
+    unique_events = _unique_events(stored_events)
     
     duplicates_removed = original_count - len(unique_events)
     stored_events = unique_events
@@ -5643,7 +5536,6 @@ async def scrape_events_endpoint(request: Request, replace: bool = Query(False))
             
     except Exception as e:
         print(f"❌ Error in manual scraping: {e}")
-        import traceback
         traceback.print_exc()
         return {
             "success": False,
@@ -6834,8 +6726,8 @@ def debug_scraping():
     """Debug endpoint to see what the scraper finds"""
     print("🔍 Debug scraping...")
     try:
-        import requests
-        from bs4 import BeautifulSoup
+        if BeautifulSoup is None:
+            raise ImportError("beautifulsoup4 is not installed")
         
         url = "https://www.seniorskingston.ca/events"
         headers = {
@@ -6844,7 +6736,7 @@ def debug_scraping():
         
         response = requests.get(url, headers=headers, timeout=15)
         if response.status_code == 200:
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, HTML_PARSER)
             
             # Look for h5.green elements specifically
             h5_green_elements = soup.select('h5.green')
@@ -7119,8 +7011,7 @@ async def import_excel(file: UploadFile = File(...)):
                     }
                     
                     fallback_file = "/tmp/excel_fallback_data.json" if os.getenv('RENDER') else "excel_fallback_data.json"
-                    with open(fallback_file, 'w', encoding='utf-8') as f:
-                        json.dump(fallback_data, f, indent=2, ensure_ascii=False)
+                    _write_fallback_json(fallback_file, fallback_data)
                     
                     print(f"✅ Auto-saved {len(programs)} programs to fallback file")
                 else:
@@ -7136,7 +7027,6 @@ async def import_excel(file: UploadFile = File(...)):
             
     except Exception as e:
         print(f"❌ Upload error: {e}")
-        import traceback
         traceback.print_exc()
         return {"message": f"Upload failed: {str(e)}", "status": "error"}
 
@@ -7163,6 +7053,7 @@ def export_excel(
     )
     
     # Convert to DataFrame
+    import pandas as pd
     df = pd.DataFrame(programs)
     
     # Create Excel file in memory
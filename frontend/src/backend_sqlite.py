@@ -38,7 +38,6 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=[
         "https://class-cancellation-frontend.onrender.com",
-        "https://class-cancellation-frontend.onrender.com/",
         "http://localhost:3000",  # For local development
         "https://localhost:3000"   # For local development
     ],